@@ -1,6 +1,7 @@
+from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseSettings, Field
 
@@ -8,6 +9,12 @@ from pydantic import BaseSettings, Field
 class Settings(BaseSettings):
     app_name: str = "Gold Signal Service"
     database_url: str = Field(default="sqlite:///" + str(Path(__file__).resolve().parents[1] / "signals.db"))
+    database_profile: str = "production"
+    database_pool_size: int = 8
+    database_max_overflow: int = 8
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_cache_kib: int = 64 * 1024
     live_mode: bool = False
     mt5_login: Optional[str] = None
     mt5_password: Optional[str] = None
@@ -15,6 +22,27 @@ class Settings(BaseSettings):
     default_starting_balance: float = 10_000.0
     data_source: str = "yfinance"
     candles_interval: str = "1h"
+    candle_dtype: str = "float64"
+    candles_history_days: int = 730
+    replay_data_dir: str = str(Path(__file__).resolve().parents[2] / "data")
+    replay_start: Optional[datetime] = None
+    replay_speed: float = 1.0
+    scheduler_enabled: bool = True
+    scheduled_symbols: List[str] = ["XAUUSD"]
+    scheduler_max_concurrency: int = 4
+    batch_max_symbols: int = 100
+    batch_max_workers: int = 8
+    signal_push_queue_size: int = 32
+    stream_symbols: List[str] = []
+    gzip_minimum_size: int = 1024
+    # Opt-in: raw snapshots older than retention_raw_days are deleted and only
+    # kept as signal_rollups, which no API endpoint serves yet.
+    retention_enabled: bool = False
+    retention_raw_days: float = 7.0
+    retention_rollup_interval: str = "1h"
+    retention_batch_size: int = 2000
+    retention_vacuum_pages: int = 10_000
+    retention_every_minutes: float = 60.0
 
     class Config:
         env_file = ".env"
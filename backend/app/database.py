@@ -1,22 +1,174 @@
+import threading
+import time
 from contextlib import contextmanager
-from typing import Iterator
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
-from .config import get_settings
+from .config import Settings, get_settings
+from .metrics import histogram, time_stage
 
-settings = get_settings()
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False} if settings.database_url.startswith("sqlite") else {},
+DB_WRITER_WAIT_SECONDS = histogram(
+    "db_writer_wait_seconds",
+    "Time a write transaction waited for the serialized writer.",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-@contextmanager
+@dataclass(frozen=True)
+class StorageProfile:
+    """Connection pragmas, pool sizing and write policy for a SQLite database.
+
+    ``default`` is the stock engine the app used to create. ``production`` creates
+    new database files in incremental auto-vacuum mode (an existing file keeps its
+    mode until converted, see :mod:`app.services.retention`), turns on WAL so
+    readers never block on the writer, relaxes fsync to ``synchronous=NORMAL``
+    (durable across application crashes; a power loss can drop the last commits),
+    maps the file into memory, enlarges the page cache, waits ``busy_timeout_ms``
+    on a locked database instead of failing, and keeps a pool of warm connections.
+    """
+
+    name: str
+    pragmas: Dict[str, Any] = field(default_factory=dict)
+    busy_timeout_ms: int = 5000
+    pool_size: int = 5
+    max_overflow: int = 10
+    serialize_writes: bool = False
+
+
+def storage_profile(settings: Settings) -> StorageProfile:
+    if settings.database_profile == "default":
+        return StorageProfile(name="default")
+    if settings.database_profile != "production":
+        raise ValueError(f"Unknown database profile '{settings.database_profile}'. Known profiles: default, production")
+    return StorageProfile(
+        name="production",
+        pragmas={
+            # Must precede journal_mode: it only applies before the first table exists.
+            "auto_vacuum": "INCREMENTAL",
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "mmap_size": settings.sqlite_mmap_size,
+            "cache_size": -settings.sqlite_cache_kib,
+            "temp_store": "MEMORY",
+            "foreign_keys": "ON",
+        },
+        busy_timeout_ms=settings.sqlite_busy_timeout_ms,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        serialize_writes=True,
+    )
+
+
+def create_db_engine(url: str, profile: StorageProfile) -> Engine:
+    if not url.startswith("sqlite"):
+        return create_engine(url, pool_pre_ping=True)
+    if profile.name == "default":
+        return create_engine(url, connect_args={"check_same_thread": False})
+
+    engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False, "timeout": profile.busy_timeout_ms / 1000},
+        poolclass=QueuePool,
+        pool_size=profile.pool_size,
+        max_overflow=profile.max_overflow,
+    )
+
+    @event.listens_for(engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"PRAGMA busy_timeout = {int(profile.busy_timeout_ms)}")
+        for name, value in profile.pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+        cursor.close()
+
+    return engine
+
+
+class SerializedWriter:
+    """Process-wide gate so only one write transaction runs at a time.
+
+    SQLite allows one writer per database; queueing writers on a lock in the app
+    avoids busy-wait retries and "database is locked" errors, while readers keep
+    running concurrently under WAL. Disabled writers are a no-op.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        with self._lock:
+            DB_WRITER_WAIT_SECONDS.observe(time.perf_counter() - started)
+            yield
+
+    def commit(self, db: Session) -> None:
+        """Flush and commit ``db``'s pending writes through the writer."""
+
+        with self.transaction(), time_stage("db_commit"):
+            db.commit()
+
+
+@dataclass
+class Database:
+    """Engine, session factory and writer gate for one configured database."""
+
+    profile: StorageProfile
+    engine: Engine
+    session_factory: sessionmaker
+    writer: SerializedWriter
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "Database":
+        profile = storage_profile(settings)
+        engine = create_db_engine(settings.database_url, profile)
+        return cls(
+            profile=profile,
+            engine=engine,
+            session_factory=sessionmaker(autocommit=False, autoflush=False, bind=engine),
+            writer=SerializedWriter(enabled=profile.serialize_writes),
+        )
+
+
+# Built on first use rather than at import, so importing the app (CLI tools,
+# worker processes, tests that override settings) does not open the database.
+_database: Optional[Database] = None
+_database_lock = threading.Lock()
+
+
+def get_database() -> Database:
+    global _database
+    if _database is None:
+        with _database_lock:
+            if _database is None:
+                _database = Database.from_settings(get_settings())
+    return _database
+
+
+def set_database(database: Optional[Database]) -> None:
+    global _database
+    _database = database
+
+
+def new_session() -> Session:
+    return get_database().session_factory()
+
+
+def commit(db: Session) -> None:
+    get_database().writer.commit(db)
+
+
 def get_db() -> Iterator[Session]:
-    db = SessionLocal()
+    db = new_session()
     try:
         yield db
     finally:
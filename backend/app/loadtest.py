@@ -0,0 +1,262 @@
+"""In-process HTTP load test for the signal service.
+
+Run from the ``backend`` directory::
+
+    python -m app.loadtest --concurrency 16 --requests 500 --output loadtest.json
+
+The app is served through an ASGI transport against a temporary SQLite database
+and the local replay data source fed with synthetic candles, so results do not
+depend on the network or on upstream market data.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+REPLAY_END = datetime(2024, 1, 1)
+
+RequestSpec = Tuple[str, str, Dict[str, Any], Optional[Dict[str, Any]]]
+
+
+def _signals_latest(rng: random.Random, symbol: str) -> RequestSpec:
+    return "GET", "/api/signals/latest", {"symbol": symbol}, None
+
+
+def _signals_history(rng: random.Random, symbol: str) -> RequestSpec:
+    end = REPLAY_END - timedelta(hours=rng.randint(0, 48))
+    params = {"symbol": symbol, "from": (end - timedelta(days=7)).isoformat(), "to": end.isoformat()}
+    return "GET", "/api/signals/history", params, None
+
+
+def _simulation_run(rng: random.Random, symbol: str) -> RequestSpec:
+    end = REPLAY_END - timedelta(hours=rng.randint(0, 48))
+    payload = {
+        "strategy_id": 1,
+        "symbol": symbol,
+        "start_date": (end - timedelta(days=14)).isoformat(),
+        "end_date": end.isoformat(),
+    }
+    return "POST", "/api/simulations/run", {}, payload
+
+
+ROUTES: Dict[str, Callable[[random.Random, str], RequestSpec]] = {
+    "signals_latest": _signals_latest,
+    "signals_history": _signals_history,
+    "simulation_run": _simulation_run,
+}
+DEFAULT_MIX = {"signals_latest": 8, "signals_history": 1, "simulation_run": 1}
+
+
+@dataclass
+class LoadTestConfig:
+    concurrency: int = 8
+    requests: int = 200
+    mix: Dict[str, int] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    symbols: List[str] = field(default_factory=lambda: ["XAUUSD", "XAGUSD", "EURUSD"])
+    bars: int = 24 * 120
+    seed: int = 7
+
+
+def write_stub_candles(data_dir: Path, symbols: List[str], bars: int, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(end=REPLAY_END - timedelta(hours=1), periods=bars, freq="h", tz="UTC")
+    for symbol in symbols:
+        close = 100 + rng.normal(0, 0.5, bars).cumsum()
+        frame = pd.DataFrame(
+            {
+                "timestamp": index.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "open": close,
+                "high": close + 0.25,
+                "low": close - 0.25,
+                "close": close,
+                "volume": 1_000,
+            }
+        )
+        frame.to_csv(data_dir / f"{symbol}.csv", index=False)
+
+
+def configure_environment(workdir: Path, config: LoadTestConfig) -> None:
+    data_dir = workdir / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    write_stub_candles(data_dir, config.symbols, config.bars, config.seed)
+    os.environ.update(
+        {
+            "DATABASE_URL": "sqlite:///" + str(workdir / "loadtest.db"),
+            "DATA_SOURCE": "replay",
+            "REPLAY_DATA_DIR": str(data_dir),
+            "REPLAY_START": REPLAY_END.isoformat(),
+            "REPLAY_SPEED": "1",
+            "SCHEDULER_ENABLED": "false",
+            "RETENTION_ENABLED": "false",
+        }
+    )
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(int(np.ceil(pct / 100 * len(sorted_values))) - 1, 0)
+    return sorted_values[rank]
+
+
+def summarise(latencies: List[float], errors: int, elapsed: float) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "throughput_rps": len(ordered) / elapsed if elapsed > 0 else 0.0,
+        "mean_ms": float(np.mean(ordered) * 1000) if ordered else 0.0,
+        "p50_ms": percentile(ordered, 50) * 1000,
+        "p95_ms": percentile(ordered, 95) * 1000,
+        "p99_ms": percentile(ordered, 99) * 1000,
+        "max_ms": (ordered[-1] * 1000) if ordered else 0.0,
+    }
+
+
+async def _drive(app, config: LoadTestConfig) -> Dict[str, Any]:
+    import httpx
+
+    rng = random.Random(config.seed)
+    names = list(config.mix)
+    weights = [config.mix[name] for name in names]
+    plan = [(rng.choices(names, weights)[0], rng.choice(config.symbols)) for _ in range(config.requests)]
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in plan:
+        queue.put_nowait(item)
+
+    samples: Dict[str, List[float]] = {name: [] for name in names}
+    errors: Dict[str, int] = {name: 0 for name in names}
+    statuses: Dict[str, Dict[str, int]] = {name: {} for name in names}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=None) as client:
+
+        async def worker() -> None:
+            while True:
+                try:
+                    route, symbol = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                method, path, params, payload = ROUTES[route](rng, symbol)
+                started = time.perf_counter()
+                try:
+                    response = await client.request(method, path, params=params, json=payload)
+                    status = str(response.status_code)
+                except Exception as exc:
+                    status = type(exc).__name__
+                samples[route].append(time.perf_counter() - started)
+                statuses[route][status] = statuses[route].get(status, 0) + 1
+                if not status.startswith("2"):
+                    errors[route] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(config.concurrency)))
+        elapsed = time.perf_counter() - started
+
+    routes = {name: {**summarise(samples[name], errors[name], elapsed), "statuses": statuses[name]} for name in names}
+    everything = [latency for values in samples.values() for latency in values]
+    return {
+        "overall": summarise(everything, sum(errors.values()), elapsed),
+        "routes": routes,
+        "elapsed_seconds": elapsed,
+    }
+
+
+async def run_load_test(config: LoadTestConfig) -> Dict[str, Any]:
+    from .main import app
+
+    await app.router.startup()
+    try:
+        results = await _drive(app, config)
+    finally:
+        await app.router.shutdown()
+    return {
+        "config": asdict(config),
+        "started_at": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        **results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    deltas: Dict[str, Dict[str, float]] = {}
+    for route, stats in current["routes"].items():
+        previous = baseline.get("routes", {}).get(route)
+        if not previous:
+            continue
+        deltas[route] = {
+            key: stats[key] - previous[key] for key in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms")
+        }
+    return deltas
+
+
+def _parse_mix(value: str) -> Dict[str, int]:
+    mix: Dict[str, int] = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ROUTES:
+            raise argparse.ArgumentTypeError(f"Unknown route '{name}'. Known routes: {', '.join(ROUTES)}")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load test the signal service in-process")
+    parser.add_argument("--concurrency", type=int, default=8, help="Number of concurrent clients")
+    parser.add_argument("--requests", type=int, default=200, help="Total number of requests to send")
+    parser.add_argument(
+        "--mix",
+        type=_parse_mix,
+        default=dict(DEFAULT_MIX),
+        help="Weighted endpoint mix, e.g. 'signals_latest=8,signals_history=1,simulation_run=1'",
+    )
+    parser.add_argument("--symbols", default="XAUUSD,XAGUSD,EURUSD", help="Comma-separated stub symbols")
+    parser.add_argument("--bars", type=int, default=24 * 120, help="Synthetic hourly bars per symbol")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for data and request order")
+    parser.add_argument("--output", type=Path, default=None, help="Write the JSON report to this path")
+    parser.add_argument("--baseline", type=Path, default=None, help="Previous JSON report to compare against")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    args = parse_args(argv)
+    config = LoadTestConfig(
+        concurrency=args.concurrency,
+        requests=args.requests,
+        mix=args.mix,
+        symbols=[symbol.strip() for symbol in args.symbols.split(",") if symbol.strip()],
+        bars=args.bars,
+        seed=args.seed,
+    )
+    with tempfile.TemporaryDirectory(prefix="loadtest-") as workdir:
+        configure_environment(Path(workdir), config)
+        report = asyncio.run(run_load_test(config))
+
+    if args.baseline:
+        report["delta_vs_baseline"] = compare(report, json.loads(args.baseline.read_text()))
+
+    print(f"{'route':<18}{'reqs':>6}{'errs':>6}{'rps':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, stats in [*report["routes"].items(), ("overall", report["overall"])]:
+        print(
+            f"{name:<18}{stats['requests']:>6}{stats['errors']:>6}{stats['throughput_rps']:>9.1f}"
+            f"{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}"
+        )
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, sort_keys=True))
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,22 @@
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
+from . import metrics
 from .config import get_settings
-from .database import SessionLocal, engine
+from .database import commit, get_database, new_session
 from .models import Base, Strategy
-from .routers import signals, simulations, strategies
+from .routers import candles, signals, simulations, strategies
+from .services.clock import ReplayClock, set_clock
+from .services.market_data import fetch_candles, get_data_source
+from .services.replay import ReplaySource
+from .services.retention import RetentionJob, get_retention_job, set_retention_job
+from .services.scheduler import SignalScheduler, get_scheduler, set_scheduler
+from .services.signal_hub import get_signal_hub
+from .services.strategy_registry import get_strategy_registry
 
 settings = get_settings()
 
@@ -19,16 +29,54 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=settings.gzip_minimum_size)
 
+metrics.register_lru_cache("settings", get_settings)
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    in_flight = metrics.HTTP_REQUESTS_IN_FLIGHT.labels(request.method)
+    in_flight.inc()
+    start = time.perf_counter()
+    status = "500"
+    try:
+        response = await call_next(request)
+        status = str(response.status_code)
+        return response
+    finally:
+        in_flight.dec()
+        matched = request.scope.get("route")
+        route = getattr(matched, "path_format", "unmatched")
+        metrics.HTTP_REQUEST_SECONDS.labels(request.method, route, status).observe(time.perf_counter() - start)
+
+
+app.include_router(candles.router)
 app.include_router(signals.router)
 app.include_router(simulations.router)
 app.include_router(strategies.router)
 
 
+def _configure_replay_clock() -> None:
+    source = get_data_source()
+    if not isinstance(source, ReplaySource):
+        return
+    start = settings.replay_start
+    if start is None and settings.scheduled_symbols:
+        try:
+            start = source.first_timestamp(settings.scheduled_symbols[0])
+        except ValueError:
+            start = None
+    if start is not None:
+        set_clock(ReplayClock(start=start, speed=settings.replay_speed))
+
+
 @app.on_event("startup")
 def on_startup() -> None:
-    Base.metadata.create_all(bind=engine)
-    with SessionLocal() as db:
+    database = get_database()
+    Base.metadata.create_all(bind=database.engine)
+    _configure_replay_clock()
+    with new_session() as db:
         if not db.query(Strategy).filter(Strategy.name == "gold_sma_rsi_v1").first():
             default_strategy = Strategy(
                 name="gold_sma_rsi_v1",
@@ -43,9 +91,53 @@ def on_startup() -> None:
                 },
             )
             db.add(default_strategy)
-            db.commit()
+            commit(db)
+            get_strategy_registry().invalidate()
+
+        if settings.scheduler_enabled and settings.scheduled_symbols:
+            scheduler = SignalScheduler(
+                fetcher=fetch_candles,
+                interval=settings.candles_interval,
+                persist=signals.persist_snapshots,
+                publish=get_signal_hub().publish,
+                max_concurrency=settings.scheduler_max_concurrency,
+            )
+            for strategy in get_strategy_registry().all(db):
+                for symbol in settings.scheduled_symbols:
+                    scheduler.track(symbol, strategy.id, strategy.params)
+            set_scheduler(scheduler)
+            scheduler.start()
+
+    if settings.retention_enabled:
+        retention = RetentionJob(
+            new_session,
+            raw_max_age=timedelta(days=settings.retention_raw_days),
+            rollup_interval=settings.retention_rollup_interval,
+            batch_size=settings.retention_batch_size,
+            vacuum_pages=settings.retention_vacuum_pages,
+            writer=database.writer,
+        )
+        set_retention_job(retention)
+        retention.start(timedelta(minutes=settings.retention_every_minutes))
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    scheduler = get_scheduler()
+    if scheduler is not None:
+        await scheduler.stop()
+        set_scheduler(None)
+    retention = get_retention_job()
+    if retention is not None:
+        await retention.stop()
+        set_retention_job(None)
 
 
 @app.get("/health")
 def health_check():
     return {"status": "ok", "timestamp": datetime.utcnow(), "live_mode": settings.live_mode}
+
+
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics() -> Response:
+    return Response(content=metrics.render_latest(), media_type=metrics.CONTENT_TYPE_LATEST)
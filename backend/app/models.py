@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Any, Dict
 
-from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -36,7 +36,7 @@ class Simulation(Base):
     total_trades = Column(Integer, nullable=False)
     profitable_trades = Column(Integer, nullable=False)
     equity_curve = Column(JSON, nullable=False)
-    metadata = Column(JSON, nullable=False, default=dict)
+    metadata_ = Column("metadata", JSON, nullable=False, default=dict)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     strategy = relationship("Strategy", back_populates="simulations")
@@ -54,3 +54,30 @@ class SignalSnapshot(Base):
     price = Column(Float, nullable=False)
 
     strategy = relationship("Strategy")
+
+
+class SignalRollup(Base):
+    """Per-bucket aggregate of signal snapshots that have aged out of the raw table."""
+
+    __tablename__ = "signal_rollups"
+    __table_args__ = (UniqueConstraint("strategy_id", "symbol", "resolution", "bucket"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    strategy_id = Column(Integer, ForeignKey("strategies.id"), nullable=False)
+    symbol = Column(String(50), nullable=False)
+    resolution = Column(String(10), nullable=False)
+    bucket = Column(DateTime, nullable=False, index=True)
+    samples = Column(Integer, nullable=False)
+    buy_count = Column(Integer, nullable=False, default=0)
+    sell_count = Column(Integer, nullable=False, default=0)
+    hold_count = Column(Integer, nullable=False, default=0)
+    first_at = Column(DateTime, nullable=False)
+    last_at = Column(DateTime, nullable=False)
+    open_price = Column(Float, nullable=False)
+    high_price = Column(Float, nullable=False)
+    low_price = Column(Float, nullable=False)
+    close_price = Column(Float, nullable=False)
+    last_signal = Column(String(10), nullable=False)
+    last_indicators = Column(JSON, nullable=False)
+
+    strategy = relationship("Strategy")
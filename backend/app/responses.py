@@ -0,0 +1,52 @@
+"""Fast JSON responses and columnar layouts for large API payloads.
+
+Row payloads (one dict per bar) repeat every key per row and, behind a
+``response_model``, validate every row through pydantic. The columnar layout
+sends one array per field instead, and :class:`FastJSONResponse` encodes it with
+orjson without any model validation.
+
+:mod:`app.serialization_bench` (``make bench-serialization``) compares payload
+size and encode time.
+"""
+from typing import Any, Dict, Iterable, List, Sequence
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+RESPONSE_FORMATS = ("rows", "columnar")
+FORMAT_PATTERN = "^(" + "|".join(RESPONSE_FORMATS) + ")$"
+
+
+class FastJSONResponse(ORJSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
+def columns(records: Sequence[Dict[str, Any]], fields: Iterable[str]) -> Dict[str, List[Any]]:
+    """Turn ``[{field: value}, ...]`` into ``{field: [value, ...]}`` for the given fields."""
+
+    return {name: [record.get(name) for record in records] for name in fields}
+
+
+def history_columnar(history: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    indicator_names = list(history[0]["indicators"]) if history else []
+    return {
+        "timestamps": [entry["timestamp"] for entry in history],
+        "signals": [entry["signal"] for entry in history],
+        "prices": [entry["price"] for entry in history],
+        "indicators": {name: [entry["indicators"].get(name) for entry in history] for name in indicator_names},
+    }
+
+
+def simulation_columnar(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace the equity curve and trade ledger of a simulation payload with columns."""
+
+    metadata = dict(payload.get("metadata") or {})
+    trades = metadata.get("trades") or []
+    if trades:
+        metadata["trades"] = columns(trades, trades[0].keys())
+    return {
+        **payload,
+        "equity_curve": columns(payload["equity_curve"], ("timestamp", "equity", "drawdown")),
+        "metadata": metadata,
+    }
@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import JSONResponse
+
+from ..metrics import time_stage
+from ..services.candles import PointLimitError, columnar, get_candle_service
+
+router = APIRouter(prefix="/api/candles", tags=["candles"])
+
+
+@router.get("")
+def get_candles(
+    symbol: str = Query("XAUUSD"),
+    resolution: Optional[str] = Query(None, description="1h, 4h, 1d or 1w; chosen from max_points when omitted"),
+    max_points: int = Query(1000, ge=1, le=20_000),
+    start: Optional[datetime] = Query(None, alias="from"),
+    end: Optional[datetime] = Query(None, alias="to"),
+) -> JSONResponse:
+    service = get_candle_service()
+    try:
+        chosen, frame = service.candles(symbol, start, end, resolution, max_points)
+    except PointLimitError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from None
+    except ValueError as exc:
+        status = 422 if resolution is not None and resolution not in service.resolutions() else 404
+        raise HTTPException(status_code=status, detail=str(exc)) from None
+
+    with time_stage("serialization"):
+        return JSONResponse(
+            {
+                "symbol": symbol,
+                "resolution": chosen,
+                "resolutions": service.resolutions(),
+                "count": len(frame),
+                **columnar(frame),
+            }
+        )
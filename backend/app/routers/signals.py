@@ -1,31 +1,65 @@
+import asyncio
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
 
-from ..database import get_db
-from ..models import SignalSnapshot, Strategy
-from ..schemas import SignalIndicators, SignalResponse, StrategyParams
-from ..services.market_data import fetch_candles
-from ..services.strategy import StrategyEngine
+from ..config import get_settings
+from ..database import commit, get_db, new_session
+from ..metrics import time_stage
+from ..models import SignalSnapshot
+from ..responses import FORMAT_PATTERN, FastJSONResponse, history_columnar
+from ..schemas import (
+    BatchSignalItem,
+    BatchSignalResponse,
+    SignalIndicators,
+    SignalResponse,
+    StrategyParams,
+    StrategySignalsResponse,
+)
+from ..services.clock import get_clock
+from ..services.market_data import fetch_candles, fetch_candles_batch
+from ..services.scheduler import PrecomputedSignal, get_scheduler
+from ..services.signal_hub import Channel, SignalHub, Subscriber, get_signal_hub, signal_message
+from ..services.strategy import StrategyResult, evaluate_strategies
+from ..services.strategy_registry import StrategyEntry, get_strategy_registry
 
 router = APIRouter(prefix="/api/signals", tags=["signals"])
+logger = logging.getLogger(__name__)
 
+# Scheduler pairs added because a stream client subscribed; untracked again when
+# their last subscriber leaves.
+_stream_tracked: Set[Channel] = set()
 
-def _get_strategy(db: Session, strategy_id: Optional[int]) -> Strategy:
-    query = db.query(Strategy)
-    if strategy_id is not None:
-        strategy = query.filter(Strategy.id == strategy_id).first()
-        if not strategy:
-            raise HTTPException(status_code=404, detail="Strategy not found")
-        return strategy
-    strategy = query.order_by(Strategy.id.asc()).first()
-    if not strategy:
-        raise HTTPException(status_code=404, detail="No strategies configured")
+
+def _get_strategy(db: Session, strategy_id: Optional[int]) -> StrategyEntry:
+    strategy = get_strategy_registry().get(db, strategy_id)
+    if strategy is None:
+        detail = "No strategies configured" if strategy_id is None else "Strategy not found"
+        raise HTTPException(status_code=404, detail=detail)
     return strategy
 
 
+def persist_snapshots(signals: List[PrecomputedSignal]) -> None:
+    with new_session() as db:
+        db.add_all(
+            SignalSnapshot(
+                strategy_id=item.strategy_id,
+                symbol=item.symbol,
+                timestamp=item.computed_at,
+                signal=item.result.signal,
+                indicators=item.result.indicators,
+                price=item.result.price,
+            )
+            for item in signals
+        )
+        commit(db)
+
+
 @router.get("/latest", response_model=SignalResponse)
 def get_latest_signal(
     symbol: str = Query("XAUUSD"),
@@ -33,34 +67,182 @@ def get_latest_signal(
     db: Session = Depends(get_db),
 ) -> SignalResponse:
     strategy = _get_strategy(db, strategy_id)
-    params = StrategyParams(**strategy.parameters)
 
-    end = datetime.utcnow()
+    scheduler = get_scheduler()
+    precomputed = scheduler.get_latest(symbol, strategy.id) if scheduler else None
+    if precomputed is not None:
+        with time_stage("response_model"):
+            return SignalResponse(
+                symbol=symbol,
+                strategy_id=strategy.id,
+                signal=precomputed.result.signal,
+                price=precomputed.result.price,
+                timestamp=precomputed.computed_at,
+                indicators=SignalIndicators(**precomputed.result.indicators),
+            )
+
+    end = get_clock().now()
     start = end - timedelta(days=30)
 
     candles = fetch_candles(symbol, start, end)
-    engine = StrategyEngine(params)
-    result = engine.compute(candles)
+    result = strategy.engine.compute(candles)
 
     snapshot = SignalSnapshot(
         strategy_id=strategy.id,
         symbol=symbol,
+        timestamp=end,
         signal=result.signal,
         indicators=result.indicators,
         price=result.price,
     )
     db.add(snapshot)
-    db.commit()
+    commit(db)
     db.refresh(snapshot)
 
-    return SignalResponse(
-        symbol=symbol,
-        strategy_id=strategy.id,
-        signal=result.signal,
-        price=result.price,
-        timestamp=snapshot.timestamp,
-        indicators=SignalIndicators(**result.indicators),
-    )
+    with time_stage("response_model"):
+        return SignalResponse(
+            symbol=symbol,
+            strategy_id=strategy.id,
+            signal=result.signal,
+            price=result.price,
+            timestamp=snapshot.timestamp,
+            indicators=SignalIndicators(**result.indicators),
+        )
+
+
+@router.get("/latest/batch", response_model=BatchSignalResponse)
+def get_latest_signals_batch(
+    symbols: str = Query(..., description="Comma-separated list of symbols"),
+    strategy_id: Optional[int] = Query(None),
+    db: Session = Depends(get_db),
+) -> BatchSignalResponse:
+    settings = get_settings()
+    requested = list(dict.fromkeys(symbol.strip() for symbol in symbols.split(",") if symbol.strip()))
+    if not requested:
+        raise HTTPException(status_code=422, detail="At least one symbol is required")
+    if len(requested) > settings.batch_max_symbols:
+        raise HTTPException(status_code=422, detail=f"At most {settings.batch_max_symbols} symbols per request")
+
+    strategy = _get_strategy(db, strategy_id)
+    engine = strategy.engine
+    scheduler = get_scheduler()
+    computed_at = get_clock().now()
+
+    results: Dict[str, StrategyResult] = {}
+    timestamps: Dict[str, datetime] = {}
+    errors: Dict[str, str] = {}
+    to_fetch = []
+    for symbol in requested:
+        precomputed = scheduler.get_latest(symbol, strategy.id) if scheduler else None
+        if precomputed is not None:
+            results[symbol] = precomputed.result
+            timestamps[symbol] = precomputed.computed_at
+        else:
+            to_fetch.append(symbol)
+
+    if to_fetch:
+        end = computed_at
+        candles_by_symbol = fetch_candles_batch(to_fetch, end - timedelta(days=30), end, settings.batch_max_workers)
+
+        def evaluate(symbol: str):
+            candles = candles_by_symbol[symbol]
+            if isinstance(candles, Exception):
+                return symbol, candles
+            try:
+                return symbol, engine.compute(candles)
+            except Exception as exc:  # one bad symbol becomes an error item, not a failed batch
+                return symbol, exc
+
+        with ThreadPoolExecutor(max_workers=max(1, min(settings.batch_max_workers, len(to_fetch)))) as pool:
+            for symbol, outcome in pool.map(evaluate, to_fetch):
+                if isinstance(outcome, Exception):
+                    errors[symbol] = str(outcome)
+                else:
+                    results[symbol] = outcome
+
+        fresh = [symbol for symbol in to_fetch if symbol in results]
+        if fresh:
+            db.add_all(
+                SignalSnapshot(
+                    strategy_id=strategy.id,
+                    symbol=symbol,
+                    timestamp=computed_at,
+                    signal=results[symbol].signal,
+                    indicators=results[symbol].indicators,
+                    price=results[symbol].price,
+                )
+                for symbol in fresh
+            )
+            commit(db)
+
+    with time_stage("response_model"):
+        items = []
+        for symbol in requested:
+            if symbol in errors:
+                items.append(BatchSignalItem(symbol=symbol, error=errors[symbol]))
+                continue
+            result = results[symbol]
+            items.append(
+                BatchSignalItem(
+                    symbol=symbol,
+                    signal=SignalResponse(
+                        symbol=symbol,
+                        strategy_id=strategy.id,
+                        signal=result.signal,
+                        price=result.price,
+                        timestamp=timestamps.get(symbol, computed_at),
+                        indicators=SignalIndicators(**result.indicators),
+                    ),
+                )
+            )
+        return BatchSignalResponse(strategy_id=strategy.id, results=items)
+
+
+@router.get("/latest/strategies", response_model=StrategySignalsResponse)
+def get_latest_signals_for_all_strategies(
+    symbol: str = Query("XAUUSD"),
+    db: Session = Depends(get_db),
+) -> StrategySignalsResponse:
+    strategies = get_strategy_registry().all(db)
+    if not strategies:
+        raise HTTPException(status_code=404, detail="No strategies configured")
+
+    end = get_clock().now()
+    start = end - timedelta(days=30)
+    candles = fetch_candles(symbol, start, end)
+    engines = {strategy.id: strategy.engine for strategy in strategies}
+    results = evaluate_strategies(candles, engines)
+
+    computed_at = get_clock().now()
+    snapshots = [
+        SignalSnapshot(
+            strategy_id=strategy_id,
+            symbol=symbol,
+            timestamp=computed_at,
+            signal=result.signal,
+            indicators=result.indicators,
+            price=result.price,
+        )
+        for strategy_id, result in results.items()
+    ]
+    db.add_all(snapshots)
+    commit(db)
+
+    with time_stage("response_model"):
+        return StrategySignalsResponse(
+            symbol=symbol,
+            signals=[
+                SignalResponse(
+                    symbol=symbol,
+                    strategy_id=snapshot.strategy_id,
+                    signal=snapshot.signal,
+                    price=snapshot.price,
+                    timestamp=snapshot.timestamp,
+                    indicators=SignalIndicators(**snapshot.indicators),
+                )
+                for snapshot in snapshots
+            ],
+        )
 
 
 @router.get("/history")
@@ -69,26 +251,24 @@ def get_signal_history(
     strategy_id: Optional[int] = Query(None),
     start: Optional[datetime] = Query(None, alias="from"),
     end: Optional[datetime] = Query(None, alias="to"),
+    format: str = Query("rows", regex=FORMAT_PATTERN),
     db: Session = Depends(get_db),
-):
+) -> FastJSONResponse:
     strategy = _get_strategy(db, strategy_id)
-    params = StrategyParams(**strategy.parameters)
 
     if end is None:
-        end = datetime.utcnow()
+        end = get_clock().now()
     if start is None:
         start = end - timedelta(days=180)
 
     candles = fetch_candles(symbol, start, end)
-    engine = StrategyEngine(params)
 
     history = []
-    warmup = max(params.sma_fast, params.sma_slow, params.rsi_period)
     for idx in range(len(candles)):
         window = candles.iloc[: idx + 1]
-        if len(window) < warmup:
+        if len(window) < strategy.warmup:
             continue
-        result = engine.compute(window)
+        result = strategy.engine.compute(window)
         timestamp = candles.index[idx].to_pydatetime()
         history.append(
             {
@@ -98,4 +278,116 @@ def get_signal_history(
                 "indicators": result.indicators,
             }
         )
-    return {"symbol": symbol, "strategy_id": strategy.id, "history": history}
+    with time_stage("serialization"):
+        if format == "columnar":
+            return FastJSONResponse(
+                {"symbol": symbol, "strategy_id": strategy.id, "format": format, **history_columnar(history)}
+            )
+        return FastJSONResponse({"symbol": symbol, "strategy_id": strategy.id, "history": history})
+
+
+def _stream_symbols() -> Set[str]:
+    """Symbols stream clients may subscribe to: configured ones plus pairs the scheduler already tracks."""
+
+    settings = get_settings()
+    scheduler = get_scheduler()
+    tracked = {symbol for symbol, _ in scheduler.pairs} if scheduler is not None else set()
+    return {*settings.scheduled_symbols, *settings.stream_symbols, *tracked}
+
+
+def _resolve_channel(symbol: str, strategy_id: Optional[int]) -> Tuple[str, int, Optional[StrategyParams]]:
+    if symbol not in _stream_symbols():
+        raise ValueError(f"Symbol '{symbol}' is not available for streaming")
+    scheduler = get_scheduler()
+    if strategy_id is not None and scheduler is not None and (symbol, strategy_id) in scheduler.pairs:
+        return symbol, strategy_id, None
+    with new_session() as db:
+        strategy = _get_strategy(db, strategy_id)
+        return symbol, strategy.id, strategy.params
+
+
+def _release(hub: SignalHub, channel: Channel) -> None:
+    """Stop computing a stream-added pair once nobody is subscribed to it."""
+
+    if channel in hub.channels or channel not in _stream_tracked:
+        return
+    _stream_tracked.discard(channel)
+    scheduler = get_scheduler()
+    if scheduler is not None:
+        scheduler.untrack(*channel)
+
+
+async def _forward(websocket: WebSocket, subscriber: Subscriber) -> None:
+    while True:
+        await websocket.send_text(await subscriber.next_message())
+
+
+def _report_sender(task: "asyncio.Task[None]") -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Signal stream sender stopped", exc_info=task.exception())
+
+
+def _control(kind: str, **fields: Any) -> str:
+    return json.dumps({"type": kind, **fields})
+
+
+@router.websocket("/stream")
+async def stream_signals(websocket: WebSocket) -> None:
+    """Push signals for subscribed ``(symbol, strategy_id)`` channels as each bar closes.
+
+    Clients send ``{"action": "subscribe" | "unsubscribe", "symbol": ..., "strategy_id": ...}``
+    (``strategy_id`` defaults to the first strategy). Only ``scheduled_symbols``,
+    ``stream_symbols`` and already tracked symbols are accepted. Subscribing to an
+    untracked pair adds it to the scheduler until its last subscriber leaves, and the
+    latest precomputed signal, if fresh, is sent straight away.
+    """
+
+    await websocket.accept()
+    hub = get_signal_hub()
+    subscriber = hub.connect()
+    sender = asyncio.create_task(_forward(websocket, subscriber))
+    sender.add_done_callback(_report_sender)
+    try:
+        while True:
+            try:
+                message = json.loads(await websocket.receive_text())
+                action, symbol = message["action"], str(message["symbol"])
+                strategy_id = message.get("strategy_id")
+                if action not in ("subscribe", "unsubscribe"):
+                    raise ValueError(f"Unknown action '{action}'")
+                symbol, strategy_id, params = await asyncio.to_thread(
+                    _resolve_channel, symbol, None if strategy_id is None else int(strategy_id)
+                )
+            except HTTPException as exc:
+                subscriber.offer(_control("error", detail=exc.detail))
+                continue
+            except (KeyError, TypeError, ValueError) as exc:
+                subscriber.offer(_control("error", detail=f"Invalid message: {exc}"))
+                continue
+
+            channel = (symbol, strategy_id)
+            if action == "unsubscribe":
+                hub.unsubscribe(subscriber, channel)
+                _release(hub, channel)
+                subscriber.offer(_control("unsubscribed", symbol=symbol, strategy_id=strategy_id))
+                continue
+
+            hub.subscribe(subscriber, channel)
+            subscriber.offer(_control("subscribed", symbol=symbol, strategy_id=strategy_id))
+            scheduler = get_scheduler()
+            if scheduler is None:
+                continue
+            if params is not None and channel not in scheduler.pairs:
+                scheduler.track(symbol, strategy_id, params)
+                _stream_tracked.add(channel)
+            latest = scheduler.get_latest(symbol, strategy_id)
+            if latest is not None:
+                subscriber.offer(signal_message(latest))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sender.cancel()
+        channels = list(subscriber.channels)
+        hub.disconnect(subscriber)
+        for channel in channels:
+            _release(hub, channel)
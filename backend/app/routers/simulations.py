@@ -1,18 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Union
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from ..database import get_db
-from ..models import Simulation, Strategy
-from ..schemas import SimulationRead, SimulationRunRequest, SimulationRunResponse, StrategyParams
+from ..database import commit, get_db
+from ..metrics import time_stage
+from ..models import Simulation
+from ..responses import FORMAT_PATTERN, FastJSONResponse, simulation_columnar
+from ..schemas import SimulationRead, SimulationRunRequest, SimulationRunResponse
 from ..services.market_data import fetch_candles
-from ..services.simulation import SimulationEngine
+from ..services.simulation import analytics_from_stored
+from ..services.strategy_registry import StrategyEntry, get_strategy_registry
 
 router = APIRouter(prefix="/api/simulations", tags=["simulations"])
 
 
-def _get_strategy(db: Session, strategy_id: int) -> Strategy:
-    strategy = db.query(Strategy).filter(Strategy.id == strategy_id).first()
-    if not strategy:
+def _get_strategy(db: Session, strategy_id: int) -> StrategyEntry:
+    strategy = get_strategy_registry().get(db, strategy_id)
+    if strategy is None:
         raise HTTPException(status_code=404, detail="Strategy not found")
     return strategy
 
@@ -20,11 +25,9 @@ def _get_strategy(db: Session, strategy_id: int) -> Strategy:
 @router.post("/run", response_model=SimulationRunResponse)
 def run_simulation(request: SimulationRunRequest, db: Session = Depends(get_db)) -> SimulationRunResponse:
     strategy = _get_strategy(db, request.strategy_id)
-    params = StrategyParams(**strategy.parameters)
 
     candles = fetch_candles(request.symbol, request.start_date, request.end_date)
-    engine = SimulationEngine(params)
-    results = engine.run(candles, request)
+    results = strategy.simulation.run(candles, request)
 
     simulation = Simulation(
         strategy_id=strategy.id,
@@ -38,28 +41,47 @@ def run_simulation(request: SimulationRunRequest, db: Session = Depends(get_db))
         total_trades=results["total_trades"],
         profitable_trades=results["profitable_trades"],
         equity_curve=results["equity_curve"],
-        metadata={
+        metadata_={
             "strategy_params": strategy.parameters,
             "trades": results["trades"],
+            "analytics": results["analytics"],
         },
     )
     db.add(simulation)
-    db.commit()
+    commit(db)
     db.refresh(simulation)
 
-    return SimulationRunResponse(simulation=_to_schema(simulation))
+    with time_stage("response_model"):
+        return SimulationRunResponse(simulation=_to_schema(simulation))
 
 
 @router.get("/{simulation_id}", response_model=SimulationRead)
-def get_simulation(simulation_id: int, db: Session = Depends(get_db)) -> SimulationRead:
+def get_simulation(
+    simulation_id: int,
+    format: str = Query("rows", regex=FORMAT_PATTERN),
+    db: Session = Depends(get_db),
+) -> Union[SimulationRead, FastJSONResponse]:
     simulation = db.query(Simulation).filter(Simulation.id == simulation_id).first()
     if not simulation:
         raise HTTPException(status_code=404, detail="Simulation not found")
-    return _to_schema(simulation)
+    if format == "columnar":
+        with time_stage("serialization"):
+            # Stored rows were validated on write; skip per-point models on the way out.
+            return FastJSONResponse({**simulation_columnar(_to_payload(simulation)), "format": format})
+    with time_stage("response_model"):
+        return _to_schema(simulation)
 
 
 def _to_schema(simulation: Simulation) -> SimulationRead:
-    return SimulationRead(
+    return SimulationRead(**_to_payload(simulation))
+
+
+def _to_payload(simulation: Simulation) -> dict:
+    metadata = simulation.metadata_ or {}
+    if "analytics" not in metadata:
+        # Rows stored before analytics existed are scored on every read; a GET never writes.
+        metadata = {**metadata, "analytics": analytics_from_stored(simulation.equity_curve, metadata.get("trades", []))}
+    return dict(
         id=simulation.id,
         strategy_id=simulation.strategy_id,
         symbol=simulation.symbol,
@@ -72,6 +94,7 @@ def _to_schema(simulation: Simulation) -> SimulationRead:
         total_trades=simulation.total_trades,
         profitable_trades=simulation.profitable_trades,
         equity_curve=simulation.equity_curve,
-        metadata=simulation.metadata,
+        metadata=metadata,
+        analytics=metadata["analytics"],
         created_at=simulation.created_at,
     )
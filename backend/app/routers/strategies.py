@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
-from ..database import get_db
+from ..config import get_settings
+from ..database import commit, get_db
 from ..models import Strategy
 from ..schemas import StrategyCreate, StrategyRead
+from ..services.scheduler import get_scheduler
+from ..services.strategy_registry import get_strategy_registry
 
 router = APIRouter(prefix="/api/strategies", tags=["strategies"])
 
@@ -27,6 +30,12 @@ def create_or_update_strategy(payload: StrategyCreate, db: Session = Depends(get
             parameters=payload.parameters.dict(),
         )
         db.add(strategy)
-    db.commit()
+    commit(db)
     db.refresh(strategy)
+    get_strategy_registry().invalidate(strategy.id)
+
+    scheduler = get_scheduler()
+    if scheduler is not None:
+        for symbol in get_settings().scheduled_symbols:
+            scheduler.track(symbol, strategy.id, payload.parameters)
     return StrategyRead.from_orm(strategy)
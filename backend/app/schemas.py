@@ -49,6 +49,22 @@ class SignalResponse(BaseModel):
     indicators: SignalIndicators
 
 
+class StrategySignalsResponse(BaseModel):
+    symbol: str
+    signals: List[SignalResponse]
+
+
+class BatchSignalItem(BaseModel):
+    symbol: str
+    signal: Optional[SignalResponse] = None
+    error: Optional[str] = None
+
+
+class BatchSignalResponse(BaseModel):
+    strategy_id: int
+    results: List[BatchSignalItem]
+
+
 class SimulationRunRequest(BaseModel):
     strategy_id: int
     symbol: str
@@ -77,6 +93,7 @@ class SimulationRead(BaseModel):
     profitable_trades: int
     equity_curve: List[EquityPoint]
     metadata: Dict[str, Any]
+    analytics: Optional[Dict[str, Any]] = None
     created_at: datetime
 
     class Config:
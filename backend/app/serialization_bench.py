@@ -0,0 +1,71 @@
+"""Payload size and encode time of the signal-history response formats.
+
+Encodes the same synthetic history as rows (FastAPI's default encoder and
+orjson) and as columns. Run it from ``backend/`` with
+``python -m app.serialization_bench`` (``make bench-serialization``).
+"""
+import argparse
+import gzip
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from fastapi.encoders import jsonable_encoder
+
+from .responses import FastJSONResponse, history_columnar
+
+
+def _sample_history(rows: int) -> List[Dict[str, Any]]:
+    start = datetime(2020, 1, 1)
+    return [
+        {
+            "timestamp": start + timedelta(hours=index),
+            "signal": ("BUY", "SELL", "HOLD")[index % 3],
+            "price": 1800.0 + index * 0.01,
+            "indicators": {"sma_fast": 1800.0 + index * 0.011, "sma_slow": 1800.0 + index * 0.009, "rsi": 50.0},
+        }
+        for index in range(rows)
+    ]
+
+
+def benchmark(rows: int = 50_000, repeat: int = 3) -> Dict[str, Dict[str, float]]:
+    """Encode the same signal history as rows (default encoder) and columns (orjson)."""
+
+    history = _sample_history(rows)
+    variants = {
+        "rows_default": lambda: json.dumps(
+            jsonable_encoder({"history": history}), ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8"),
+        "rows_orjson": lambda: FastJSONResponse({"history": history}).body,
+        "columnar_orjson": lambda: FastJSONResponse(history_columnar(history)).body,
+    }
+    results: Dict[str, Dict[str, float]] = {}
+    for name, encode in variants.items():
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            body = encode()
+            timings.append(time.perf_counter() - started)
+        results[name] = {
+            "encode_seconds": min(timings),
+            "bytes": float(len(body)),
+            "gzip_bytes": float(len(gzip.compress(body, compresslevel=6))),
+        }
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Dict[str, float]]:
+    parser = argparse.ArgumentParser(description="Compare payload size and encode time of the response formats")
+    parser.add_argument("--rows", type=int, default=50_000, help="Bars of signal history to encode")
+    args = parser.parse_args(argv)
+
+    results = benchmark(rows=args.rows)
+    print(f"{'format':<17}{'encode ms':>11}{'KB':>10}{'gzip KB':>10}")
+    for name, stats in results.items():
+        print(f"{name:<17}{stats['encode_seconds'] * 1000:>11.1f}{stats['bytes'] / 1024:>10.0f}{stats['gzip_bytes'] / 1024:>10.0f}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,15 @@
+import math
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Dict, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from .clock import Clock, get_clock
+
+ORDER_COLUMNS = ["timestamp", "symbol", "side", "volume"]
 
 
 class BrokerAdapter(ABC):
@@ -12,17 +22,182 @@ class BrokerAdapter(ABC):
         raise NotImplementedError
 
 
+@dataclass(frozen=True)
+class ExecutionModel:
+    """Spread, slippage, book depth and latency applied to paper fills.
+
+    An order fills at the open of the first candle starting at or after
+    ``timestamp + latency``, moved against the order by half the spread, a fixed
+    slippage, and the average level it walks through a synthetic book holding
+    ``level_volume`` units per level, ``level_step_bps`` apart.
+    """
+
+    spread_bps: float = 2.0
+    slippage_bps: float = 0.0
+    level_volume: float = math.inf
+    level_step_bps: float = 0.0
+    latency: timedelta = timedelta(0)
+
+    def cost_bps(self, volume: np.ndarray) -> np.ndarray:
+        volume = np.asarray(volume, dtype=np.float64)
+        if math.isinf(self.level_volume) or self.level_step_bps == 0:
+            walk = np.zeros_like(volume)
+        else:
+            full = np.floor(volume / self.level_volume)
+            rest = volume - full * self.level_volume
+            walk = self.level_step_bps * (self.level_volume * full * (full - 1) / 2 + rest * full) / volume
+        return self.spread_bps / 2 + self.slippage_bps + walk
+
+
+def _naive_utc(values) -> np.ndarray:
+    index = pd.DatetimeIndex(values)
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    return index.to_numpy(dtype="datetime64[ns]")
+
+
 class PaperBroker(BrokerAdapter):
-    def __init__(self):
-        self.orders = []
+    """Simulated broker filling orders against recorded candles.
+
+    ``execute_batch`` matches a whole frame of orders with one binary search per
+    symbol, so a year of signals replays in well under a second. ``place_order``
+    fills a single order at the clock's current time. Fills are kept as frames and
+    positions, execution cost and marked-to-market PnL are aggregated from them.
+    """
+
+    def __init__(
+        self,
+        candles: Optional[Mapping[str, pd.DataFrame]] = None,
+        model: Optional[ExecutionModel] = None,
+        clock: Optional[Clock] = None,
+    ):
+        self.model = model or ExecutionModel()
+        self.clock = clock
+        self.candles: Dict[str, pd.DataFrame] = {}
+        self._timestamps: Dict[str, np.ndarray] = {}
+        self._fills: List[pd.DataFrame] = []
+        self._next_id = 1
+        for symbol, frame in (candles or {}).items():
+            self.add_candles(symbol, frame)
+
+    def add_candles(self, symbol: str, frame: pd.DataFrame) -> None:
+        frame = frame.sort_index()
+        self.candles[symbol] = frame
+        self._timestamps[symbol] = _naive_utc(frame.index)
+
+    def execute_batch(self, orders: pd.DataFrame) -> pd.DataFrame:
+        """Fill a frame of ``timestamp, symbol, side, volume`` orders and return one row per order.
+
+        Orders with no candle at or after their due time are returned with status
+        ``rejected`` and a NaN price. Unknown sides and volumes that are not
+        positive and finite raise ``ValueError``.
+        """
+
+        missing = [column for column in ORDER_COLUMNS if column not in orders.columns]
+        if missing:
+            raise ValueError(f"Orders are missing columns: {', '.join(missing)}")
+        orders = orders[ORDER_COLUMNS].reset_index(drop=True)
+        unknown = set(orders["side"].unique()) - {"buy", "sell"}
+        if unknown:
+            raise ValueError(f"Unknown order sides: {', '.join(sorted(map(str, unknown)))}")
+
+        volume = orders["volume"].to_numpy(dtype=np.float64)
+        invalid = ~(np.isfinite(volume) & (volume > 0))
+        if invalid.any():
+            raise ValueError(f"Order volumes must be positive and finite, got: {', '.join(map(str, volume[invalid]))}")
+
+        count = len(orders)
+        sign = np.where(orders["side"].to_numpy() == "buy", 1.0, -1.0)
+        due = _naive_utc(orders["timestamp"]) + np.timedelta64(self.model.latency)
+        reference = np.full(count, np.nan)
+        filled_at = np.full(count, np.datetime64("NaT"), dtype="datetime64[ns]")
+        for symbol, rows in orders.groupby("symbol", sort=False).indices.items():
+            timestamps = self._timestamps.get(symbol)
+            if timestamps is None or timestamps.size == 0:
+                continue
+            at = np.searchsorted(timestamps, due[rows], side="left")
+            hit = at < timestamps.size
+            reference[rows[hit]] = self.candles[symbol]["open"].to_numpy(dtype=np.float64)[at[hit]]
+            filled_at[rows[hit]] = timestamps[at[hit]]
+
+        price = reference * (1 + sign * self.model.cost_bps(volume) / 1e4)
+        filled = ~np.isnan(reference)
+        fills = pd.DataFrame(
+            {
+                "order_id": np.arange(self._next_id, self._next_id + count),
+                "timestamp": orders["timestamp"],
+                "filled_at": filled_at,
+                "symbol": orders["symbol"],
+                "side": orders["side"],
+                "volume": volume,
+                "reference_price": reference,
+                "price": price,
+                "cost": volume * np.abs(price - reference),
+                "status": np.where(filled, "filled", "rejected"),
+            }
+        )
+        self._next_id += count
+        self._fills.append(fills[filled])
+        return fills
 
     def place_order(self, symbol: str, side: str, volume: float) -> Dict[str, Any]:
-        order = {"symbol": symbol, "side": side, "volume": volume, "status": "filled"}
-        self.orders.append(order)
-        return order
+        now = (self.clock or get_clock()).now()
+        order = pd.DataFrame({"timestamp": [now], "symbol": [symbol], "side": [side], "volume": [float(volume)]})
+        fill = self.execute_batch(order).iloc[0]
+        result = {
+            "order_id": int(fill["order_id"]),
+            "symbol": symbol,
+            "side": side,
+            "volume": float(volume),
+            "status": fill["status"],
+        }
+        if fill["status"] == "filled":
+            result.update(
+                price=float(fill["price"]),
+                reference_price=float(fill["reference_price"]),
+                filled_at=fill["filled_at"].to_pydatetime(),
+            )
+        else:
+            result["reason"] = f"No market data for {symbol} at or after {now.isoformat()}"
+        return result
+
+    def fills(self) -> pd.DataFrame:
+        if not self._fills:
+            return pd.DataFrame(columns=["order_id", "filled_at", "symbol", "side", "volume", "price", "cost"])
+        if len(self._fills) > 1:
+            self._fills = [pd.concat(self._fills, ignore_index=True)]
+        return self._fills[0]
+
+    def pnl(self) -> pd.DataFrame:
+        """Per-symbol position, execution cost and PnL marked at the last candle close."""
+
+        fills = self.fills()
+        if fills.empty:
+            return pd.DataFrame(columns=["position", "cash_flow", "cost", "mark", "pnl"])
+        signed = np.where(fills["side"] == "buy", 1.0, -1.0) * fills["volume"].to_numpy()
+        ledger = pd.DataFrame(
+            {"symbol": fills["symbol"], "position": signed, "cash_flow": -signed * fills["price"], "cost": fills["cost"]}
+        )
+        summary = ledger.groupby("symbol").sum()
+        last_fill = fills.groupby("symbol")["price"].last()
+        summary["mark"] = [
+            float(self.candles[symbol]["close"].iloc[-1]) if symbol in self.candles else last_fill[symbol]
+            for symbol in summary.index
+        ]
+        summary["pnl"] = summary["cash_flow"] + summary["position"] * summary["mark"]
+        return summary
 
     def get_positions(self) -> Dict[str, Any]:
-        return {"positions": [], "orders": self.orders}
+        summary = self.pnl()
+        positions = [
+            {"symbol": symbol, **{key: float(value) for key, value in row.items()}}
+            for symbol, row in summary.iterrows()
+        ]
+        return {
+            "positions": positions,
+            "pnl": float(summary["pnl"].sum()) if positions else 0.0,
+            "fills": len(self.fills()),
+        }
 
 
 class ExnessMT5Broker(BrokerAdapter):
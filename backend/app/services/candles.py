@@ -0,0 +1,188 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..config import get_settings
+from ..metrics import record_cache, time_stage
+from .clock import Clock, get_clock
+from .market_data import fetch_candles
+from .replay import CANDLE_COLUMNS, IndexedCandles
+from .scheduler import parse_interval
+
+# Each level is aggregated from the one before it; every level boundary is also a
+# boundary of the finer levels, so the result matches resampling the base series.
+RESOLUTIONS: Dict[str, Tuple[timedelta, str]] = {
+    "1h": (timedelta(hours=1), "1h"),
+    "4h": (timedelta(hours=4), "4h"),
+    "1d": (timedelta(days=1), "1D"),
+    "1w": (timedelta(weeks=1), "W-MON"),
+}
+AGGREGATIONS = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+
+Fetcher = Callable[[str, datetime, datetime], pd.DataFrame]
+
+
+def aggregate_candles(frame: pd.DataFrame, rule: str) -> pd.DataFrame:
+    resampled = frame.resample(rule, closed="left", label="left").agg(AGGREGATIONS)
+    return resampled.dropna(subset=["close"])
+
+
+class PointLimitError(ValueError):
+    """Raised when even the coarsest resolution has more than ``max_points`` candles in range."""
+
+
+@dataclass(frozen=True)
+class CandlePyramid:
+    """The base candle series plus every coarser resolution, finest first."""
+
+    levels: Dict[str, IndexedCandles]
+    built_at: datetime
+
+    @classmethod
+    def build(cls, base: pd.DataFrame, base_resolution: str, built_at: datetime) -> "CandlePyramid":
+        base_step = parse_interval(base_resolution)
+        frame = base[CANDLE_COLUMNS]
+        levels = {base_resolution: IndexedCandles.from_frame(frame)}
+        for name, (step, rule) in RESOLUTIONS.items():
+            if step <= base_step:
+                continue
+            frame = aggregate_candles(frame, rule)
+            levels[name] = IndexedCandles.from_frame(frame)
+        return cls(levels=levels, built_at=built_at)
+
+    def count(self, resolution: str, start: datetime, end: datetime) -> int:
+        timestamps = self.levels[resolution].timestamps
+        lo, hi = np.searchsorted(timestamps, [pd.Timestamp(start).value, pd.Timestamp(end).value], side="left")
+        return int(hi - lo)
+
+    def choose(self, start: datetime, end: datetime, max_points: int) -> str:
+        """Finest resolution with at most ``max_points`` candles in range.
+
+        Raises :class:`PointLimitError` when no level is coarse enough.
+        """
+
+        for resolution in self.levels:
+            count = self.count(resolution, start, end)
+            if count <= max_points:
+                return resolution
+        raise PointLimitError(
+            f"{count} candles at {resolution} exceed max_points={max_points}; narrow the range or raise max_points"
+        )
+
+
+def columnar(frame: pd.DataFrame) -> Dict[str, List[Any]]:
+    """Compact column layout: epoch-second timestamps plus one list per OHLCV field."""
+
+    return {
+        "t": (frame.index.asi8 // 1_000_000_000).tolist(),
+        "o": frame["open"].to_numpy(dtype=np.float64).tolist(),
+        "h": frame["high"].to_numpy(dtype=np.float64).tolist(),
+        "l": frame["low"].to_numpy(dtype=np.float64).tolist(),
+        "c": frame["close"].to_numpy(dtype=np.float64).tolist(),
+        "v": frame["volume"].fillna(0).to_numpy(dtype=np.float64).tolist(),
+    }
+
+
+class CandleService:
+    """Serve candles at several resolutions from a per-symbol pyramid cache.
+
+    The base series for ``history`` up to now is fetched once per symbol and
+    aggregated into every coarser level; zooming and panning only slice cached
+    levels. A pyramid is rebuilt once a new base bar has closed. At most
+    ``max_symbols`` pyramids are kept (least recently used evicted first).
+    """
+
+    def __init__(
+        self,
+        fetcher: Fetcher,
+        base_resolution: str = "1h",
+        history: timedelta = timedelta(days=730),
+        clock: Optional[Clock] = None,
+        max_symbols: int = 64,
+    ):
+        self.fetcher = fetcher
+        self.base_resolution = base_resolution
+        self.base_step = parse_interval(base_resolution)
+        self.history = history
+        self.clock = clock or get_clock()
+        self.max_symbols = max_symbols
+        self._cache: "OrderedDict[str, CandlePyramid]" = OrderedDict()
+        self._building: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def resolutions(self) -> List[str]:
+        return [self.base_resolution, *(name for name, (step, _) in RESOLUTIONS.items() if step > self.base_step)]
+
+    def pyramid(self, symbol: str) -> CandlePyramid:
+        now = self.clock.now()
+        with self._lock:
+            pyramid = self._cache.get(symbol)
+            fresh = pyramid is not None and now - pyramid.built_at < self.base_step
+            if fresh:
+                self._cache.move_to_end(symbol)
+            else:
+                build_lock = self._building.setdefault(symbol, threading.Lock())
+        record_cache("candle_pyramid", fresh)
+        if fresh:
+            return pyramid
+        # Fetch and aggregate outside the cache lock so a slow download only
+        # blocks other requests for the same symbol, which wait and reuse it.
+        with build_lock:
+            with self._lock:
+                pyramid = self._cache.get(symbol)
+                if pyramid is not None and now - pyramid.built_at < self.base_step:
+                    self._cache.move_to_end(symbol)
+                    return pyramid
+            try:
+                base = self.fetcher(symbol, now - self.history, now)
+                with time_stage("candle_aggregation"):
+                    pyramid = CandlePyramid.build(base, self.base_resolution, now)
+                with self._lock:
+                    self._cache[symbol] = pyramid
+                    self._cache.move_to_end(symbol)
+                    while len(self._cache) > self.max_symbols:
+                        self._cache.popitem(last=False)
+            finally:
+                with self._lock:
+                    if self._building.get(symbol) is build_lock:
+                        del self._building[symbol]
+        return pyramid
+
+    def candles(
+        self,
+        symbol: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        resolution: Optional[str] = None,
+        max_points: int = 1000,
+    ) -> Tuple[str, pd.DataFrame]:
+        if resolution is not None and resolution not in self.resolutions():
+            raise ValueError(f"Unknown resolution '{resolution}'. Known resolutions: {', '.join(self.resolutions())}")
+        pyramid = self.pyramid(symbol)
+        start = start or datetime(1970, 1, 1)
+        end = end or pyramid.built_at + self.base_step
+        resolution = resolution or pyramid.choose(start, end, max_points)
+        return resolution, pyramid.levels[resolution].slice(start, end)
+
+
+_service: Optional[CandleService] = None
+
+
+def get_candle_service() -> CandleService:
+    global _service
+    if _service is None:
+        settings = get_settings()
+        _service = CandleService(
+            fetch_candles, settings.candles_interval, timedelta(days=settings.candles_history_days)
+        )
+    return _service
+
+
+def set_candle_service(service: Optional[CandleService]) -> None:
+    global _service
+    _service = service
@@ -0,0 +1,53 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Optional, Protocol
+
+
+class Clock(Protocol):
+    def now(self) -> datetime:
+        ...
+
+    async def sleep(self, seconds: float) -> None:
+        ...
+
+
+class SystemClock:
+    def now(self) -> datetime:
+        return datetime.utcnow()
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+
+class ReplayClock:
+    """Simulated UTC clock that starts at ``start`` and runs ``speed`` times faster than real time."""
+
+    def __init__(self, start: datetime, speed: float = 1.0, monotonic=time.monotonic):
+        if speed <= 0:
+            raise ValueError("Replay speed must be positive")
+        self.start = start
+        self.speed = speed
+        self._monotonic = monotonic
+        self._origin = monotonic()
+
+    def now(self) -> datetime:
+        return self.start + timedelta(seconds=(self._monotonic() - self._origin) * self.speed)
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds / self.speed)
+
+
+_clock: Optional[Clock] = None
+
+
+def get_clock() -> Clock:
+    global _clock
+    if _clock is None:
+        _clock = SystemClock()
+    return _clock
+
+
+def set_clock(clock: Optional[Clock]) -> None:
+    global _clock
+    _clock = clock
@@ -0,0 +1,155 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..metrics import record_cache
+from ..schemas import StrategyParams
+
+
+@dataclass(frozen=True)
+class IndicatorSpec:
+    kind: str
+    period: int = 0
+
+
+DELTA = IndicatorSpec("delta")
+GAIN = IndicatorSpec("gain")
+LOSS = IndicatorSpec("loss")
+
+
+def sma(period: int) -> IndicatorSpec:
+    return IndicatorSpec("sma", period)
+
+
+def rsi(period: int) -> IndicatorSpec:
+    return IndicatorSpec("rsi", period)
+
+
+def strategy_indicators(params: StrategyParams) -> Dict[str, IndicatorSpec]:
+    return {
+        "sma_fast": sma(params.sma_fast),
+        "sma_slow": sma(params.sma_slow),
+        "rsi": rsi(params.rsi_period),
+    }
+
+
+def _dependencies(spec: IndicatorSpec) -> Tuple[IndicatorSpec, ...]:
+    if spec.kind in ("gain", "loss"):
+        return (DELTA,)
+    if spec.kind == "avg_gain":
+        return (GAIN,)
+    if spec.kind == "avg_loss":
+        return (LOSS,)
+    if spec.kind == "rsi":
+        return (IndicatorSpec("avg_gain", spec.period), IndicatorSpec("avg_loss", spec.period))
+    return ()
+
+
+def _evaluate(spec: IndicatorSpec, close: pd.Series, nodes: Mapping[IndicatorSpec, pd.Series]) -> pd.Series:
+    if spec.kind == "sma":
+        return close.rolling(window=spec.period).mean()
+    if spec.kind == "delta":
+        return close.diff()
+    if spec.kind == "gain":
+        return nodes[DELTA].clip(lower=0)
+    if spec.kind == "loss":
+        return -nodes[DELTA].clip(upper=0)
+    if spec.kind == "avg_gain":
+        return nodes[GAIN].rolling(window=spec.period).mean()
+    if spec.kind == "avg_loss":
+        return nodes[LOSS].rolling(window=spec.period).mean()
+    if spec.kind == "rsi":
+        avg_gain = nodes[IndicatorSpec("avg_gain", spec.period)]
+        avg_loss = nodes[IndicatorSpec("avg_loss", spec.period)]
+        rs = avg_gain / avg_loss.replace({0: float("inf")})
+        return 100 - (100 / (1 + rs))
+    raise ValueError(f"Unknown indicator '{spec.kind}'")
+
+
+class IndicatorPlan:
+    """Deduplicated, dependency-ordered set of indicator nodes."""
+
+    def __init__(self, specs: Iterable[IndicatorSpec] = ()):
+        self.order: List[IndicatorSpec] = []
+        self._seen = set()
+        for spec in specs:
+            self.add(spec)
+
+    @classmethod
+    def for_strategies(cls, params: Iterable[StrategyParams]) -> "IndicatorPlan":
+        plan = cls()
+        for item in params:
+            for spec in strategy_indicators(item).values():
+                plan.add(spec)
+        return plan
+
+    def add(self, spec: IndicatorSpec) -> None:
+        if spec in self._seen:
+            return
+        for dependency in _dependencies(spec):
+            self.add(dependency)
+        self._seen.add(spec)
+        self.order.append(spec)
+
+    def compute(self, candles: pd.DataFrame, cache: Optional["IndicatorCache"] = None) -> Dict[IndicatorSpec, pd.Series]:
+        close = candles["close"]
+        fingerprint = candle_fingerprint(candles) if cache is not None else None
+        nodes: Dict[IndicatorSpec, pd.Series] = {}
+        for spec in self.order:
+            if cache is not None:
+                cached = cache.get(fingerprint, spec)
+                if cached is not None:
+                    nodes[spec] = cached
+                    continue
+            # Indicators are stored in the candles' dtype; pandas rolling sums accumulate in float64.
+            nodes[spec] = _evaluate(spec, close, nodes).astype(close.dtype, copy=False)
+            if cache is not None:
+                cache.put(fingerprint, spec, nodes[spec])
+        return nodes
+
+
+def candle_fingerprint(candles: pd.DataFrame) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(candles.index.asi8).tobytes())
+    digest.update(np.ascontiguousarray(candles["close"].to_numpy(dtype="float64")).tobytes())
+    return digest.hexdigest()
+
+
+class IndicatorCache:
+    """LRU memo of indicator series keyed by candle fingerprint and spec."""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, IndicatorSpec], pd.Series]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, fingerprint: str, spec: IndicatorSpec) -> Optional[pd.Series]:
+        key = (fingerprint, spec)
+        with self._lock:
+            series = self._entries.get(key)
+            if series is not None:
+                self._entries.move_to_end(key)
+        record_cache("indicators", series is not None)
+        return series
+
+    def put(self, fingerprint: str, spec: IndicatorSpec, series: pd.Series) -> None:
+        with self._lock:
+            self._entries[(fingerprint, spec)] = series
+            self._entries.move_to_end((fingerprint, spec))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+indicator_cache = IndicatorCache()
@@ -1,23 +1,138 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Protocol, Sequence, Union
 
 import pandas as pd
-import yfinance as yf
 
-from ..config import get_settings
+from trading_bot.dtypes import PolicyLike, get_dtype_policy
 
+from ..config import Settings, get_settings
+from ..metrics import counter, record_rows, time_stage
+from .replay import ReplaySource
 
-def fetch_candles(symbol: str, start: datetime, end: datetime) -> pd.DataFrame:
+CandlesOrError = Union[pd.DataFrame, Exception]
+
+# What a provider's bulk download raises for bad responses or network trouble
+# (requests' connection errors are OSErrors). Anything else is a bug, not a reason to fall back.
+PROVIDER_ERRORS = (OSError, ValueError, KeyError)
+
+BATCH_FETCH_FALLBACKS = counter(
+    "batch_fetch_fallbacks_total", "Bulk candle fetches that failed and fell back to per-symbol fetches."
+)
+logger = logging.getLogger(__name__)
+
+
+class DataSource(Protocol):
+    def fetch(self, symbol: str, start: datetime, end: datetime) -> pd.DataFrame:
+        ...
+
+
+class YFinanceSource:
+    def __init__(self, interval: str, dtype: PolicyLike = "float64"):
+        self.interval = interval
+        self.dtype = get_dtype_policy(dtype)
+
+    def fetch(self, symbol: str, start: datetime, end: datetime) -> pd.DataFrame:
+        import yfinance as yf
+
+        with time_stage("fetch_candles"):
+            ticker = yf.Ticker(symbol)
+            hist = ticker.history(start=start, end=end, interval=self.interval)
+        return _normalise_history(symbol, hist, self.dtype)
+
+    def fetch_batch(self, symbols: Sequence[str], start: datetime, end: datetime) -> Dict[str, CandlesOrError]:
+        import yfinance as yf
+
+        with time_stage("fetch_candles_batch"):
+            bulk = yf.download(
+                tickers=list(symbols),
+                start=start,
+                end=end,
+                interval=self.interval,
+                group_by="ticker",
+                threads=True,
+                progress=False,
+            )
+
+        results: Dict[str, CandlesOrError] = {}
+        for symbol in symbols:
+            try:
+                if isinstance(bulk.columns, pd.MultiIndex):
+                    if symbol not in bulk.columns.get_level_values(0):
+                        raise ValueError(f"No market data returned for {symbol}")
+                    hist = bulk[symbol]
+                else:
+                    hist = bulk
+                results[symbol] = _normalise_history(symbol, hist.dropna(how="all"), self.dtype)
+            except ValueError as exc:
+                results[symbol] = exc
+        return results
+
+
+DATA_SOURCES: Dict[str, Callable[[Settings], DataSource]] = {
+    "yfinance": lambda settings: YFinanceSource(settings.candles_interval, settings.candle_dtype),
+    "replay": lambda settings: ReplaySource(Path(settings.replay_data_dir), settings.candle_dtype),
+}
+
+
+def register_data_source(name: str, factory: Callable[[Settings], DataSource]) -> None:
+    DATA_SOURCES[name] = factory
+    get_data_source.cache_clear()
+
+
+@lru_cache()
+def get_data_source() -> DataSource:
     settings = get_settings()
-    interval = settings.candles_interval
-    ticker = yf.Ticker(symbol)
-    hist = ticker.history(start=start, end=end, interval=interval)
+    try:
+        factory = DATA_SOURCES[settings.data_source]
+    except KeyError:
+        known = ", ".join(sorted(DATA_SOURCES))
+        raise ValueError(f"Unknown data source '{settings.data_source}'. Known sources: {known}") from None
+    return factory(settings)
+
+
+def fetch_candles(symbol: str, start: datetime, end: datetime) -> pd.DataFrame:
+    return get_data_source().fetch(symbol, start, end)
+
+
+def _normalise_history(symbol: str, hist: pd.DataFrame, dtype: PolicyLike = "float64") -> pd.DataFrame:
     if hist.empty:
         raise ValueError(f"No market data returned for {symbol}")
+    record_rows("fetch_candles", len(hist))
     hist = hist.tz_localize(None)
     hist = hist.rename(columns={"Open": "open", "High": "high", "Low": "low", "Close": "close", "Volume": "volume"})
     hist.index = pd.to_datetime(hist.index)
-    return hist
+    return get_dtype_policy(dtype).cast_frame(hist)
+
+
+def fetch_candles_batch(
+    symbols: Sequence[str], start: datetime, end: datetime, max_workers: int = 8
+) -> Dict[str, CandlesOrError]:
+    source = get_data_source()
+    fetch_batch = getattr(source, "fetch_batch", None)
+    if fetch_batch is not None:
+        try:
+            return fetch_batch(symbols, start, end)
+        except PROVIDER_ERRORS as exc:
+            BATCH_FETCH_FALLBACKS.inc()
+            logger.warning("Bulk fetch of %d symbols failed, fetching one by one: %s", len(symbols), exc)
+    return _fetch_concurrently(symbols, start, end, max_workers)
+
+
+def _fetch_concurrently(
+    symbols: Sequence[str], start: datetime, end: datetime, max_workers: int
+) -> Dict[str, CandlesOrError]:
+    def fetch(symbol: str) -> CandlesOrError:
+        try:
+            return fetch_candles(symbol, start, end)
+        except Exception as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(symbols)))) as pool:
+        return dict(zip(symbols, pool.map(fetch, symbols)))
 
 
 def dataframe_to_records(df: pd.DataFrame) -> List[dict]:
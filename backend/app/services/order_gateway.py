@@ -0,0 +1,249 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from ..metrics import gauge, histogram
+from .broker import BrokerAdapter
+
+ORDER_LATENCY_SECONDS = histogram(
+    "order_latency_seconds",
+    "Order latency from signal to broker acknowledgement, split by stage (queue, send, total).",
+    ("stage",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+ORDER_QUEUE_DEPTH = gauge("order_queue_depth", "Symbols waiting in the order gateway queue.", ("broker",))
+
+SIDES = {"buy": 1.0, "sell": -1.0}
+
+
+@dataclass
+class OrderTicket:
+    """One submitted order and its latency timestamps (``time.perf_counter`` seconds).
+
+    Tickets for the same symbol submitted before the gateway dispatches them are
+    coalesced into a single net broker order; every merged ticket shares its ack.
+    """
+
+    symbol: str
+    side: str
+    volume: float
+    signal_at: float
+    queued_at: float
+    sent_at: Optional[float] = None
+    acked_at: Optional[float] = None
+    status: str = "queued"
+    ack: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    _done: asyncio.Future = field(default=None, repr=False)
+
+    @property
+    def signed_volume(self) -> float:
+        return SIDES[self.side] * self.volume
+
+    @property
+    def latency_seconds(self) -> Optional[float]:
+        if self.acked_at is None:
+            return None
+        return self.acked_at - self.signal_at
+
+    async def wait(self) -> "OrderTicket":
+        return await asyncio.shield(self._done)
+
+
+class RateLimiter:
+    """Token bucket allowing ``rate`` orders per second with bursts of up to ``burst``."""
+
+    def __init__(self, rate: float, burst: int = 1, monotonic: Callable[[], float] = time.monotonic, sleep=None):
+        if rate <= 0 or burst < 1:
+            raise ValueError("Rate limits need a positive rate and a burst of at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._monotonic = monotonic
+        self._sleep = sleep or asyncio.sleep
+        self._tokens = float(burst)
+        self._updated = monotonic()
+
+    async def acquire(self) -> None:
+        while True:
+            now = self._monotonic()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await self._sleep((1 - self._tokens) / self.rate)
+
+
+class PositionBook:
+    """Net position and exposure per symbol, maintained locally from fills."""
+
+    def __init__(self):
+        self.volumes: Dict[str, float] = {}
+        self.prices: Dict[str, float] = {}
+
+    def apply_fill(self, symbol: str, signed_volume: float, price: Optional[float] = None) -> None:
+        self.volumes[symbol] = self.volumes.get(symbol, 0.0) + signed_volume
+        if price is not None:
+            self.prices[symbol] = float(price)
+
+    def exposure(self) -> float:
+        return sum(abs(volume) * self.prices.get(symbol, 0.0) for symbol, volume in self.volumes.items())
+
+    def snapshot(self) -> Dict[str, Any]:
+        positions = [
+            {
+                "symbol": symbol,
+                "volume": volume,
+                "last_price": self.prices.get(symbol),
+                "notional": abs(volume) * self.prices.get(symbol, 0.0),
+            }
+            for symbol, volume in sorted(self.volumes.items())
+            if volume != 0
+        ]
+        return {"positions": positions, "exposure": self.exposure()}
+
+
+class OrderGateway:
+    """Asynchronous, rate-limited order path in front of a :class:`BrokerAdapter`.
+
+    ``submit`` enqueues a ticket and returns immediately; a worker task drains every
+    symbol waiting in the bounded queue as one batch, nets same-symbol tickets into a
+    single order, and sends the batch concurrently under the broker's rate limit.
+    Brokers exposing ``place_order_async`` are awaited directly; synchronous adapters
+    run in a worker thread. Fills update a local :class:`PositionBook`, so position
+    and exposure checks never poll the broker. The sizes of the last ``batch_history``
+    batches are kept in :attr:`batches`.
+    """
+
+    def __init__(
+        self,
+        broker: BrokerAdapter,
+        name: str = "default",
+        max_queue: int = 1000,
+        rate_limiter: Optional[RateLimiter] = None,
+        positions: Optional[PositionBook] = None,
+        batch_history: int = 1000,
+    ):
+        self.broker = broker
+        self.name = name
+        self.rate_limiter = rate_limiter
+        self.positions = positions or PositionBook()
+        self.batches: Deque[int] = deque(maxlen=batch_history)
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=max_queue)
+        self._pending: Dict[str, List[OrderTicket]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, symbol: str, side: str, volume: float, signal_at: Optional[float] = None) -> OrderTicket:
+        """Queue an order, waiting for space if the queue is full.
+
+        ``signal_at`` is the ``time.perf_counter()`` reading taken when the signal was
+        produced; it defaults to now.
+        """
+
+        if side not in SIDES:
+            raise ValueError(f"Unknown order side '{side}'. Known sides: {', '.join(SIDES)}")
+        if volume <= 0:
+            raise ValueError("Order volume must be positive")
+        now = time.perf_counter()
+        ticket = OrderTicket(
+            symbol=symbol,
+            side=side,
+            volume=float(volume),
+            signal_at=now if signal_at is None else signal_at,
+            queued_at=now,
+            _done=asyncio.get_running_loop().create_future(),
+        )
+        waiting = self._pending.get(symbol)
+        if waiting is not None:
+            waiting.append(ticket)
+            return ticket
+        self._pending[symbol] = [ticket]
+        try:
+            await self._queue.put(symbol)
+        except BaseException:
+            self._pending.pop(symbol, None)
+            raise
+        ORDER_QUEUE_DEPTH.labels(self.name).set(self._queue.qsize())
+        return ticket
+
+    def get_positions(self) -> Dict[str, Any]:
+        return self.positions.snapshot()
+
+    async def _place(self, symbol: str, side: str, volume: float) -> Dict[str, Any]:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+        place_async = getattr(self.broker, "place_order_async", None)
+        if place_async is not None:
+            return await place_async(symbol, side, volume)
+        return await asyncio.to_thread(self.broker.place_order, symbol, side, volume)
+
+    async def _dispatch(self, symbol: str, tickets: List[OrderTicket]) -> None:
+        net = sum(ticket.signed_volume for ticket in tickets)
+        sent_at = time.perf_counter()
+        ack: Optional[Dict[str, Any]] = None
+        error: Optional[str] = None
+        if net == 0:
+            status = "coalesced"
+        else:
+            side = "buy" if net > 0 else "sell"
+            try:
+                ack = await self._place(symbol, side, abs(net))
+                status = ack.get("status", "filled")
+            except Exception as exc:
+                status, error = "rejected", str(exc)
+            if status == "filled":
+                filled = float(ack.get("volume", abs(net)))
+                self.positions.apply_fill(symbol, SIDES[side] * filled, ack.get("price"))
+        acked_at = time.perf_counter()
+
+        for ticket in tickets:
+            ticket.sent_at, ticket.acked_at = sent_at, acked_at
+            ticket.status, ticket.ack, ticket.error = status, ack, error
+            ORDER_LATENCY_SECONDS.labels("queue").observe(sent_at - ticket.queued_at)
+            ORDER_LATENCY_SECONDS.labels("send").observe(acked_at - sent_at)
+            ORDER_LATENCY_SECONDS.labels("total").observe(ticket.latency_seconds)
+            if not ticket._done.done():
+                ticket._done.set_result(ticket)
+
+    async def run_batch(self) -> int:
+        """Wait for at least one queued symbol, then send everything queued as one batch."""
+
+        symbols = [await self._queue.get()]
+        while not self._queue.empty():
+            symbols.append(self._queue.get_nowait())
+        ORDER_QUEUE_DEPTH.labels(self.name).set(0)
+        batch = [(symbol, self._pending.pop(symbol)) for symbol in symbols]
+        try:
+            await asyncio.gather(*(self._dispatch(symbol, tickets) for symbol, tickets in batch))
+        finally:
+            for _ in symbols:
+                self._queue.task_done()
+        self.batches.append(len(symbols))
+        return len(symbols)
+
+    async def run_forever(self) -> None:
+        while True:
+            await self.run_batch()
+
+    def start(self) -> asyncio.Task:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run_forever())
+        return self._task
+
+    async def drain(self) -> None:
+        """Block until every queued order has been acknowledged."""
+
+        await self._queue.join()
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        await self.drain()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
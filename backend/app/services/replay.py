@@ -0,0 +1,127 @@
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from trading_bot.dtypes import PolicyLike, get_dtype_policy
+
+from ..metrics import record_cache, record_rows, time_stage
+
+CANDLE_COLUMNS = ["open", "high", "low", "close", "volume"]
+BINARY_SUFFIXES = (".npz",)
+SYMBOL_PATTERN = re.compile(r"^[A-Za-z0-9._-]+$")
+
+
+@dataclass(frozen=True)
+class IndexedCandles:
+    frame: pd.DataFrame
+    timestamps: np.ndarray
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> "IndexedCandles":
+        frame = frame.sort_index()
+        return cls(frame=frame, timestamps=frame.index.asi8)
+
+    def slice(self, start: datetime, end: datetime) -> pd.DataFrame:
+        lo = np.searchsorted(self.timestamps, pd.Timestamp(start).value, side="left")
+        hi = np.searchsorted(self.timestamps, pd.Timestamp(end).value, side="left")
+        return self.frame.iloc[lo:hi]
+
+
+def save_candle_npz(frame: pd.DataFrame, path: Path) -> None:
+    """Write candles indexed by timestamp as the ``.npz`` replay format (plain arrays, no pickle)."""
+
+    index = pd.to_datetime(frame.index, utc=True).tz_localize(None)
+    np.savez(
+        path,
+        timestamp=index.asi8,
+        **{column: frame[column].to_numpy(dtype=np.float64) for column in CANDLE_COLUMNS},
+    )
+
+
+def load_candle_file(path: Path, dtype: PolicyLike = "float64") -> pd.DataFrame:
+    if path.suffix in BINARY_SUFFIXES:
+        with np.load(path, allow_pickle=False) as arrays:
+            missing = [column for column in ["timestamp", *CANDLE_COLUMNS] if column not in arrays.files]
+            if missing:
+                raise ValueError(f"Replay file {path} is missing columns: {', '.join(missing)}")
+            frame = pd.DataFrame(
+                {column: arrays[column] for column in CANDLE_COLUMNS},
+                index=pd.to_datetime(arrays["timestamp"], utc=True),
+            )
+    else:
+        frame = pd.read_csv(path)
+        missing = [column for column in ["timestamp", *CANDLE_COLUMNS] if column not in frame.columns]
+        if missing:
+            raise ValueError(f"Replay file {path} is missing columns: {', '.join(missing)}")
+        frame = frame.set_index("timestamp")
+    index = pd.to_datetime(frame.index, utc=True).tz_localize(None)
+    frame = frame[CANDLE_COLUMNS].astype(get_dtype_policy(dtype).price)
+    frame.index = index
+    frame.index.name = "timestamp"
+    return frame
+
+
+class ReplaySource:
+    """Serve candles from local OHLCV files (the format trading_bot.data.load_price_data reads).
+
+    Each symbol is loaded once into a sorted, indexed cache so range queries are two
+    binary searches plus a positional slice. Symbols come from API clients, so only
+    plain file names that resolve inside ``data_dir`` are looked up, and at most
+    ``max_symbols`` series are kept (least recently used evicted first).
+    """
+
+    def __init__(self, data_dir: Path, dtype: PolicyLike = "float64", max_symbols: int = 256):
+        self.data_dir = Path(data_dir).expanduser()
+        self.dtype = get_dtype_policy(dtype)
+        self.max_symbols = max_symbols
+        self._cache: "OrderedDict[str, IndexedCandles]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path_for(self, symbol: str) -> Optional[Path]:
+        if not SYMBOL_PATTERN.match(symbol) or ".." in symbol:
+            raise ValueError(f"Invalid symbol '{symbol}'")
+        root = self.data_dir.resolve()
+        for suffix in (*BINARY_SUFFIXES, ".csv"):
+            for name in (symbol, symbol.upper(), symbol.lower()):
+                candidate = (root / f"{name}{suffix}").resolve()
+                if candidate.parent == root and candidate.is_file():
+                    return candidate
+        return None
+
+    def candles_for(self, symbol: str) -> IndexedCandles:
+        with self._lock:
+            indexed = self._cache.get(symbol)
+            if indexed is not None:
+                self._cache.move_to_end(symbol)
+        record_cache("replay_candles", indexed is not None)
+        if indexed is not None:
+            return indexed
+        with self._lock:
+            indexed = self._cache.get(symbol)
+            if indexed is None:
+                path = self._path_for(symbol)
+                if path is None:
+                    raise ValueError(f"No market data returned for {symbol}")
+                indexed = IndexedCandles.from_frame(load_candle_file(path, self.dtype))
+                self._cache[symbol] = indexed
+                while len(self._cache) > self.max_symbols:
+                    self._cache.popitem(last=False)
+        return indexed
+
+    def fetch(self, symbol: str, start: datetime, end: datetime) -> pd.DataFrame:
+        with time_stage("fetch_candles"):
+            candles = self.candles_for(symbol).slice(start, end)
+        if candles.empty:
+            raise ValueError(f"No market data returned for {symbol}")
+        record_rows("fetch_candles", len(candles))
+        return candles
+
+    def first_timestamp(self, symbol: str) -> datetime:
+        return self.candles_for(symbol).frame.index[0].to_pydatetime()
@@ -0,0 +1,354 @@
+import argparse
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from ..database import SerializedWriter
+from ..metrics import counter, time_stage
+from ..models import SignalRollup, SignalSnapshot
+from .clock import Clock, get_clock
+from .scheduler import parse_interval
+
+RETENTION_ROWS_PRUNED = counter("retention_rows_pruned_total", "Raw signal snapshots rolled up and deleted.")
+RETENTION_BYTES_RECLAIMED = counter(
+    "retention_bytes_reclaimed_total", "Database bytes returned to the filesystem by incremental vacuum."
+)
+
+RETENTION_RUN_FAILURES = counter(
+    "retention_run_failures_total", "Retention runs that raised; the job carries on at its next run."
+)
+logger = logging.getLogger(__name__)
+
+RollupKey = Tuple[int, str, datetime]
+
+
+@dataclass
+class RetentionReport:
+    started_at: datetime
+    cutoff: datetime
+    rows_pruned: int
+    buckets_updated: int
+    batches: int
+    bytes_reclaimed: int
+    duration_seconds: float
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def floor_time(value: datetime, interval: timedelta) -> datetime:
+    epoch = datetime(1970, 1, 1)
+    return epoch + ((value - epoch) // interval) * interval
+
+
+def rollup_frame(rows: pd.DataFrame, interval: timedelta) -> pd.DataFrame:
+    """Aggregate snapshot rows (sorted by timestamp) into one row per strategy, symbol and bucket."""
+
+    rows = rows.assign(
+        bucket=rows["timestamp"].dt.floor(pd.Timedelta(interval)),
+        buy=(rows["signal"] == "BUY").astype(int),
+        sell=(rows["signal"] == "SELL").astype(int),
+        hold=(rows["signal"] == "HOLD").astype(int),
+    )
+    return rows.groupby(["strategy_id", "symbol", "bucket"], sort=False).agg(
+        samples=("id", "size"),
+        buy_count=("buy", "sum"),
+        sell_count=("sell", "sum"),
+        hold_count=("hold", "sum"),
+        first_at=("timestamp", "first"),
+        last_at=("timestamp", "last"),
+        open_price=("price", "first"),
+        high_price=("price", "max"),
+        low_price=("price", "min"),
+        close_price=("price", "last"),
+        last_signal=("signal", "last"),
+        last_indicators=("indicators", "last"),
+    )
+
+
+def _merge(rollup: SignalRollup, row: Dict[str, Any]) -> None:
+    rollup.samples += int(row["samples"])
+    rollup.buy_count += int(row["buy_count"])
+    rollup.sell_count += int(row["sell_count"])
+    rollup.hold_count += int(row["hold_count"])
+    rollup.high_price = max(rollup.high_price, float(row["high_price"]))
+    rollup.low_price = min(rollup.low_price, float(row["low_price"]))
+    if row["first_at"] < rollup.first_at:
+        rollup.first_at, rollup.open_price = row["first_at"], float(row["open_price"])
+    if row["last_at"] >= rollup.last_at:
+        rollup.last_at, rollup.close_price = row["last_at"], float(row["close_price"])
+        rollup.last_signal, rollup.last_indicators = row["last_signal"], row["last_indicators"]
+
+
+class RetentionJob:
+    """Roll raw signal snapshots older than ``raw_max_age`` into bucket aggregates and delete them.
+
+    Rows are processed oldest first in batches of ``batch_size``; each batch is
+    rolled up, merged into ``signal_rollups`` and deleted in its own short
+    transaction through ``writer``, so API writers never wait behind one long lock. On SQLite the
+    freed pages are then returned with ``PRAGMA incremental_vacuum``, at most
+    ``vacuum_pages`` per run. A database not in incremental auto-vacuum mode keeps
+    its free pages for reuse: converting it takes a full ``VACUUM`` that rewrites
+    the file under the write lock, so it is left to the explicit maintenance
+    command (``python -m app.services.retention --enable-incremental-vacuum``).
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        raw_max_age: timedelta = timedelta(days=7),
+        rollup_interval: str = "1h",
+        batch_size: int = 2000,
+        vacuum_pages: int = 10_000,
+        clock: Optional[Clock] = None,
+        writer: Optional[SerializedWriter] = None,
+        history_size: int = 50,
+    ):
+        if batch_size < 1:
+            raise ValueError("Retention batch size must be at least 1")
+        self.session_factory = session_factory
+        self.raw_max_age = raw_max_age
+        self.rollup_resolution = rollup_interval
+        self.rollup_interval = parse_interval(rollup_interval)
+        self.batch_size = batch_size
+        self.vacuum_pages = vacuum_pages
+        self.clock = clock or get_clock()
+        self.writer = writer or SerializedWriter(enabled=False)
+        self.reports: Deque[RetentionReport] = deque(maxlen=history_size)
+        self._task: Optional[asyncio.Task] = None
+
+    def cutoff(self, now: datetime) -> datetime:
+        """Raw rows before this instant are pruned; it falls on a bucket boundary so buckets close whole."""
+
+        return floor_time(now - self.raw_max_age, self.rollup_interval)
+
+    def prune_batch(self, db: Session, cutoff: datetime) -> Tuple[int, int]:
+        """Roll up and delete one batch; returns ``(rows_pruned, buckets_updated)``."""
+
+        columns = [
+            SignalSnapshot.id,
+            SignalSnapshot.strategy_id,
+            SignalSnapshot.symbol,
+            SignalSnapshot.timestamp,
+            SignalSnapshot.signal,
+            SignalSnapshot.price,
+            SignalSnapshot.indicators,
+        ]
+        rows = (
+            db.query(*columns)
+            .filter(SignalSnapshot.timestamp < cutoff)
+            .order_by(SignalSnapshot.timestamp.asc(), SignalSnapshot.id.asc())
+            .limit(self.batch_size)
+            .all()
+        )
+        if not rows:
+            return 0, 0
+        frame = pd.DataFrame(rows, columns=[column.key for column in columns])
+        frame["timestamp"] = pd.to_datetime(frame["timestamp"])
+        rollups = rollup_frame(frame, self.rollup_interval)
+
+        buckets = sorted({key[2].to_pydatetime() for key in rollups.index})
+        existing: Dict[RollupKey, SignalRollup] = {
+            (rollup.strategy_id, rollup.symbol, rollup.bucket): rollup
+            for rollup in db.query(SignalRollup).filter(
+                SignalRollup.resolution == self.rollup_resolution,
+                SignalRollup.bucket.in_(buckets),
+            )
+        }
+        for (strategy_id, symbol, bucket), values in rollups.iterrows():
+            row = {
+                **values.to_dict(),
+                "first_at": values["first_at"].to_pydatetime(),
+                "last_at": values["last_at"].to_pydatetime(),
+            }
+            key = (int(strategy_id), symbol, bucket.to_pydatetime())
+            rollup = existing.get(key)
+            if rollup is None:
+                db.add(
+                    SignalRollup(
+                        strategy_id=key[0],
+                        symbol=symbol,
+                        resolution=self.rollup_resolution,
+                        bucket=key[2],
+                        samples=int(row["samples"]),
+                        buy_count=int(row["buy_count"]),
+                        sell_count=int(row["sell_count"]),
+                        hold_count=int(row["hold_count"]),
+                        first_at=row["first_at"],
+                        last_at=row["last_at"],
+                        open_price=float(row["open_price"]),
+                        high_price=float(row["high_price"]),
+                        low_price=float(row["low_price"]),
+                        close_price=float(row["close_price"]),
+                        last_signal=row["last_signal"],
+                        last_indicators=row["last_indicators"],
+                    )
+                )
+            else:
+                _merge(rollup, row)
+
+        ids = frame["id"].tolist()
+        db.query(SignalSnapshot).filter(SignalSnapshot.id.in_(ids)).delete(synchronize_session=False)
+        with time_stage("db_commit"):
+            db.commit()
+        return len(ids), len(rollups)
+
+    def vacuum(self, engine: Engine) -> int:
+        """Return free pages to the filesystem (SQLite in incremental mode only); returns bytes reclaimed."""
+
+        if engine.dialect.name != "sqlite":
+            return 0
+        connection = engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            if _pragma(cursor, "auto_vacuum") != 2:
+                return 0
+            before = _database_bytes(cursor)
+            # executescript steps the pragma to completion; execute() frees a single page.
+            cursor.executescript(f"PRAGMA incremental_vacuum({int(self.vacuum_pages)});")
+            return max(before - _database_bytes(cursor), 0)
+        finally:
+            connection.close()
+
+    def run(self) -> RetentionReport:
+        started = time.perf_counter()
+        now = self.clock.now()
+        cutoff = self.cutoff(now)
+        rows_pruned = buckets = batches = 0
+        with time_stage("retention"), self.session_factory() as db:
+            while True:
+                with self.writer.transaction():
+                    pruned, updated = self.prune_batch(db, cutoff)
+                if not pruned:
+                    break
+                rows_pruned += pruned
+                buckets += updated
+                batches += 1
+            engine = db.get_bind()
+        with self.writer.transaction():
+            reclaimed = self.vacuum(engine)
+
+        RETENTION_ROWS_PRUNED.inc(rows_pruned)
+        RETENTION_BYTES_RECLAIMED.inc(reclaimed)
+        report = RetentionReport(
+            started_at=now,
+            cutoff=cutoff,
+            rows_pruned=rows_pruned,
+            buckets_updated=buckets,
+            batches=batches,
+            bytes_reclaimed=reclaimed,
+            duration_seconds=time.perf_counter() - started,
+        )
+        self.reports.append(report)
+        return report
+
+    async def run_forever(self, every: timedelta) -> None:
+        while True:
+            await self.clock.sleep(every.total_seconds())
+            try:
+                await asyncio.to_thread(self.run)
+            except Exception:
+                RETENTION_RUN_FAILURES.inc()
+                logger.exception("Signal retention run failed")
+
+    def start(self, every: timedelta) -> asyncio.Task:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run_forever(every))
+        return self._task
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+def _pragma(cursor, name: str) -> int:
+    return cursor.execute(f"PRAGMA {name}").fetchone()[0]
+
+
+def _database_bytes(cursor) -> int:
+    return _pragma(cursor, "page_count") * _pragma(cursor, "page_size")
+
+
+def enable_incremental_vacuum(engine: Engine) -> int:
+    """Switch an existing SQLite database to incremental auto-vacuum; returns bytes reclaimed.
+
+    This runs a full ``VACUUM``: the whole file is rewritten while every other
+    writer waits, so run it in a maintenance window, not from the scheduled job.
+    """
+
+    if engine.dialect.name != "sqlite":
+        return 0
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        if _pragma(cursor, "auto_vacuum") == 2:
+            return 0
+        before = _database_bytes(cursor)
+        cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        cursor.execute("VACUUM")
+        return max(before - _database_bytes(cursor), 0)
+    finally:
+        connection.close()
+
+
+_job: Optional[RetentionJob] = None
+
+
+def get_retention_job() -> Optional[RetentionJob]:
+    return _job
+
+
+def set_retention_job(job: Optional[RetentionJob]) -> None:
+    global _job
+    _job = job
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    from ..config import get_settings
+    from ..database import get_database
+
+    parser = argparse.ArgumentParser(description="Signal snapshot retention maintenance")
+    parser.add_argument(
+        "--enable-incremental-vacuum",
+        action="store_true",
+        help="Convert the database to incremental auto-vacuum with a one-off full VACUUM (blocks writers)",
+    )
+    parser.add_argument("--run", action="store_true", help="Roll up and prune old snapshots once")
+    args = parser.parse_args(argv)
+    if not (args.enable_incremental_vacuum or args.run):
+        parser.error("nothing to do: pass --enable-incremental-vacuum and/or --run")
+
+    database = get_database()
+    if args.enable_incremental_vacuum:
+        with database.writer.transaction():
+            reclaimed = enable_incremental_vacuum(database.engine)
+        print(f"incremental auto-vacuum enabled, {reclaimed} bytes reclaimed")
+    if args.run:
+        settings = get_settings()
+        job = RetentionJob(
+            database.session_factory,
+            raw_max_age=timedelta(days=settings.retention_raw_days),
+            rollup_interval=settings.retention_rollup_interval,
+            batch_size=settings.retention_batch_size,
+            vacuum_pages=settings.retention_vacuum_pages,
+            writer=database.writer,
+        )
+        print(job.run().as_dict())
+
+
+if __name__ == "__main__":
+    main()
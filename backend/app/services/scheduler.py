@@ -0,0 +1,206 @@
+import asyncio
+import logging
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from ..metrics import counter, histogram, record_rows
+from ..schemas import StrategyParams
+from .clock import Clock, get_clock
+from .strategy import StrategyEngine, StrategyResult, evaluate_strategies
+
+SCHEDULER_LAG_SECONDS = histogram(
+    "scheduler_lag_seconds",
+    "Delay between a bar-close boundary and the scheduler waking up.",
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+SCHEDULER_CYCLE_SECONDS = histogram(
+    "scheduler_cycle_seconds",
+    "Wall time spent fetching, evaluating and persisting one scheduler cycle.",
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+SCHEDULER_CYCLE_FAILURES = counter(
+    "scheduler_cycle_failures_total", "Scheduler cycles that raised; the scheduler carries on at the next bar."
+)
+logger = logging.getLogger(__name__)
+
+_INTERVAL_PATTERN = re.compile(r"^(\d+)\s*(m|min|h|d|wk)$")
+_INTERVAL_UNITS = {"m": "minutes", "min": "minutes", "h": "hours", "d": "days", "wk": "weeks"}
+
+
+def parse_interval(interval: str) -> timedelta:
+    match = _INTERVAL_PATTERN.match(interval.strip().lower())
+    if not match:
+        raise ValueError(f"Unsupported candles interval '{interval}'")
+    amount, unit = match.groups()
+    return timedelta(**{_INTERVAL_UNITS[unit]: int(amount)})
+
+
+def next_boundary(now: datetime, interval: timedelta) -> datetime:
+    epoch = datetime(1970, 1, 1)
+    elapsed = (now - epoch) // interval
+    return epoch + (elapsed + 1) * interval
+
+
+@dataclass
+class PrecomputedSignal:
+    symbol: str
+    strategy_id: int
+    result: StrategyResult
+    bar_timestamp: datetime
+    computed_at: datetime
+
+
+@dataclass
+class CycleStats:
+    boundary: datetime
+    lag_seconds: float
+    duration_seconds: float
+    pairs: int
+    failures: Dict[str, str] = field(default_factory=dict)
+
+
+Fetcher = Callable[[str, datetime, datetime], pd.DataFrame]
+Persister = Callable[[List[PrecomputedSignal]], None]
+Publisher = Callable[[List[PrecomputedSignal]], object]
+
+
+class SignalScheduler:
+    def __init__(
+        self,
+        fetcher: Fetcher,
+        interval: str,
+        persist: Optional[Persister] = None,
+        publish: Optional[Publisher] = None,
+        clock: Optional[Clock] = None,
+        max_concurrency: int = 4,
+        lookback: timedelta = timedelta(days=30),
+        history_size: int = 100,
+    ):
+        self.fetcher = fetcher
+        self.interval = parse_interval(interval)
+        self.persist = persist
+        self.publish = publish
+        self.clock = clock or get_clock()
+        self.max_concurrency = max_concurrency
+        self.lookback = lookback
+        self.pairs: Dict[Tuple[str, int], StrategyEngine] = {}
+        self.latest: Dict[Tuple[str, int], PrecomputedSignal] = {}
+        self.cycles: Deque[CycleStats] = deque(maxlen=history_size)
+        self._task: Optional[asyncio.Task] = None
+
+    def track(self, symbol: str, strategy_id: int, params: StrategyParams) -> None:
+        self.pairs[(symbol, strategy_id)] = StrategyEngine(params)
+        self.latest.pop((symbol, strategy_id), None)
+
+    def untrack(self, symbol: str, strategy_id: int) -> None:
+        self.pairs.pop((symbol, strategy_id), None)
+        self.latest.pop((symbol, strategy_id), None)
+
+    def get_latest(self, symbol: str, strategy_id: int) -> Optional[PrecomputedSignal]:
+        entry = self.latest.get((symbol, strategy_id))
+        if entry is None or self.clock.now() - entry.computed_at >= self.interval:
+            return None
+        return entry
+
+    async def _fetch(self, semaphore: asyncio.Semaphore, symbol: str, end: datetime) -> pd.DataFrame:
+        async with semaphore:
+            return await asyncio.to_thread(self.fetcher, symbol, end - self.lookback, end)
+
+    async def run_cycle(self, boundary: Optional[datetime] = None) -> CycleStats:
+        started = time.perf_counter()
+        now = self.clock.now()
+        boundary = boundary or now
+        lag = max((now - boundary).total_seconds(), 0.0)
+        SCHEDULER_LAG_SECONDS.observe(lag)
+
+        symbols = sorted({symbol for symbol, _ in self.pairs})
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        fetched = await asyncio.gather(
+            *(self._fetch(semaphore, symbol, now) for symbol in symbols), return_exceptions=True
+        )
+        candles_by_symbol = dict(zip(symbols, fetched))
+
+        failures: Dict[str, str] = {}
+        computed: List[PrecomputedSignal] = []
+        for symbol, candles in candles_by_symbol.items():
+            if isinstance(candles, BaseException):
+                failures[symbol] = str(candles)
+                continue
+            engines = {
+                strategy_id: engine for (pair_symbol, strategy_id), engine in self.pairs.items() if pair_symbol == symbol
+            }
+            try:
+                results = evaluate_strategies(candles, engines)
+            except ValueError as exc:
+                failures[symbol] = str(exc)
+                continue
+            record_rows("scheduler", len(candles))
+            bar_timestamp = candles.index[-1].to_pydatetime()
+            for strategy_id, result in results.items():
+                entry = PrecomputedSignal(
+                    symbol=symbol,
+                    strategy_id=strategy_id,
+                    result=result,
+                    bar_timestamp=bar_timestamp,
+                    computed_at=now,
+                )
+                self.latest[(symbol, strategy_id)] = entry
+                computed.append(entry)
+
+        if computed and self.publish is not None:
+            self.publish(computed)
+        if computed and self.persist is not None:
+            await asyncio.to_thread(self.persist, computed)
+
+        duration = time.perf_counter() - started
+        SCHEDULER_CYCLE_SECONDS.observe(duration)
+        stats = CycleStats(
+            boundary=boundary, lag_seconds=lag, duration_seconds=duration, pairs=len(computed), failures=failures
+        )
+        self.cycles.append(stats)
+        return stats
+
+    async def run_forever(self) -> None:
+        while True:
+            boundary = next_boundary(self.clock.now(), self.interval)
+            delay = (boundary - self.clock.now()).total_seconds()
+            if delay > 0:
+                await self.clock.sleep(delay)
+            try:
+                await self.run_cycle(boundary)
+            except Exception:
+                SCHEDULER_CYCLE_FAILURES.inc()
+                logger.exception("Signal scheduler cycle for %s failed", boundary)
+
+    def start(self) -> asyncio.Task:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run_forever())
+        return self._task
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+_scheduler: Optional[SignalScheduler] = None
+
+
+def get_scheduler() -> Optional[SignalScheduler]:
+    return _scheduler
+
+
+def set_scheduler(scheduler: Optional[SignalScheduler]) -> None:
+    global _scheduler
+    _scheduler = scheduler
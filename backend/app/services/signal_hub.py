@@ -0,0 +1,118 @@
+import asyncio
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from ..config import get_settings
+from ..metrics import counter, gauge
+from ..schemas import SignalIndicators, SignalResponse
+from .scheduler import PrecomputedSignal
+
+SIGNAL_SUBSCRIBERS = gauge("signal_subscribers", "Open signal push connections.")
+SIGNAL_MESSAGES = counter(
+    "signal_push_messages_total", "Signal push messages per outcome (sent or dropped).", ("result",)
+)
+
+Channel = Tuple[str, int]
+
+
+class Subscriber:
+    """One push connection: its channels and a bounded queue of serialized messages.
+
+    When a slow consumer lets the queue fill up, the oldest message is dropped so
+    the client always catches up to the most recent signals.
+    """
+
+    def __init__(self, max_queue: int = 32):
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=max_queue)
+        self.channels: Set[Channel] = set()
+        self.dropped = 0
+
+    def offer(self, message: str) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+            SIGNAL_MESSAGES.labels("dropped").inc()
+        self.queue.put_nowait(message)
+
+    async def next_message(self) -> str:
+        message = await self.queue.get()
+        SIGNAL_MESSAGES.labels("sent").inc()
+        return message
+
+
+class SignalHub:
+    """Fan out precomputed signals to every subscriber of a ``(symbol, strategy_id)`` channel.
+
+    Each signal is serialized once per publish, however many connections receive it.
+    ``publish`` must be called from the event loop that owns the subscriber queues.
+    """
+
+    def __init__(self, max_queue: int = 32):
+        self.max_queue = max_queue
+        self.channels: Dict[Channel, Set[Subscriber]] = {}
+        self.subscribers: Set[Subscriber] = set()
+
+    def connect(self) -> Subscriber:
+        subscriber = Subscriber(self.max_queue)
+        self.subscribers.add(subscriber)
+        SIGNAL_SUBSCRIBERS.set(len(self.subscribers))
+        return subscriber
+
+    def disconnect(self, subscriber: Subscriber) -> None:
+        for channel in list(subscriber.channels):
+            self.unsubscribe(subscriber, channel)
+        self.subscribers.discard(subscriber)
+        SIGNAL_SUBSCRIBERS.set(len(self.subscribers))
+
+    def subscribe(self, subscriber: Subscriber, channel: Channel) -> None:
+        self.channels.setdefault(channel, set()).add(subscriber)
+        subscriber.channels.add(channel)
+
+    def unsubscribe(self, subscriber: Subscriber, channel: Channel) -> None:
+        subscriber.channels.discard(channel)
+        members = self.channels.get(channel)
+        if members is None:
+            return
+        members.discard(subscriber)
+        if not members:
+            del self.channels[channel]
+
+    def publish(self, signals: Iterable[PrecomputedSignal]) -> int:
+        """Queue each signal for its channel's subscribers; returns messages queued."""
+
+        queued = 0
+        for item in signals:
+            members = self.channels.get((item.symbol, item.strategy_id))
+            if not members:
+                continue
+            message = signal_message(item)
+            for subscriber in members:
+                subscriber.offer(message)
+            queued += len(members)
+        return queued
+
+
+def signal_message(item: PrecomputedSignal) -> str:
+    payload = SignalResponse(
+        symbol=item.symbol,
+        strategy_id=item.strategy_id,
+        signal=item.result.signal,
+        price=item.result.price,
+        timestamp=item.computed_at,
+        indicators=SignalIndicators(**item.result.indicators),
+    )
+    return '{"type":"signal","data":' + payload.json() + "}"
+
+
+_hub: Optional[SignalHub] = None
+
+
+def get_signal_hub() -> SignalHub:
+    global _hub
+    if _hub is None:
+        _hub = SignalHub(get_settings().signal_push_queue_size)
+    return _hub
+
+
+def set_signal_hub(hub: Optional[SignalHub]) -> None:
+    global _hub
+    _hub = hub
@@ -1,13 +1,29 @@
 from datetime import datetime
 from typing import Dict, List
 
+import numpy as np
 import pandas as pd
 
+from trading_bot.analytics import compute_performance, periods_per_year
+
 from ..config import get_settings
-from ..schemas import EquityPoint, SimulationRunRequest, StrategyParams
+from ..metrics import record_rows, time_stage
+from ..schemas import SimulationRunRequest, StrategyParams
 from .strategy import StrategyEngine
 
 
+def analytics_from_stored(equity_curve: List[Dict], trades: List[Dict]) -> Dict:
+    """Recompute analytics from a persisted equity curve and trade ledger."""
+
+    timestamps = [point["timestamp"] for point in equity_curve]
+    report = compute_performance(
+        np.asarray([point["equity"] for point in equity_curve], dtype=float),
+        [trade["pnl"] for trade in trades],
+        periods=periods_per_year(pd.to_datetime(timestamps)),
+    )
+    return report.as_dict()
+
+
 class SimulationEngine:
     def __init__(self, params: StrategyParams):
         self.params = params
@@ -17,6 +33,12 @@ class SimulationEngine:
     def run(self, candles: pd.DataFrame, request: SimulationRunRequest) -> Dict:
         if candles.empty:
             raise ValueError("No candles to simulate")
+        with time_stage("simulation_run"):
+            results = self._run(candles, request)
+        record_rows("simulation_run", len(candles))
+        return results
+
+    def _run(self, candles: pd.DataFrame, request: SimulationRunRequest) -> Dict:
         warmup = max(self.params.sma_fast, self.params.sma_slow, self.params.rsi_period)
         balance = request.starting_balance
         position = 0
@@ -25,18 +47,21 @@ class SimulationEngine:
         position_size = 0.0
         total_trades = 0
         profitable_trades = 0
-        equity_curve: List[Dict] = []
+        timestamps: List[datetime] = []
+        equity: List[float] = []
+        positions: List[int] = []
+        traded_notional = 0.0
         trades: List[Dict] = []
-        peak_equity = balance
-        max_drawdown = 0.0
 
         for idx in range(len(candles)):
             window = candles.iloc[: idx + 1]
             timestamp = candles.index[idx].to_pydatetime()
             price = float(candles.iloc[idx]["close"])
 
+            timestamps.append(timestamp)
             if len(window) < warmup:
-                equity_curve.append({"timestamp": timestamp, "equity": balance, "drawdown": 0.0})
+                equity.append(balance)
+                positions.append(0)
                 continue
 
             result = self.strategy_engine.compute(window)
@@ -52,6 +77,7 @@ class SimulationEngine:
                 if position != 0:
                     realized = (price - entry_price) * position * position_size
                     balance += realized
+                    traded_notional += price * position_size
                     total_trades += 1
                     if realized > 0:
                         profitable_trades += 1
@@ -76,22 +102,22 @@ class SimulationEngine:
                     entry_price = price
                     entry_time = timestamp
                     position_size = balance * 0.01
+                    traded_notional += price * position_size
 
             if position != 0:
                 current_equity = balance + (price - entry_price) * position * position_size
             else:
                 current_equity = balance
 
-            peak_equity = max(peak_equity, current_equity)
-            drawdown = (peak_equity - current_equity) / peak_equity if peak_equity > 0 else 0.0
-            max_drawdown = max(max_drawdown, drawdown)
-            equity_curve.append({"timestamp": timestamp, "equity": current_equity, "drawdown": drawdown})
+            equity.append(current_equity)
+            positions.append(position)
 
         if position != 0:
             price = float(candles.iloc[-1]["close"])
             timestamp = candles.index[-1].to_pydatetime()
             realized = (price - entry_price) * position * position_size
             balance += realized
+            traded_notional += price * position_size
             total_trades += 1
             if realized > 0:
                 profitable_trades += 1
@@ -110,22 +136,27 @@ class SimulationEngine:
             position_size = 0.0
             entry_time = None
 
-        final_equity = balance
-        win_rate = (profitable_trades / total_trades) if total_trades > 0 else 0.0
-
+        report = compute_performance(
+            np.asarray(equity),
+            [trade["pnl"] for trade in trades],
+            position=positions,
+            traded_notional=traded_notional,
+            periods=periods_per_year(candles.index),
+        )
         equity_points = [
-            EquityPoint(timestamp=item["timestamp"], equity=item["equity"], drawdown=item["drawdown"]).dict()
-            for item in equity_curve
+            {"timestamp": timestamp.isoformat(), "equity": value, "drawdown": float(drawdown)}
+            for timestamp, value, drawdown in zip(timestamps, equity, report.drawdown)
         ]
 
         return {
-            "final_balance": final_equity,
-            "max_drawdown": max_drawdown,
-            "win_rate": win_rate,
+            "final_balance": balance,
+            "max_drawdown": report.max_drawdown,
+            "win_rate": report.win_rate,
             "total_trades": total_trades,
             "profitable_trades": profitable_trades,
             "equity_curve": equity_points,
             "trades": trades,
+            "analytics": report.as_dict(),
         }
 
     def _signal_to_position(self, signal: str) -> int:
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, Hashable, List, Mapping, Optional
 
 import pandas as pd
 
+from ..metrics import time_stage
 from ..schemas import StrategyParams
+from .indicators import IndicatorCache, IndicatorPlan, IndicatorSpec, indicator_cache, strategy_indicators
 
 
 @dataclass
@@ -16,21 +18,23 @@ class StrategyResult:
 class StrategyEngine:
     def __init__(self, params: StrategyParams):
         self.params = params
+        self.indicator_specs = strategy_indicators(params)
 
-    def compute(self, candles: pd.DataFrame) -> StrategyResult:
+    def compute(
+        self, candles: pd.DataFrame, indicators: Optional[Mapping[IndicatorSpec, pd.Series]] = None
+    ) -> StrategyResult:
         if candles.empty:
             raise ValueError("No candles provided")
 
-        close = candles["close"]
-        sma_fast = close.rolling(window=self.params.sma_fast).mean()
-        sma_slow = close.rolling(window=self.params.sma_slow).mean()
-        delta = close.diff()
-        gain = delta.clip(lower=0)
-        loss = -delta.clip(upper=0)
-        avg_gain = gain.rolling(window=self.params.rsi_period).mean()
-        avg_loss = loss.rolling(window=self.params.rsi_period).mean()
-        rs = avg_gain / avg_loss.replace({0: float("inf")})
-        rsi = 100 - (100 / (1 + rs))
+        with time_stage("strategy_compute"):
+            if indicators is None:
+                indicators = IndicatorPlan(self.indicator_specs.values()).compute(candles)
+            return self._compute(candles, indicators)
+
+    def _compute(self, candles: pd.DataFrame, indicators: Mapping[IndicatorSpec, pd.Series]) -> StrategyResult:
+        sma_fast = indicators[self.indicator_specs["sma_fast"]]
+        sma_slow = indicators[self.indicator_specs["sma_slow"]]
+        rsi = indicators[self.indicator_specs["rsi"]]
 
         latest = candles.iloc[-1]
         latest_sma_fast = float(sma_fast.iloc[-1])
@@ -68,3 +72,15 @@ class StrategyEngine:
             result = self.compute(window)
             results.append(result)
         return results
+
+
+def evaluate_strategies(
+    candles: pd.DataFrame,
+    engines: Mapping[Hashable, StrategyEngine],
+    cache: Optional[IndicatorCache] = indicator_cache,
+) -> Dict[Hashable, StrategyResult]:
+    if candles.empty:
+        raise ValueError("No candles provided")
+    plan = IndicatorPlan.for_strategies(engine.params for engine in engines.values())
+    indicators = plan.compute(candles, cache=cache)
+    return {key: engine.compute(candles, indicators) for key, engine in engines.items()}
@@ -0,0 +1,116 @@
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from ..metrics import record_cache
+from ..models import Strategy
+from ..schemas import StrategyParams
+from .simulation import SimulationEngine
+from .strategy import StrategyEngine
+
+
+@dataclass(frozen=True)
+class StrategyEntry:
+    """A strategy row with its validated parameters and ready-to-use engines.
+
+    ``parameters`` is the stored JSON and must be treated as read-only.
+    """
+
+    id: int
+    name: str
+    updated_at: Optional[datetime]
+    parameters: Dict[str, Any]
+    params: StrategyParams
+    engine: StrategyEngine
+    simulation: SimulationEngine
+    warmup: int
+
+    @classmethod
+    def from_row(cls, strategy: Strategy) -> "StrategyEntry":
+        params = StrategyParams(**strategy.parameters)
+        return cls(
+            id=strategy.id,
+            name=strategy.name,
+            updated_at=strategy.updated_at,
+            parameters=dict(strategy.parameters),
+            params=params,
+            engine=StrategyEngine(params),
+            simulation=SimulationEngine(params),
+            warmup=max(params.sma_fast, params.sma_slow, params.rsi_period),
+        )
+
+
+class StrategyRegistry:
+    """Process-wide cache of strategies, keyed by id and ``updated_at``.
+
+    The first lookup loads every strategy through the caller's session; later
+    lookups are dictionary reads with no query and no pydantic validation.
+    :meth:`invalidate` marks the registry stale after a strategy is written, and
+    the next lookup reloads the rows but reuses every entry whose ``updated_at``
+    is unchanged. The cache follows the session's engine, so a request bound
+    to a different database starts from scratch. Writes made by other processes
+    are only seen after an invalidation in this one.
+    """
+
+    def __init__(self):
+        self._entries: Dict[int, StrategyEntry] = {}
+        self._bind: Any = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _ensure_loaded(self, db: Session) -> None:
+        bind = db.get_bind()
+        fresh = self._loaded and bind is self._bind
+        record_cache("strategy_registry", fresh)
+        if fresh:
+            return
+        with self._lock:
+            if self._loaded and bind is self._bind:
+                return
+            previous = self._entries if bind is self._bind else {}
+            entries: Dict[int, StrategyEntry] = {}
+            for strategy in db.query(Strategy).order_by(Strategy.id.asc()):
+                cached = previous.get(strategy.id)
+                if cached is not None and cached.updated_at == strategy.updated_at:
+                    entries[strategy.id] = cached
+                else:
+                    entries[strategy.id] = StrategyEntry.from_row(strategy)
+            self._entries, self._bind, self._loaded = entries, bind, True
+
+    def get(self, db: Session, strategy_id: Optional[int] = None) -> Optional[StrategyEntry]:
+        """The strategy with ``strategy_id``, or the default (lowest id) one when omitted."""
+
+        self._ensure_loaded(db)
+        if strategy_id is None:
+            return next(iter(self._entries.values()), None)
+        return self._entries.get(strategy_id)
+
+    def all(self, db: Session) -> List[StrategyEntry]:
+        self._ensure_loaded(db)
+        return list(self._entries.values())
+
+    def invalidate(self, strategy_id: Optional[int] = None) -> None:
+        """Reload on the next lookup; ``strategy_id``'s entry is rebuilt even if its timestamp matches."""
+
+        with self._lock:
+            if strategy_id is not None and strategy_id in self._entries:
+                self._entries = {key: entry for key, entry in self._entries.items() if key != strategy_id}
+            self._loaded = False
+
+
+_registry: Optional[StrategyRegistry] = None
+
+
+def get_strategy_registry() -> StrategyRegistry:
+    global _registry
+    if _registry is None:
+        _registry = StrategyRegistry()
+    return _registry
+
+
+def set_strategy_registry(registry: Optional[StrategyRegistry]) -> None:
+    global _registry
+    _registry = registry
@@ -0,0 +1,144 @@
+"""Concurrent read/write benchmark for the SQLite storage profiles.
+
+Reader threads page through recent signal snapshots while writer threads insert
+new ones, against a fresh database per profile. Run it from ``backend/`` with
+``python -m app.storage_bench`` (``make bench-sqlite``).
+"""
+import argparse
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from .config import Settings
+from .database import SerializedWriter, StorageProfile, create_db_engine, storage_profile
+from .models import Base, SignalSnapshot, Strategy
+
+SYMBOLS = ("XAUUSD", "EURUSD", "GBPUSD", "USDJPY")
+
+
+def _snapshot(index: int, timestamp: datetime) -> SignalSnapshot:
+    return SignalSnapshot(
+        strategy_id=1,
+        symbol=SYMBOLS[index % len(SYMBOLS)],
+        timestamp=timestamp,
+        signal="HOLD",
+        indicators={"sma_fast": 1800.0, "sma_slow": 1799.0, "rsi": 50.0},
+        price=1800.0 + index % 100,
+    )
+
+
+def run_profile(
+    profile: StorageProfile,
+    path: Path,
+    readers: int = 8,
+    writers: int = 4,
+    duration: float = 3.0,
+    seed_rows: int = 20_000,
+) -> Dict[str, float]:
+    engine = create_db_engine(f"sqlite:///{path}", profile)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    gate = SerializedWriter(enabled=profile.serialize_writes)
+    start = datetime(2024, 1, 1)
+    with Session() as db:
+        db.add(Strategy(name="bench", parameters={}))
+        db.add_all(_snapshot(index, start + timedelta(seconds=index)) for index in range(seed_rows))
+        db.commit()
+
+    deadline = time.perf_counter() + duration
+    counts = {"reads": 0, "writes": 0, "read_errors": 0, "write_errors": 0}
+    write_latencies: List[float] = []
+    lock = threading.Lock()
+
+    def read_loop(worker: int) -> None:
+        reads = errors = 0
+        symbol = SYMBOLS[worker % len(SYMBOLS)]
+        while time.perf_counter() < deadline:
+            try:
+                with Session() as db:
+                    db.query(SignalSnapshot).filter(SignalSnapshot.symbol == symbol).order_by(
+                        SignalSnapshot.timestamp.desc()
+                    ).limit(50).all()
+                reads += 1
+            except OperationalError:
+                errors += 1
+        with lock:
+            counts["reads"] += reads
+            counts["read_errors"] += errors
+
+    def write_loop(worker: int) -> None:
+        writes = errors = 0
+        latencies: List[float] = []
+        index = seed_rows + worker
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                with Session() as db:
+                    db.add(_snapshot(index, start + timedelta(seconds=index)))
+                    gate.commit(db)
+                writes += 1
+                latencies.append(time.perf_counter() - started)
+            except OperationalError:
+                errors += 1
+            index += writers
+        with lock:
+            counts["writes"] += writes
+            counts["write_errors"] += errors
+            write_latencies.extend(latencies)
+
+    threads = [threading.Thread(target=read_loop, args=(worker,)) for worker in range(readers)]
+    threads += [threading.Thread(target=write_loop, args=(worker,)) for worker in range(writers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    engine.dispose()
+
+    return {
+        "reads_per_second": counts["reads"] / elapsed,
+        "writes_per_second": counts["writes"] / elapsed,
+        "read_errors": float(counts["read_errors"]),
+        "write_errors": float(counts["write_errors"]),
+        "write_p99_ms": float(np.percentile(write_latencies, 99) * 1000) if write_latencies else 0.0,
+    }
+
+
+def benchmark(
+    profiles=("default", "production"), readers: int = 8, writers: int = 4, duration: float = 3.0
+) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory(prefix="sqlite-bench-") as workdir:
+        for name in profiles:
+            profile = storage_profile(Settings(database_profile=name))
+            results[name] = run_profile(profile, Path(workdir) / f"{name}.db", readers, writers, duration)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Dict[str, float]]:
+    parser = argparse.ArgumentParser(description="Compare SQLite read/write throughput per storage profile")
+    parser.add_argument("--readers", type=int, default=8, help="Concurrent reader threads")
+    parser.add_argument("--writers", type=int, default=4, help="Concurrent writer threads")
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds per profile")
+    args = parser.parse_args(argv)
+
+    results = benchmark(readers=args.readers, writers=args.writers, duration=args.duration)
+    print(f"{'profile':<12}{'reads/s':>10}{'writes/s':>10}{'read errs':>11}{'write errs':>12}{'write p99 ms':>14}")
+    for name, stats in results.items():
+        print(
+            f"{name:<12}{stats['reads_per_second']:>10.0f}{stats['writes_per_second']:>10.0f}"
+            f"{stats['read_errors']:>11.0f}{stats['write_errors']:>12.0f}{stats['write_p99_ms']:>14.1f}"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main()
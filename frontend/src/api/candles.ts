@@ -0,0 +1,31 @@
+import client from "./client";
+
+export type Resolution = "1h" | "4h" | "1d" | "1w";
+
+export interface ColumnarCandles {
+  symbol: string;
+  resolution: Resolution;
+  resolutions: Resolution[];
+  count: number;
+  t: number[];
+  o: number[];
+  h: number[];
+  l: number[];
+  c: number[];
+  v: number[];
+}
+
+export interface CandleQuery {
+  symbol?: string;
+  resolution?: Resolution;
+  maxPoints?: number;
+  from?: string;
+  to?: string;
+}
+
+export async function fetchCandles({ symbol = "XAUUSD", resolution, maxPoints = 1000, from, to }: CandleQuery = {}) {
+  const response = await client.get<ColumnarCandles>("/candles", {
+    params: { symbol, resolution, max_points: maxPoints, from, to }
+  });
+  return response.data;
+}
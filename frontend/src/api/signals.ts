@@ -33,3 +33,52 @@ export async function fetchSignalHistory(symbol = "XAUUSD") {
   });
   return response.data.history;
 }
+
+type SignalStreamMessage =
+  | { type: "signal"; data: SignalResponse }
+  | { type: "subscribed" | "unsubscribed"; symbol: string; strategy_id: number }
+  | { type: "error"; detail: string };
+
+function streamUrl(): string {
+  const base = import.meta.env.VITE_API_URL ?? "/api";
+  const url = new URL(`${base}/signals/stream`, window.location.href);
+  url.protocol = url.protocol === "https:" ? "wss:" : "ws:";
+  return url.toString();
+}
+
+export function subscribeToSignals(
+  onSignal: (signal: SignalResponse) => void,
+  symbol = "XAUUSD",
+  strategyId?: number
+): () => void {
+  let socket: WebSocket | null = null;
+  let retry: ReturnType<typeof setTimeout> | undefined;
+  let closed = false;
+
+  const connect = () => {
+    socket = new WebSocket(streamUrl());
+    socket.onopen = () => {
+      socket?.send(JSON.stringify({ action: "subscribe", symbol, strategy_id: strategyId ?? null }));
+    };
+    socket.onmessage = (event) => {
+      const message = JSON.parse(event.data) as SignalStreamMessage;
+      if (message.type === "signal") {
+        onSignal(message.data);
+      } else if (message.type === "error") {
+        console.error(message.detail);
+      }
+    };
+    socket.onclose = () => {
+      if (!closed) {
+        retry = setTimeout(connect, 5000);
+      }
+    };
+  };
+
+  connect();
+  return () => {
+    closed = true;
+    clearTimeout(retry);
+    socket?.close();
+  };
+}
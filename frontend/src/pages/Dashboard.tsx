@@ -1,6 +1,6 @@
 import { useEffect, useState } from "react";
 
-import { fetchLatestSignal, SignalResponse } from "../api/signals";
+import { fetchLatestSignal, SignalResponse, subscribeToSignals } from "../api/signals";
 import SignalCard from "../components/SignalCard";
 
 const Dashboard = () => {
@@ -23,6 +23,7 @@ const Dashboard = () => {
     };
 
     loadSignal();
+    return subscribeToSignals(setSignal);
   }, []);
 
   if (loading) {
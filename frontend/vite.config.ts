@@ -8,7 +8,8 @@ export default defineConfig({
     proxy: {
       "/api": {
         target: "http://backend:8000",
-        changeOrigin: true
+        changeOrigin: true,
+        ws: true
       }
     }
   }
@@ -2,46 +2,173 @@
 from __future__ import annotations
 
 import argparse
+import json
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from trading_bot.bot import TradingBot
-from trading_bot.data import PriceData, load_price_data, resample_prices
-from trading_bot.portfolio import Portfolio
-from trading_bot.strategy import MovingAverageCrossStrategy
+from trading_bot.dtypes import DTYPE_POLICIES
+
+# Everything that imports pandas is loaded by the commands that need it, so
+# ``--help`` and argument errors return without paying for it.
+if TYPE_CHECKING:
+    from trading_bot.bot import TradingBot
+    from trading_bot.data import PriceData
+    from trading_bot.profiling import RunProfiler
 
 
 def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run a moving average crossover trading bot")
-    parser.add_argument("data", type=Path, help="Path to a CSV file containing OHLCV data")
+    parser.add_argument("data", type=Path, nargs="?", help="Path to a CSV file containing OHLCV data")
     parser.add_argument("--short-window", type=int, default=10, help="Short moving average window")
     parser.add_argument("--long-window", type=int, default=30, help="Long moving average window")
     parser.add_argument("--resample", type=str, default=None, help="Optional pandas resample rule (e.g. '1H')")
     parser.add_argument("--starting-cash", type=float, default=10_000.0, help="Initial portfolio cash")
     parser.add_argument("--unit-size", type=float, default=1.0, help="Number of units to trade per signal")
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--dtype",
+        choices=sorted(DTYPE_POLICIES),
+        default="float64",
+        help="Storage dtype policy for prices and indicators (float32 halves memory)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record wall/CPU time, peak memory and throughput for each run stage",
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=Path,
+        default=None,
+        help="Optional path for a cProfile/pstats dump (implies --profile)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help="Save portfolio and strategy state to this file after the run",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue from --checkpoint, processing only bars after the checkpoint timestamp",
+    )
+    batch = parser.add_argument_group("batch mode")
+    batch.add_argument(
+        "--batch",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="Backtest every file matching this glob (repeatable); runs in parallel",
+    )
+    batch.add_argument(
+        "--manifest",
+        type=Path,
+        default=None,
+        help="CSV/JSON/JSONL manifest with a 'path' column and optional per-run parameters",
+    )
+    batch.add_argument(
+        "--param-sets",
+        type=Path,
+        default=None,
+        help="JSON list of parameter overrides applied to every --batch file",
+    )
+    batch.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    batch.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Write one result per run to this .jsonl or .csv file",
+    )
+    args = parser.parse_args(argv)
+    if args.data is None and not (args.batch or args.manifest):
+        parser.error("a data file, --batch or --manifest is required")
+    return args
 
 
 def build_bot(args: argparse.Namespace, price_data: PriceData) -> TradingBot:
-    strategy = MovingAverageCrossStrategy(short_window=args.short_window, long_window=args.long_window)
+    from trading_bot.bot import TradingBot
+    from trading_bot.portfolio import Portfolio
+    from trading_bot.strategy import MovingAverageCrossStrategy
+
+    strategy = MovingAverageCrossStrategy(
+        short_window=args.short_window, long_window=args.long_window, dtype=args.dtype
+    )
     portfolio = Portfolio(starting_cash=args.starting_cash, unit_size=args.unit_size)
     return TradingBot(strategy=strategy, portfolio=portfolio)
 
 
+def run_batch_mode(args: argparse.Namespace) -> dict:
+    from trading_bot.batch import BatchJob, ResultWriter, expand_jobs, load_manifest, stream_batch
+
+    base = BatchJob(
+        path="",
+        short_window=args.short_window,
+        long_window=args.long_window,
+        resample=args.resample,
+        starting_cash=args.starting_cash,
+        unit_size=args.unit_size,
+        dtype=args.dtype,
+    )
+    param_sets = json.loads(args.param_sets.read_text()) if args.param_sets else []
+    jobs = expand_jobs(args.batch, base, param_sets)
+    if args.manifest:
+        jobs.extend(load_manifest(args.manifest, base))
+    if not jobs:
+        raise SystemExit("No input files matched --batch/--manifest")
+
+    if args.output is None:
+        return {"runs": stream_batch(jobs, workers=args.workers, echo=lambda line: print(line, flush=True))}
+    with args.output.open("w", encoding="utf-8", newline="") as fh:
+        writer = ResultWriter(fh, fmt="csv" if args.output.suffix == ".csv" else "jsonl")
+        runs = stream_batch(jobs, workers=args.workers, writer=writer, echo=lambda line: print(line, flush=True))
+    return {"runs": runs, "output": str(args.output)}
+
+
 def main(argv: Optional[list[str]] = None) -> dict:
     args = parse_args(argv)
-    price_data = load_price_data(args.data)
+    if args.batch or args.manifest:
+        return run_batch_mode(args)
+    from trading_bot.checkpoint import Checkpoint
+    from trading_bot.data import load_price_data, resample_prices
+    from trading_bot.profiling import RunProfiler
+
+    profiler: Optional[RunProfiler] = None
+    if args.profile or args.profile_output:
+        profiler = RunProfiler(pstats_path=args.profile_output)
+
+    with profiler.stage("read_csv") if profiler else nullcontext():
+        price_data = load_price_data(args.data, dtype=args.dtype)
     if args.resample:
-        price_data = resample_prices(price_data, args.resample)
+        with profiler.stage("resample", rows=len(price_data.frame)) if profiler else nullcontext():
+            price_data = resample_prices(price_data, args.resample)
+
+    if args.resume and args.checkpoint is None:
+        raise SystemExit("--resume requires --checkpoint")
+    resume_from = Checkpoint.load(args.checkpoint) if args.resume else None
+    if args.resume and resume_from is None:
+        raise SystemExit(f"--resume: checkpoint {args.checkpoint} does not exist")
 
     bot = build_bot(args, price_data)
-    summary = bot.run(price_data)
+    bot.profiler = profiler
+    summary = bot.run(price_data, resume_from=resume_from)
+    if args.checkpoint is not None:
+        bot.checkpoint().save(args.checkpoint)
     print("Trading summary:")
     for key, value in summary.items():
         if key == "trades":
             print("Trades:")
             for trade in value:
                 print(f"  {trade['timestamp']} - {trade['action']} {trade['quantity']} @ {trade['price']}")
+        elif key == "profile":
+            print("Profile:")
+            for name, stage in value["stages"].items():
+                print(
+                    f"  {name}: wall={stage['wall_seconds']:.6f}s cpu={stage['cpu_seconds']:.6f}s "
+                    f"peak_mem={stage['peak_memory_bytes']}B rows/s={stage['rows_per_second']:.0f}"
+                )
+            if value["pstats_path"]:
+                print(f"  pstats written to {value['pstats_path']}")
         else:
             print(f"{key}: {value}")
     return summary
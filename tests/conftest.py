@@ -1,6 +1,52 @@
+import asyncio
 import sys
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
 
 ROOT = Path(__file__).resolve().parent.parent
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+BACKEND = ROOT / "backend"
+for path in (ROOT, BACKEND):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+
+class FakeClock:
+    """Clock double for services taking a ``clock``: ``sleep`` advances ``now`` instead of waiting."""
+
+    def __init__(self, current: datetime):
+        self.current = current
+        self.sleeps: List[float] = []
+
+    def now(self) -> datetime:
+        return self.current
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.current += timedelta(seconds=seconds)
+        await asyncio.sleep(0)
+
+
+def make_candles(
+    close: Optional[Sequence[float]] = None,
+    end: Optional[datetime] = None,
+    rows: int = 120,
+    freq: str = "h",
+) -> pd.DataFrame:
+    """Flat candles (open == high == low == close, unit volume) on a regular index.
+
+    ``close`` defaults to ``rows`` points of a sine wave around 100. The index
+    ends at ``end`` when given and starts on 2024-01-01 otherwise.
+    """
+
+    if close is None:
+        close = 100 + np.sin(np.arange(rows) / 5) * 5
+    close = np.asarray(close, dtype=float)
+    if end is not None:
+        index = pd.date_range(end=end, periods=len(close), freq=freq)
+    else:
+        index = pd.date_range("2024-01-01", periods=len(close), freq=freq)
+    return pd.DataFrame({"open": close, "high": close, "low": close, "close": close, "volume": 1.0}, index=index)
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.analytics import compute_performance, drawdown_series, portfolio_performance, streaks
+from trading_bot.bot import TradingBot
+from trading_bot.data import PriceData
+from trading_bot.portfolio import MultiAssetPortfolio, Portfolio
+from trading_bot.strategy import MovingAverageCrossStrategy
+
+
+def _looped_drawdown(equity):
+    peak, since, depths, durations = equity[0], 0, [], []
+    for i, value in enumerate(equity):
+        if value >= peak:
+            peak, since = value, i
+        depths.append((peak - value) / peak)
+        durations.append(i - since)
+    return np.array(depths), np.array(durations)
+
+
+def test_drawdown_and_streaks_match_reference_loops() -> None:
+    rng = np.random.default_rng(5)
+    equity = 1000 * np.exp(rng.normal(0, 0.01, 500).cumsum())
+    depth, duration = drawdown_series(equity)
+    expected_depth, expected_duration = _looped_drawdown(equity)
+    np.testing.assert_allclose(depth, expected_depth)
+    np.testing.assert_array_equal(duration, expected_duration)
+
+    assert streaks([1, 2, -1, 3, 4, 5, -2, -2, 0, -1]) == (3, 2)
+    assert streaks([]) == (0, 0)
+
+
+def test_ratios_against_pandas() -> None:
+    equity = np.array([100.0, 102, 101, 105, 103, 108])
+    pnl = [5.0, -2.0, 3.0, -1.0]
+    report = compute_performance(equity, pnl, position=[0, 1, 1, 0, 1, 1], traded_notional=416.0, periods=252)
+
+    returns = pd.Series(equity).pct_change().dropna()
+    assert report.total_return == pytest.approx(0.08)
+    assert report.sharpe == pytest.approx(returns.mean() / returns.std() * np.sqrt(252))
+    downside = np.sqrt((returns.clip(upper=0) ** 2).mean())
+    assert report.sortino == pytest.approx(returns.mean() / downside * np.sqrt(252))
+    assert report.max_drawdown == pytest.approx(2 / 105)
+    assert report.calmar == pytest.approx(report.annual_return / report.max_drawdown)
+    assert report.profit_factor == pytest.approx(8 / 3)
+    assert report.win_rate == 0.5
+    assert report.exposure == pytest.approx(4 / 6)
+    assert report.turnover == pytest.approx(416 / equity.mean())
+    assert "drawdown" not in report.as_dict()
+
+
+def test_undefined_ratios_are_none() -> None:
+    report = compute_performance([100.0, 100.0, 100.0], [1.0])
+    assert report.sharpe is None and report.sortino is None and report.calmar is None
+    assert report.profit_factor is None and report.exposure is None and report.turnover is None
+
+
+def test_portfolio_performance_rebuilds_equity_over_time() -> None:
+    index = pd.date_range("2023-01-01", periods=5, freq="D")
+    prices = pd.Series([10.0, 11, 12, 9, 8], index=index)
+    portfolio = Portfolio(starting_cash=100)
+    portfolio.apply_signals(prices, pd.Series([1, 0, 0, -1, 0], index=index))
+
+    report = portfolio_performance(portfolio, prices)
+    assert report.total_return == pytest.approx(-0.01)
+    assert report.max_drawdown == pytest.approx(3 / 102)
+    assert report.trades == 1 and report.win_rate == 0.0
+    assert report.exposure == pytest.approx(3 / 5)
+
+
+def test_results_cache_their_analytics() -> None:
+    index = pd.date_range("2023-01-01", periods=300, freq="h", name="timestamp")
+    prices = pd.Series(100 * np.exp(np.random.default_rng(1).normal(0, 0.01, 300).cumsum()), index=index)
+    frame = pd.DataFrame({"open": prices, "high": prices, "low": prices, "close": prices, "volume": 1.0})
+    bot = TradingBot(strategy=MovingAverageCrossStrategy(5, 20), portfolio=Portfolio(starting_cash=1000))
+    bot.run(PriceData(frame=frame))
+    assert bot.performance() is bot.performance()
+    assert bot.performance().trades == sum(trade.action == "SELL" for trade in bot.portfolio.trades)
+
+    book = MultiAssetPortfolio(starting_cash=1e6).run(
+        pd.DataFrame({"A": prices, "B": prices[::-1].to_numpy()}, index=index),
+        pd.DataFrame({"A": [1, -1] * 150, "B": [0, 1] * 150}, index=index),
+    )
+    assert book.performance is book.performance
+    assert book.performance.trades == 150
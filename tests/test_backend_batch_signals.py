@@ -0,0 +1,135 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("sqlalchemy")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.database import get_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Base, SignalSnapshot, Strategy  # noqa: E402
+from app.routers import signals  # noqa: E402
+from app.services import market_data  # noqa: E402
+from app.services.scheduler import set_scheduler  # noqa: E402
+from app.services.strategy_registry import set_strategy_registry  # noqa: E402
+from conftest import make_candles  # noqa: E402
+
+START, END = datetime(2024, 1, 1), datetime(2024, 1, 10)
+
+
+class FakeSource:
+    def __init__(self, batch_error=None, failing=()):
+        self.batch_error = batch_error
+        self.failing = set(failing)
+        self.single_fetches = []
+
+    def fetch(self, symbol, start, end):
+        self.single_fetches.append(symbol)
+        if symbol in self.failing:
+            raise ValueError(f"No market data returned for {symbol}")
+        return make_candles(end=end)
+
+    def fetch_batch(self, symbols, start, end):
+        raise self.batch_error
+
+
+@pytest.fixture
+def use_source(monkeypatch):
+    def install(source):
+        market_data.register_data_source("fake", lambda settings: source)
+        monkeypatch.setattr(get_settings(), "data_source", "fake")
+        market_data.get_data_source.cache_clear()
+        return source
+
+    yield install
+    market_data.DATA_SOURCES.pop("fake", None)
+    market_data.get_data_source.cache_clear()
+
+
+def test_bulk_provider_error_falls_back_to_single_fetches(use_source) -> None:
+    source = use_source(FakeSource(batch_error=OSError("connection reset"), failing={"BAD"}))
+    fallbacks = market_data.BATCH_FETCH_FALLBACKS.labels().value
+
+    results = market_data.fetch_candles_batch(["XAUUSD", "BAD"], START, END)
+
+    assert sorted(source.single_fetches) == ["BAD", "XAUUSD"]
+    assert isinstance(results["XAUUSD"], pd.DataFrame)
+    assert isinstance(results["BAD"], ValueError)
+    assert market_data.BATCH_FETCH_FALLBACKS.labels().value == fallbacks + 1
+
+
+def test_bulk_programming_error_is_not_swallowed(use_source) -> None:
+    use_source(FakeSource(batch_error=TypeError("bad call")))
+    with pytest.raises(TypeError):
+        market_data.fetch_candles_batch(["XAUUSD"], START, END)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        db.add(Strategy(name="test", parameters={"sma_fast": 5, "sma_slow": 20, "rsi_period": 14}))
+        db.commit()
+
+    def override_db():
+        with Session() as db:
+            yield db
+
+    commits = []
+
+    def counting_commit(db):
+        commits.append(len(db.new))
+        db.commit()
+
+    set_scheduler(None)
+    set_strategy_registry(None)
+    monkeypatch.setattr(signals, "commit", counting_commit)
+    app.dependency_overrides[get_db] = override_db
+    yield TestClient(app), Session, commits
+    app.dependency_overrides.pop(get_db, None)
+    set_strategy_registry(None)
+
+
+def test_batch_returns_error_items_for_failing_symbols(client, monkeypatch) -> None:
+    http, Session, commits = client
+    broken = make_candles(end=END).drop(columns=["close"])
+    monkeypatch.setattr(
+        signals,
+        "fetch_candles_batch",
+        lambda symbols, start, end, workers: {
+            "XAUUSD": make_candles(end=end),
+            "EURUSD": make_candles(end=end),
+            "MISSING": ValueError("No market data returned for MISSING"),
+            "BROKEN": broken,
+        },
+    )
+
+    response = http.get("/api/signals/latest/batch", params={"symbols": "XAUUSD, EURUSD,MISSING,BROKEN,XAUUSD"})
+
+    assert response.status_code == 200
+    items = {item["symbol"]: item for item in response.json()["results"]}
+    assert list(items) == ["XAUUSD", "EURUSD", "MISSING", "BROKEN"]
+    assert items["XAUUSD"]["signal"]["price"] == pytest.approx(make_candles(end=END)["close"].iloc[-1])
+    assert items["MISSING"]["error"] == "No market data returned for MISSING"
+    assert items["BROKEN"]["signal"] is None and items["BROKEN"]["error"]
+    assert commits == [2]
+    with Session() as db:
+        assert sorted(row.symbol for row in db.query(SignalSnapshot)) == ["EURUSD", "XAUUSD"]
+
+
+def test_batch_rejects_empty_and_oversized_requests(client, monkeypatch) -> None:
+    http, _, commits = client
+    monkeypatch.setattr(get_settings(), "batch_max_symbols", 2)
+
+    assert http.get("/api/signals/latest/batch", params={"symbols": " , "}).status_code == 422
+    assert http.get("/api/signals/latest/batch", params={"symbols": "A,B,C"}).status_code == 422
+    assert commits == []
@@ -0,0 +1,152 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("sqlalchemy")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.routers import candles  # noqa: E402
+from app.services.candles import (  # noqa: E402
+    CandleService,
+    PointLimitError,
+    aggregate_candles,
+    set_candle_service,
+)
+from conftest import FakeClock  # noqa: E402
+
+
+NOW = datetime(2024, 6, 3, 12)
+
+
+class HourlySource:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, symbol: str, start: datetime, end: datetime) -> pd.DataFrame:
+        self.calls += 1
+        if symbol == "MISSING":
+            raise ValueError(f"No market data returned for {symbol}")
+        index = pd.date_range(start.replace(minute=0, second=0), end, freq="h", inclusive="left")
+        rng = np.random.default_rng(len(index))
+        close = 1800 * np.exp(rng.normal(0, 0.002, len(index)).cumsum())
+        return pd.DataFrame(
+            {"open": close * 0.999, "high": close * 1.002, "low": close * 0.997, "close": close, "volume": 10.0},
+            index=index,
+        )
+
+
+@pytest.fixture
+def service():
+    source = HourlySource()
+    service = CandleService(source, "1h", history=timedelta(days=365), clock=FakeClock(NOW))
+    return service, source
+
+
+def test_pyramid_levels_match_resampling_the_base(service) -> None:
+    service, source = service
+    pyramid = service.pyramid("XAUUSD")
+    base = pyramid.levels["1h"].frame
+
+    assert list(pyramid.levels) == ["1h", "4h", "1d", "1w"]
+    for resolution, rule in (("4h", "4h"), ("1d", "1D"), ("1w", "W-MON")):
+        pd.testing.assert_frame_equal(pyramid.levels[resolution].frame, aggregate_candles(base, rule), check_freq=False)
+    assert (pyramid.levels["1w"].frame.index.dayofweek == 0).all()
+    assert pyramid.levels["1d"].frame["volume"].iloc[1] == 240.0
+
+
+def test_zooming_reuses_the_cached_pyramid(service) -> None:
+    service, source = service
+    resolution, frame = service.candles("XAUUSD", max_points=500)
+    assert resolution == "1d" and len(frame) == 366
+    resolution, frame = service.candles("XAUUSD", start=NOW - timedelta(days=60), max_points=500)
+    assert resolution == "4h" and len(frame) == 60 * 6
+    resolution, frame = service.candles("XAUUSD", start=NOW - timedelta(days=10), resolution="1h")
+    assert resolution == "1h" and len(frame) == 240
+    assert source.calls == 1
+
+    service.clock.current += timedelta(hours=1)
+    service.candles("XAUUSD")
+    assert source.calls == 2
+
+
+def test_service_rejects_unknown_resolution() -> None:
+    daily = CandleService(HourlySource(), "1d", clock=FakeClock(NOW))
+    assert daily.resolutions() == ["1d", "1w"]
+    with pytest.raises(ValueError, match="Unknown resolution"):
+        daily.candles("XAUUSD", resolution="4h")
+
+
+def test_endpoint_returns_columnar_candles(service) -> None:
+    service, _ = service
+    set_candle_service(service)
+    app = FastAPI()
+    app.include_router(candles.router)
+    client = TestClient(app)
+    try:
+        response = client.get("/api/candles", params={"symbol": "XAUUSD", "max_points": 100})
+        missing = client.get("/api/candles", params={"symbol": "MISSING"})
+        invalid = client.get("/api/candles", params={"resolution": "5m"})
+        too_many = client.get("/api/candles", params={"symbol": "XAUUSD", "max_points": 10})
+    finally:
+        set_candle_service(None)
+
+    body = response.json()
+    assert body["resolution"] == "1w"
+    assert body["resolutions"] == ["1h", "4h", "1d", "1w"]
+    assert body["count"] == len(body["t"]) == len(body["c"]) == 54
+    assert body["t"][1] - body["t"][0] == 7 * 24 * 3600
+    assert set(body) == {"symbol", "resolution", "resolutions", "count", "t", "o", "h", "l", "c", "v"}
+    assert missing.status_code == 404
+    assert invalid.status_code == 422
+    assert too_many.status_code == 422 and "max_points=10" in too_many.json()["detail"]
+
+
+def test_choose_never_exceeds_max_points(service) -> None:
+    service, _ = service
+    for max_points in (1, 53, 54, 100, 9000):
+        try:
+            resolution, frame = service.candles("XAUUSD", max_points=max_points)
+        except PointLimitError:
+            assert max_points < 54
+        else:
+            assert len(frame) <= max_points and resolution
+
+
+def test_pyramid_cache_evicts_least_recently_used_symbols() -> None:
+    source = HourlySource()
+    service = CandleService(source, "1h", history=timedelta(days=30), clock=FakeClock(NOW), max_symbols=2)
+    service.pyramid("XAUUSD")
+    service.pyramid("EURUSD")
+    service.pyramid("XAUUSD")
+    service.pyramid("GBPUSD")
+    assert list(service._cache) == ["XAUUSD", "GBPUSD"]
+    service.pyramid("XAUUSD")
+    assert source.calls == 3
+
+
+def test_slow_fetch_does_not_block_other_symbols() -> None:
+    started, release = threading.Event(), threading.Event()
+    source = HourlySource()
+
+    def fetcher(symbol, start, end):
+        if symbol == "SLOW":
+            started.set()
+            assert release.wait(timeout=5)
+        return source(symbol, start, end)
+
+    service = CandleService(fetcher, "1h", history=timedelta(days=30), clock=FakeClock(NOW))
+    service.pyramid("XAUUSD")
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        slow = [pool.submit(service.pyramid, "SLOW") for _ in range(2)]
+        assert started.wait(timeout=5)
+        assert pool.submit(service.pyramid, "XAUUSD").result(timeout=1) is service.pyramid("XAUUSD")
+        release.set()
+        assert slow[0].result(timeout=5) is slow[1].result(timeout=5)
+    assert source.calls == 2
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pydantic")
+
+from app.schemas import StrategyParams  # noqa: E402
+from app.services.indicators import IndicatorCache, IndicatorPlan, rsi, sma  # noqa: E402
+from app.services.strategy import StrategyEngine, evaluate_strategies  # noqa: E402
+from conftest import make_candles  # noqa: E402
+
+
+def _candles(rows: int = 200) -> pd.DataFrame:
+    return make_candles(100 + np.random.default_rng(7).normal(0, 1, rows).cumsum())
+
+
+def test_plan_deduplicates_shared_nodes() -> None:
+    plan = IndicatorPlan.for_strategies(
+        [
+            StrategyParams(sma_fast=20, sma_slow=50, rsi_period=14),
+            StrategyParams(sma_fast=10, sma_slow=50, rsi_period=14),
+        ]
+    )
+    kinds = [(spec.kind, spec.period) for spec in plan.order]
+    assert kinds.count(("sma", 50)) == 1
+    assert kinds.count(("delta", 0)) == 1
+    assert kinds.count(("rsi", 14)) == 1
+    assert sma(50) in plan.order and rsi(14) in plan.order
+
+
+def test_shared_evaluation_matches_individual_engines() -> None:
+    candles = _candles()
+    engines = {
+        1: StrategyEngine(StrategyParams(sma_fast=20, sma_slow=50, rsi_period=14)),
+        2: StrategyEngine(StrategyParams(sma_fast=5, sma_slow=50, rsi_period=7, rsi_sell_threshold=40)),
+    }
+    shared = evaluate_strategies(candles, engines, cache=None)
+    for key, engine in engines.items():
+        assert shared[key] == engine.compute(candles)
+
+
+def test_cache_skips_recomputation_for_same_candles() -> None:
+    candles = _candles()
+    cache = IndicatorCache()
+    plan = IndicatorPlan([sma(20), rsi(14)])
+    first = plan.compute(candles, cache=cache)
+    entries = len(cache)
+    second = plan.compute(candles.copy(), cache=cache)
+    assert len(cache) == entries
+    assert all(first[spec] is second[spec] for spec in plan.order)
+    plan.compute(_candles(150), cache=cache)
+    assert len(cache) == 2 * entries
+
+
+def test_float32_candles_keep_indicators_compact() -> None:
+    candles = _candles()
+    compact = candles.astype("float32")
+    params = StrategyParams(sma_fast=10, sma_slow=50, rsi_period=14)
+    plan = IndicatorPlan.for_strategies([params])
+
+    wide_nodes = plan.compute(candles)
+    compact_nodes = plan.compute(compact)
+    for spec in (sma(10), sma(50), rsi(14)):
+        assert compact_nodes[spec].dtype == np.float32
+        np.testing.assert_allclose(compact_nodes[spec], wide_nodes[spec], rtol=1e-5, atol=1e-4)
+
+    wide = StrategyEngine(params).compute(candles)
+    narrow = StrategyEngine(params).compute(compact)
+    assert narrow.indicators["rsi"] == pytest.approx(wide.indicators["rsi"], abs=1e-3)
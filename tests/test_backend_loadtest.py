@@ -0,0 +1,57 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("yfinance")
+
+from app.loadtest import percentile, summarise  # noqa: E402
+
+BACKEND = Path(__file__).resolve().parent.parent / "backend"
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    values = [float(value) for value in range(1, 101)]
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 99) == 0.0
+    stats = summarise([0.1, 0.2, 0.3], errors=1, elapsed=1.5)
+    assert stats["requests"] == 3
+    assert stats["throughput_rps"] == pytest.approx(2.0)
+
+
+def test_load_test_writes_report(tmp_path: Path) -> None:
+    output = tmp_path / "report.json"
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "app.loadtest",
+            "--requests",
+            "6",
+            "--concurrency",
+            "2",
+            "--mix",
+            "signals_latest=2,signals_history=1",
+            "--symbols",
+            "XAUUSD",
+            "--bars",
+            "400",
+            "--output",
+            str(output),
+        ],
+        cwd=BACKEND,
+        env={**os.environ, "PYTHONPATH": str(BACKEND.parent)},
+        check=True,
+        capture_output=True,
+    )
+    report = json.loads(output.read_text())
+    assert report["overall"]["requests"] == 6
+    assert report["overall"]["errors"] == 0
+    assert set(report["routes"]) == {"signals_latest", "signals_history"}
+    assert report["routes"]["signals_latest"]["p99_ms"] >= report["routes"]["signals_latest"]["p50_ms"]
@@ -0,0 +1,42 @@
+import pytest
+
+from app import metrics
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    histogram = metrics.Histogram("test_latency_seconds", "Test latency.", ("stage",), buckets=(0.1, 1.0))
+    child = histogram.labels("compute")
+    child.observe(0.05)
+    child.observe(0.5)
+    child.observe(5.0)
+    text = histogram.render()
+    assert '# TYPE test_latency_seconds histogram' in text
+    assert 'test_latency_seconds_bucket{stage="compute",le="0.1"} 1' in text
+    assert 'test_latency_seconds_bucket{stage="compute",le="1"} 2' in text
+    assert 'test_latency_seconds_bucket{stage="compute",le="+Inf"} 3' in text
+    assert 'test_latency_seconds_count{stage="compute"} 3' in text
+
+
+def test_counter_rejects_negative_increments() -> None:
+    counter = metrics.Counter("test_rows_total", "Rows.")
+    counter.inc(3)
+    with pytest.raises(ValueError):
+        counter.inc(-1)
+    assert "test_rows_total 3" in counter.render()
+
+
+def test_record_cache_updates_hit_ratio() -> None:
+    metrics.record_cache("test_cache", True)
+    metrics.record_cache("test_cache", True)
+    metrics.record_cache("test_cache", False)
+    assert metrics.CACHE_HIT_RATIO.labels("test_cache").value == pytest.approx(2 / 3)
+    assert 'cache_requests_total{cache="test_cache",result="hit"} 2' in metrics.render_latest()
+
+
+def test_metric_subclasses_must_implement_children_and_samples() -> None:
+    class Incomplete(metrics._Metric):
+        def _new_child(self):
+            return object()
+
+    with pytest.raises(TypeError, match="_samples"):
+        Incomplete("incomplete_total", "Missing _samples")
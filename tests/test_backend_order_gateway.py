@@ -0,0 +1,184 @@
+import asyncio
+import time
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pydantic")
+
+from app.services.broker import BrokerAdapter, ExecutionModel, PaperBroker  # noqa: E402
+from app.services.order_gateway import OrderGateway, PositionBook, RateLimiter  # noqa: E402
+from conftest import FakeClock  # noqa: E402
+
+
+class SimulatedBroker(BrokerAdapter):
+    """Async broker that acknowledges after ``latency`` seconds at a fixed price."""
+
+    def __init__(self, latency: float = 0.0, price: float = 2000.0, reject=()):
+        self.latency = latency
+        self.price = price
+        self.reject = set(reject)
+        self.orders = []
+        self.position_polls = 0
+
+    async def place_order_async(self, symbol: str, side: str, volume: float):
+        await asyncio.sleep(self.latency)
+        if symbol in self.reject:
+            raise RuntimeError(f"{symbol} is not tradable")
+        self.orders.append((symbol, side, volume))
+        return {"symbol": symbol, "side": side, "volume": volume, "price": self.price, "status": "filled"}
+
+    def place_order(self, symbol: str, side: str, volume: float):
+        raise AssertionError("the gateway should use place_order_async")
+
+    def get_positions(self):
+        self.position_polls += 1
+        return {"positions": []}
+
+
+def test_same_symbol_orders_coalesce_into_one_net_order() -> None:
+    broker = SimulatedBroker(latency=0.01)
+
+    async def scenario():
+        gateway = OrderGateway(broker)
+        tickets = [
+            await gateway.submit("XAUUSD", "buy", 1.0),
+            await gateway.submit("XAUUSD", "buy", 2.0),
+            await gateway.submit("XAUUSD", "sell", 0.5),
+            await gateway.submit("EURUSD", "sell", 3.0),
+            await gateway.submit("GBPUSD", "buy", 1.0),
+            await gateway.submit("GBPUSD", "sell", 1.0),
+        ]
+        gateway.start()
+        done = await asyncio.gather(*(ticket.wait() for ticket in tickets))
+        await gateway.stop()
+        return gateway, done
+
+    gateway, tickets = asyncio.run(scenario())
+
+    assert sorted(broker.orders) == [("EURUSD", "sell", 3.0), ("XAUUSD", "buy", 2.5)]
+    assert list(gateway.batches) == [3]
+    assert [ticket.status for ticket in tickets] == ["filled"] * 4 + ["coalesced"] * 2
+    assert tickets[0].ack is tickets[2].ack
+    assert all(ticket.latency_seconds >= ticket.acked_at - ticket.sent_at >= 0 for ticket in tickets)
+    assert all(ticket.latency_seconds >= 0.01 for ticket in tickets[:4])
+
+
+def test_batch_history_is_bounded() -> None:
+    async def scenario():
+        gateway = OrderGateway(SimulatedBroker(), batch_history=2)
+        for size in (1, 2, 3):
+            for index in range(size):
+                await gateway.submit(f"SYM{index}", "buy", 1.0)
+            await gateway.run_batch()
+        return gateway
+
+    gateway = asyncio.run(scenario())
+    assert list(gateway.batches) == [2, 3]
+
+
+def test_position_view_is_updated_from_fills_without_polling() -> None:
+    broker = SimulatedBroker(price=100.0, reject={"BROKEN"})
+
+    async def scenario():
+        gateway = OrderGateway(broker)
+        gateway.start()
+        first = await gateway.submit("XAUUSD", "buy", 2.0)
+        await first.wait()
+        second = await gateway.submit("XAUUSD", "sell", 0.5)
+        bad = await gateway.submit("BROKEN", "buy", 1.0)
+        await gateway.stop()
+        return gateway, second, bad
+
+    gateway, second, bad = asyncio.run(scenario())
+
+    snapshot = gateway.get_positions()
+    assert snapshot["positions"] == [{"symbol": "XAUUSD", "volume": 1.5, "last_price": 100.0, "notional": 150.0}]
+    assert snapshot["exposure"] == 150.0
+    assert second.status == "filled"
+    assert bad.status == "rejected" and "not tradable" in bad.error
+    assert broker.position_polls == 0
+
+
+def test_signal_timestamp_counts_towards_latency() -> None:
+    broker = SimulatedBroker(latency=0.02)
+
+    async def scenario():
+        gateway = OrderGateway(broker)
+        gateway.start()
+        signal_at = time.perf_counter() - 0.05
+        ticket = await gateway.submit("XAUUSD", "buy", 1.0, signal_at=signal_at)
+        await ticket.wait()
+        await gateway.stop()
+        return ticket
+
+    ticket = asyncio.run(scenario())
+    assert ticket.latency_seconds >= 0.07
+    assert ticket.signal_at < ticket.queued_at <= ticket.sent_at < ticket.acked_at
+
+
+def test_rate_limiter_spaces_orders_after_burst() -> None:
+    broker = SimulatedBroker()
+
+    async def scenario():
+        gateway = OrderGateway(broker, rate_limiter=RateLimiter(rate=50, burst=2))
+        tickets = [await gateway.submit(f"SYM{i}", "buy", 1.0) for i in range(6)]
+        started = time.perf_counter()
+        gateway.start()
+        await asyncio.gather(*(ticket.wait() for ticket in tickets))
+        elapsed = time.perf_counter() - started
+        await gateway.stop()
+        return elapsed
+
+    elapsed = asyncio.run(scenario())
+    assert len(broker.orders) == 6
+    # Two orders go out on the burst, the remaining four at 50/s.
+    assert elapsed >= 4 / 50 * 0.9
+
+
+def test_bounded_queue_applies_backpressure() -> None:
+    broker = SimulatedBroker()
+
+    async def scenario():
+        gateway = OrderGateway(broker, max_queue=2)
+        await gateway.submit("A", "buy", 1.0)
+        await gateway.submit("B", "buy", 1.0)
+        blocked = asyncio.ensure_future(gateway.submit("C", "buy", 1.0))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        gateway.start()
+        ticket = await blocked
+        await ticket.wait()
+        await gateway.stop()
+
+    asyncio.run(scenario())
+    assert [order[0] for order in broker.orders] == ["A", "B", "C"]
+
+
+def test_sync_adapters_run_off_the_event_loop() -> None:
+    index = pd.date_range("2024-01-01", periods=3, freq="h")
+    candles = pd.DataFrame({"open": [100.0, 101.0, 102.0], "close": [101.0, 102.0, 103.0]}, index=index)
+    broker = PaperBroker({"XAUUSD": candles}, ExecutionModel(spread_bps=0.0), clock=FakeClock(index[1]))
+
+    async def scenario():
+        gateway = OrderGateway(broker)
+        gateway.start()
+        ticket = await gateway.submit("XAUUSD", "buy", 1.0)
+        await ticket.wait()
+        await gateway.stop()
+        return gateway, ticket
+
+    gateway, ticket = asyncio.run(scenario())
+    assert ticket.status == "filled"
+    assert ticket.ack["price"] == 101.0
+    assert gateway.positions.volumes == {"XAUUSD": 1.0}
+    assert gateway.get_positions()["exposure"] == 101.0
+
+
+def test_position_book_exposure() -> None:
+    book = PositionBook()
+    book.apply_fill("XAUUSD", 2.0, 100.0)
+    book.apply_fill("EURUSD", -10.0, 1.1)
+    book.apply_fill("EURUSD", 10.0)
+    assert book.exposure() == pytest.approx(200.0)
+    assert [row["symbol"] for row in book.snapshot()["positions"]] == ["XAUUSD"]
@@ -0,0 +1,139 @@
+import time
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pydantic")
+
+from app.services.broker import ExecutionModel, PaperBroker  # noqa: E402
+from conftest import FakeClock  # noqa: E402
+
+
+def _candles(periods: int = 5, freq: str = "h", start: float = 100.0) -> pd.DataFrame:
+    index = pd.date_range("2024-01-01", periods=periods, freq=freq)
+    opens = start + np.arange(periods, dtype=float)
+    return pd.DataFrame({"open": opens, "high": opens + 1, "low": opens - 1, "close": opens + 0.5}, index=index)
+
+
+def test_spread_slippage_and_latency_set_fill_price_and_bar() -> None:
+    broker = PaperBroker(
+        {"XAUUSD": _candles()},
+        ExecutionModel(spread_bps=10.0, slippage_bps=5.0, latency=timedelta(minutes=30)),
+    )
+    orders = pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(["2024-01-01 00:00", "2024-01-01 01:00", "2024-01-01 04:00"]),
+            "symbol": "XAUUSD",
+            "side": ["buy", "sell", "buy"],
+            "volume": [1.0, 1.0, 1.0],
+        }
+    )
+
+    fills = broker.execute_batch(orders)
+
+    # Latency pushes each order onto the next bar's open; the last one runs off the data.
+    assert list(fills["reference_price"].iloc[:2]) == [101.0, 102.0]
+    assert fills["price"].iloc[0] == pytest.approx(101.0 * (1 + 10e-4))
+    assert fills["price"].iloc[1] == pytest.approx(102.0 * (1 - 10e-4))
+    assert list(fills["status"]) == ["filled", "filled", "rejected"]
+    assert np.isnan(fills["price"].iloc[2])
+    assert list(fills["order_id"]) == [1, 2, 3]
+
+
+def test_synthetic_book_walks_levels_for_large_orders() -> None:
+    model = ExecutionModel(spread_bps=0.0, level_volume=10.0, level_step_bps=2.0)
+    # 10 units sit at the touch; 25 units take 10 + 10 at +2bps + 5 at +4bps.
+    assert model.cost_bps(np.array([5.0, 10.0, 25.0])) == pytest.approx([0.0, 0.0, (10 * 2 + 5 * 4) / 25])
+
+
+def test_positions_and_pnl_are_kept_per_symbol() -> None:
+    broker = PaperBroker({"XAUUSD": _candles(), "EURUSD": _candles(start=1.0)}, ExecutionModel(spread_bps=0.0))
+    broker.execute_batch(
+        pd.DataFrame(
+            {
+                "timestamp": pd.to_datetime(["2024-01-01 00:00", "2024-01-01 02:00", "2024-01-01 01:00"]),
+                "symbol": ["XAUUSD", "XAUUSD", "EURUSD"],
+                "side": ["buy", "sell", "sell"],
+                "volume": [2.0, 1.0, 10.0],
+            }
+        )
+    )
+
+    summary = broker.pnl()
+    assert summary.loc["XAUUSD", "position"] == 1.0
+    # Bought 2 @ 100, sold 1 @ 102, marked at the last close 104.5.
+    assert summary.loc["XAUUSD", "pnl"] == pytest.approx(-200 + 102 + 104.5)
+    assert summary.loc["EURUSD", "pnl"] == pytest.approx(10 * 2.0 - 10 * 5.5)
+    positions = broker.get_positions()
+    assert [row["symbol"] for row in positions["positions"]] == ["EURUSD", "XAUUSD"]
+    assert positions["fills"] == 3
+
+
+def test_place_order_fills_at_clock_time_and_rejects_without_data() -> None:
+    candles = _candles()
+    broker = PaperBroker({"XAUUSD": candles}, ExecutionModel(spread_bps=4.0), clock=FakeClock(candles.index[2]))
+
+    ack = broker.place_order("XAUUSD", "sell", 1.5)
+    assert ack["status"] == "filled"
+    assert ack["price"] == pytest.approx(102.0 * (1 - 2e-4))
+    assert ack["filled_at"] == candles.index[2].to_pydatetime()
+
+    rejected = broker.place_order("EURUSD", "buy", 1.0)
+    assert rejected["status"] == "rejected"
+    assert "No market data" in rejected["reason"]
+    assert broker.get_positions()["fills"] == 1
+
+
+def test_tz_aware_candles_match_naive_orders() -> None:
+    candles = _candles()
+    candles.index = candles.index.tz_localize("UTC")
+    broker = PaperBroker({"XAUUSD": candles}, ExecutionModel(spread_bps=0.0))
+    fills = broker.execute_batch(
+        pd.DataFrame({"timestamp": [pd.Timestamp("2024-01-01 03:00")], "symbol": ["XAUUSD"], "side": ["buy"], "volume": [1.0]})
+    )
+    assert fills["price"].iloc[0] == 103.0
+
+
+def test_rejects_unknown_sides() -> None:
+    broker = PaperBroker({"XAUUSD": _candles()})
+    with pytest.raises(ValueError, match="Unknown order sides"):
+        broker.execute_batch(
+            pd.DataFrame({"timestamp": [pd.Timestamp("2024-01-01")], "symbol": ["XAUUSD"], "side": ["hold"], "volume": [1.0]})
+        )
+
+
+@pytest.mark.parametrize("volume", [0.0, -5.0, float("nan"), float("inf")])
+def test_rejects_non_positive_or_non_finite_volumes(volume: float) -> None:
+    broker = PaperBroker({"XAUUSD": _candles()}, model=ExecutionModel(level_volume=10.0, level_step_bps=1.0))
+    with pytest.raises(ValueError, match="positive and finite"):
+        broker.execute_batch(
+            pd.DataFrame({"timestamp": [pd.Timestamp("2024-01-01")], "symbol": ["XAUUSD"], "side": ["sell"], "volume": [volume]})
+        )
+    assert broker.get_positions()["positions"] == []
+
+
+def test_year_of_minute_signals_replays_quickly() -> None:
+    rng = np.random.default_rng(0)
+    symbols = ["XAUUSD", "EURUSD", "GBPUSD"]
+    candles = {symbol: _candles(periods=525_600, freq="min") for symbol in symbols}
+    broker = PaperBroker(candles, ExecutionModel(latency=timedelta(seconds=5)))
+    rows = 300_000
+    orders = pd.DataFrame(
+        {
+            "timestamp": pd.Timestamp("2024-01-01") + pd.to_timedelta(np.sort(rng.integers(0, 525_000 * 60, rows)), unit="s"),
+            "symbol": rng.choice(symbols, rows),
+            "side": rng.choice(["buy", "sell"], rows),
+            "volume": rng.integers(1, 5, rows).astype(float),
+        }
+    )
+
+    started = time.perf_counter()
+    fills = broker.execute_batch(orders)
+    summary = broker.pnl()
+    elapsed = time.perf_counter() - started
+
+    assert (fills["status"] == "filled").all()
+    assert set(summary.index) == set(symbols)
+    assert elapsed < 5.0
@@ -0,0 +1,93 @@
+import asyncio
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from app.services.clock import ReplayClock
+from app.services.replay import ReplaySource, save_candle_npz
+
+SAMPLE = Path(__file__).resolve().parent.parent / "data" / "sample_data.csv"
+
+
+@pytest.fixture()
+def replay_dir(tmp_path: Path) -> Path:
+    shutil.copy(SAMPLE, tmp_path / "XAUUSD.csv")
+    return tmp_path
+
+
+def test_replay_range_query_matches_dataframe_filter(replay_dir: Path) -> None:
+    source = ReplaySource(replay_dir)
+    start, end = datetime(2023, 1, 5), datetime(2023, 1, 12)
+    candles = source.fetch("XAUUSD", start, end)
+
+    frame = pd.read_csv(SAMPLE, parse_dates=["timestamp"]).set_index("timestamp")
+    frame.index = frame.index.tz_localize(None)
+    expected = frame[(frame.index >= start) & (frame.index < end)]
+    assert list(candles.index) == list(expected.index)
+    assert candles["close"].tolist() == expected["close"].astype(float).tolist()
+    assert source.first_timestamp("XAUUSD") == datetime(2023, 1, 1)
+
+
+def test_replay_reuses_indexed_cache_and_reads_binary(replay_dir: Path) -> None:
+    source = ReplaySource(replay_dir)
+    first = source.candles_for("XAUUSD")
+    assert source.candles_for("xauusd".upper()) is first
+
+    save_candle_npz(first.frame, replay_dir / "EURUSD.npz")
+    binary = source.fetch("EURUSD", datetime(2023, 1, 1), datetime(2023, 2, 1))
+    assert len(binary) == len(first.frame)
+    assert binary["close"].tolist() == first.frame["close"].tolist()
+
+
+def test_replay_rejects_paths_outside_data_dir_and_pickles(tmp_path: Path) -> None:
+    data_dir = tmp_path / "replay"
+    data_dir.mkdir()
+    shutil.copy(SAMPLE, tmp_path / "SECRET.csv")
+    pd.read_csv(SAMPLE).to_pickle(data_dir / "PICKLED.pkl")
+    source = ReplaySource(data_dir)
+
+    for symbol in ("../SECRET", "..", "/etc/passwd", "a/b", "XAU USD"):
+        with pytest.raises(ValueError, match="Invalid symbol"):
+            source.candles_for(symbol)
+    (data_dir / "LINK.csv").symlink_to(tmp_path / "SECRET.csv")
+    for symbol in ("LINK", "PICKLED"):
+        with pytest.raises(ValueError, match="No market data"):
+            source.candles_for(symbol)
+
+
+def test_replay_cache_is_bounded(replay_dir: Path) -> None:
+    for symbol in ("EURUSD", "GBPUSD"):
+        shutil.copy(SAMPLE, replay_dir / f"{symbol}.csv")
+    source = ReplaySource(replay_dir, max_symbols=2)
+    first = source.candles_for("XAUUSD")
+    source.candles_for("EURUSD")
+    assert source.candles_for("XAUUSD") is first
+    source.candles_for("GBPUSD")
+
+    assert list(source._cache) == ["XAUUSD", "GBPUSD"]
+
+
+def test_replay_unknown_symbol_or_empty_range(replay_dir: Path) -> None:
+    source = ReplaySource(replay_dir)
+    with pytest.raises(ValueError):
+        source.fetch("UNKNOWN", datetime(2023, 1, 1), datetime(2023, 2, 1))
+    with pytest.raises(ValueError):
+        source.fetch("XAUUSD", datetime(2030, 1, 1), datetime(2030, 2, 1))
+
+
+def test_replay_clock_runs_faster_than_real_time() -> None:
+    ticks = [0.0]
+    clock = ReplayClock(start=datetime(2023, 1, 1), speed=3600, monotonic=lambda: ticks[0])
+    ticks[0] = 2.0
+    assert clock.now() == datetime(2023, 1, 1, 2)
+
+    async def sleep_six_minutes() -> float:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await clock.sleep(360)
+        return loop.time() - started
+
+    assert asyncio.run(sleep_six_minutes()) < 0.5
@@ -0,0 +1,124 @@
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("orjson")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.database import get_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Base, Simulation, Strategy  # noqa: E402
+from app.responses import history_columnar  # noqa: E402
+from app.serialization_bench import benchmark  # noqa: E402
+from app.routers import signals  # noqa: E402
+from conftest import make_candles  # noqa: E402
+
+
+@pytest.fixture
+def client(monkeypatch):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        db.add(Strategy(name="test", parameters={"sma_fast": 5, "sma_slow": 20, "rsi_period": 14}))
+        db.add(
+            Simulation(
+                strategy_id=1,
+                symbol="XAUUSD",
+                start_date=datetime(2024, 1, 1),
+                end_date=datetime(2024, 2, 1),
+                starting_balance=10_000.0,
+                final_balance=10_100.0,
+                max_drawdown=0.01,
+                win_rate=0.5,
+                total_trades=2,
+                profitable_trades=1,
+                equity_curve=[
+                    {"timestamp": f"2024-01-01T0{hour}:00:00", "equity": 10_000.0 + hour, "drawdown": 0.0}
+                    for hour in range(3)
+                ],
+                metadata_={
+                    "trades": [{"pnl": 150.0, "direction": "LONG"}, {"pnl": -50.0, "direction": "SHORT"}],
+                    "analytics": {"sharpe": 1.0},
+                },
+            )
+        )
+        db.commit()
+
+    def override_db():
+        with Session() as db:
+            yield db
+
+    monkeypatch.setattr(signals, "fetch_candles", lambda symbol, start, end: make_candles(end=end))
+    app.dependency_overrides[get_db] = override_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+
+def test_history_columnar_matches_rows(client) -> None:
+    params = {"symbol": "XAUUSD", "strategy_id": 1, "to": "2024-03-01T00:00:00", "from": "2024-02-20T00:00:00"}
+    rows = client.get("/api/signals/history", params=params).json()
+    columnar = client.get("/api/signals/history", params={**params, "format": "columnar"}).json()
+
+    history = rows["history"]
+    assert len(history) > 0
+    assert columnar["format"] == "columnar"
+    assert columnar["timestamps"] == [entry["timestamp"] for entry in history]
+    assert columnar["signals"] == [entry["signal"] for entry in history]
+    assert columnar["prices"] == [entry["price"] for entry in history]
+    assert columnar["indicators"]["rsi"] == [entry["indicators"]["rsi"] for entry in history]
+    assert client.get("/api/signals/history", params={**params, "format": "xml"}).status_code == 422
+
+
+def test_simulation_columnar_skips_row_models(client) -> None:
+    rows = client.get("/api/simulations/1").json()
+    columnar = client.get("/api/simulations/1", params={"format": "columnar"}).json()
+
+    assert columnar["equity_curve"]["equity"] == [point["equity"] for point in rows["equity_curve"]]
+    assert columnar["equity_curve"]["timestamp"] == [point["timestamp"] for point in rows["equity_curve"]]
+    assert columnar["metadata"]["trades"] == {"pnl": [150.0, -50.0], "direction": ["LONG", "SHORT"]}
+    assert columnar["analytics"] == rows["analytics"] == {"sharpe": 1.0}
+    assert columnar["final_balance"] == rows["final_balance"]
+
+
+def test_get_scores_legacy_simulation_without_writing(client) -> None:
+    db = next(app.dependency_overrides[get_db]())
+    db.query(Simulation).filter(Simulation.id == 1).update(
+        {"metadata_": {"trades": [{"pnl": 150.0, "direction": "LONG"}, {"pnl": -50.0, "direction": "SHORT"}]}}
+    )
+    db.commit()
+
+    body = client.get("/api/simulations/1").json()
+    columnar = client.get("/api/simulations/1", params={"format": "columnar"}).json()
+
+    assert body["analytics"]["trades"] == 2
+    assert body["metadata"]["analytics"] == body["analytics"] == columnar["analytics"]
+    db.expire_all()
+    assert "analytics" not in db.query(Simulation).get(1).metadata_
+
+
+def test_large_bodies_are_gzipped_when_accepted(client) -> None:
+    params = {"symbol": "XAUUSD", "strategy_id": 1, "to": "2024-03-01T00:00:00", "from": "2024-02-20T00:00:00"}
+    compressed = client.get("/api/signals/history", params=params, headers={"Accept-Encoding": "gzip"})
+    plain = client.get("/api/signals/history", params=params, headers={"Accept-Encoding": "identity"})
+
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in plain.headers
+    assert compressed.json() == plain.json()
+    assert int(compressed.headers["content-length"]) < len(plain.content)
+
+
+def test_history_columnar_handles_empty_history() -> None:
+    assert history_columnar([]) == {"timestamps": [], "signals": [], "prices": [], "indicators": {}}
+
+
+def test_benchmark_reports_smaller_faster_columnar_payloads() -> None:
+    results = benchmark(rows=2_000, repeat=1)
+    assert results["columnar_orjson"]["bytes"] < results["rows_default"]["bytes"]
+    assert results["rows_orjson"]["encode_seconds"] < results["rows_default"]["encode_seconds"]
@@ -0,0 +1,160 @@
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic")
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.config import Settings  # noqa: E402
+from app.models import Base, SignalRollup, SignalSnapshot, Strategy  # noqa: E402
+from app.services.retention import RETENTION_RUN_FAILURES, RetentionJob, enable_incremental_vacuum  # noqa: E402
+from conftest import FakeClock  # noqa: E402
+
+
+NOW = datetime(2024, 3, 1, 12, 30)
+
+
+@pytest.fixture
+def session_factory(tmp_path: Path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'signals.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        db.add(Strategy(name="test", parameters={}))
+        db.commit()
+    return Session
+
+
+def _snapshot(timestamp: datetime, price: float, signal: str = "HOLD", symbol: str = "XAUUSD") -> SignalSnapshot:
+    return SignalSnapshot(
+        strategy_id=1,
+        symbol=symbol,
+        timestamp=timestamp,
+        signal=signal,
+        price=price,
+        indicators={"sma_fast": price, "sma_slow": price, "rsi": 50.0, "padding": "x" * 200},
+    )
+
+
+def test_old_snapshots_are_rolled_up_in_batches_and_deleted(session_factory) -> None:
+    old_start = datetime(2024, 2, 20, 12)
+    with session_factory() as db:
+        # Two hours of one-per-minute snapshots that have aged out, plus recent rows that stay.
+        db.add_all(
+            _snapshot(old_start + timedelta(minutes=minute), 100.0 + minute, ("BUY", "SELL", "HOLD")[minute % 3])
+            for minute in range(120)
+        )
+        db.add(_snapshot(old_start, 50.0, symbol="EURUSD"))
+        db.add_all(_snapshot(NOW - timedelta(hours=hours), 200.0) for hours in range(1, 4))
+        db.commit()
+
+    job = RetentionJob(session_factory, raw_max_age=timedelta(days=7), batch_size=25, clock=FakeClock(NOW))
+    report = job.run()
+
+    assert report.rows_pruned == 121
+    assert report.batches == 5
+    assert report.cutoff == datetime(2024, 2, 23, 12)
+    with session_factory() as db:
+        assert db.query(SignalSnapshot).count() == 3
+        rollups = db.query(SignalRollup).order_by(SignalRollup.symbol, SignalRollup.bucket).all()
+
+    assert [(rollup.symbol, rollup.bucket) for rollup in rollups] == [
+        ("EURUSD", datetime(2024, 2, 20, 12)),
+        ("XAUUSD", datetime(2024, 2, 20, 12)),
+        ("XAUUSD", datetime(2024, 2, 20, 13)),
+    ]
+    first_hour = rollups[1]
+    # 25-row batches split each hour, so buckets are merged across batches.
+    assert first_hour.samples == 60
+    assert (first_hour.buy_count, first_hour.sell_count, first_hour.hold_count) == (20, 20, 20)
+    assert (first_hour.open_price, first_hour.high_price, first_hour.low_price, first_hour.close_price) == (
+        100.0,
+        159.0,
+        100.0,
+        159.0,
+    )
+    assert first_hour.first_at == old_start and first_hour.last_at == old_start + timedelta(minutes=59)
+    assert first_hour.last_signal == "HOLD" and first_hour.last_indicators["sma_fast"] == 159.0
+    assert job.reports[-1] is report
+
+
+def test_vacuum_reclaims_space_only_after_explicit_conversion(session_factory) -> None:
+    def auto_vacuum() -> int:
+        with session_factory() as db:
+            return db.connection().exec_driver_sql("PRAGMA auto_vacuum").scalar()
+
+    with session_factory() as db:
+        db.add_all(_snapshot(NOW - timedelta(days=30, minutes=minute), 100.0) for minute in range(5000))
+        db.commit()
+
+    clock = FakeClock(NOW)
+    job = RetentionJob(session_factory, raw_max_age=timedelta(days=7), batch_size=1000, clock=clock)
+    first = job.run()
+    assert first.rows_pruned == 5000
+    assert first.bytes_reclaimed == 0
+    assert auto_vacuum() == 0
+
+    with session_factory() as db:
+        engine = db.get_bind()
+    assert enable_incremental_vacuum(engine) > 500_000
+    assert auto_vacuum() == 2
+    assert enable_incremental_vacuum(engine) == 0
+
+    with session_factory() as db:
+        db.add_all(_snapshot(NOW - timedelta(minutes=minute), 100.0) for minute in range(5000))
+        db.commit()
+    clock.current += timedelta(days=30)
+    second = job.run()
+    assert second.rows_pruned == 5000
+    assert second.bytes_reclaimed > 500_000
+
+
+def test_job_runs_on_its_schedule(session_factory) -> None:
+    clock = FakeClock(NOW)
+    job = RetentionJob(session_factory, clock=clock)
+
+    async def run_twice() -> None:
+        job.start(timedelta(minutes=30))
+        while len(job.reports) < 2:
+            await asyncio.sleep(0.01)
+        await job.stop()
+
+    asyncio.run(run_twice())
+    assert clock.sleeps[:2] == [1800.0, 1800.0]
+    assert all(report.rows_pruned == 0 for report in job.reports)
+
+
+def test_failed_run_does_not_stop_the_job(session_factory, monkeypatch) -> None:
+    clock = FakeClock(NOW)
+    job = RetentionJob(session_factory, clock=clock)
+    run = job.run
+    calls = []
+
+    def flaky_run():
+        calls.append(clock.now())
+        if len(calls) == 1:
+            raise RuntimeError("database is locked")
+        return run()
+
+    monkeypatch.setattr(job, "run", flaky_run)
+    failures = RETENTION_RUN_FAILURES.labels().value
+
+    async def run_until_recovered() -> None:
+        job.start(timedelta(minutes=30))
+        while not job.reports:
+            await asyncio.sleep(0.01)
+        await job.stop()
+
+    asyncio.run(run_until_recovered())
+    assert len(calls) >= 2 and len(job.reports) == len(calls) - 1
+    assert RETENTION_RUN_FAILURES.labels().value == failures + 1
+
+
+def test_retention_is_opt_in(monkeypatch) -> None:
+    monkeypatch.delenv("RETENTION_ENABLED", raising=False)
+    assert Settings(_env_file=None).retention_enabled is False
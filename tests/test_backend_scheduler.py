@@ -0,0 +1,102 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pydantic")
+
+from app.schemas import StrategyParams  # noqa: E402
+from app.services.scheduler import (  # noqa: E402
+    SCHEDULER_CYCLE_FAILURES,
+    SignalScheduler,
+    next_boundary,
+    parse_interval,
+)
+from conftest import FakeClock, make_candles  # noqa: E402
+
+
+class FakeSource:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, symbol: str, start: datetime, end: datetime) -> pd.DataFrame:
+        self.calls.append(symbol)
+        if symbol == "BROKEN":
+            raise ValueError("No market data returned for BROKEN")
+        return make_candles(np.arange(80) + 100.0, end=end)
+
+
+def test_parse_interval_and_next_boundary() -> None:
+    assert parse_interval("1h") == timedelta(hours=1)
+    assert parse_interval("15m") == timedelta(minutes=15)
+    with pytest.raises(ValueError):
+        parse_interval("fortnight")
+    assert next_boundary(datetime(2024, 1, 1, 10, 20), timedelta(hours=1)) == datetime(2024, 1, 1, 11)
+    assert next_boundary(datetime(2024, 1, 1, 11), timedelta(hours=1)) == datetime(2024, 1, 1, 12)
+
+
+def test_cycle_fetches_each_symbol_once_and_persists() -> None:
+    clock = FakeClock(datetime(2024, 1, 1, 12))
+    source = FakeSource()
+    persisted = []
+    scheduler = SignalScheduler(fetcher=source, interval="1h", persist=persisted.extend, clock=clock)
+    params = StrategyParams(sma_fast=5, sma_slow=20, rsi_period=14)
+    for symbol in ("XAUUSD", "EURUSD", "BROKEN"):
+        scheduler.track(symbol, 1, params)
+    scheduler.track("XAUUSD", 2, params)
+
+    stats = asyncio.run(scheduler.run_cycle())
+
+    assert sorted(source.calls) == ["BROKEN", "EURUSD", "XAUUSD"]
+    assert stats.pairs == 3
+    assert "BROKEN" in stats.failures
+    assert len(persisted) == 3
+    assert scheduler.get_latest("XAUUSD", 2) is not None
+    clock.current += timedelta(hours=1)
+    assert scheduler.get_latest("XAUUSD", 2) is None
+
+
+def test_run_forever_wakes_on_bar_boundaries() -> None:
+    clock = FakeClock(datetime(2024, 1, 1, 12, 30))
+    scheduler = SignalScheduler(fetcher=FakeSource(), interval="1h", clock=clock)
+    scheduler.track("XAUUSD", 1, StrategyParams(sma_fast=5, sma_slow=20))
+
+    async def run_two_cycles() -> None:
+        task = scheduler.start()
+        while len(scheduler.cycles) < 2:
+            await asyncio.sleep(0)
+        await scheduler.stop()
+        assert task.done()
+
+    asyncio.run(run_two_cycles())
+    assert [cycle.boundary for cycle in scheduler.cycles][:2] == [datetime(2024, 1, 1, 13), datetime(2024, 1, 1, 14)]
+    assert clock.sleeps[:2] == [1800.0, 3600.0]
+    assert all(cycle.lag_seconds == 0 for cycle in scheduler.cycles)
+
+
+def test_failing_cycle_does_not_stop_the_scheduler() -> None:
+    clock = FakeClock(datetime(2024, 1, 1, 12, 30))
+    attempts = []
+
+    def flaky_persist(signals) -> None:
+        attempts.append(len(signals))
+        if len(attempts) == 1:
+            raise RuntimeError("database is locked")
+
+    scheduler = SignalScheduler(fetcher=FakeSource(), interval="1h", persist=flaky_persist, clock=clock)
+    scheduler.track("XAUUSD", 1, StrategyParams(sma_fast=5, sma_slow=20))
+    failures = SCHEDULER_CYCLE_FAILURES.labels().value
+
+    async def run_until_recovered() -> None:
+        task = scheduler.start()
+        while not scheduler.cycles:
+            await asyncio.sleep(0)
+        await scheduler.stop()
+        assert task.done()
+
+    asyncio.run(run_until_recovered())
+    assert attempts == [1, 1]
+    assert scheduler.cycles[0].boundary == datetime(2024, 1, 1, 14)
+    assert SCHEDULER_CYCLE_FAILURES.labels().value == failures + 1
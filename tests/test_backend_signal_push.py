@@ -0,0 +1,190 @@
+import asyncio
+import json
+from contextlib import nullcontext
+from datetime import datetime
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("sqlalchemy")
+
+from fastapi import FastAPI  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.routers import signals  # noqa: E402
+from app.schemas import StrategyParams  # noqa: E402
+from app.services.scheduler import PrecomputedSignal, SignalScheduler, set_scheduler  # noqa: E402
+from app.services.signal_hub import SignalHub, Subscriber, set_signal_hub  # noqa: E402
+from app.services.strategy import StrategyResult  # noqa: E402
+from conftest import FakeClock, make_candles  # noqa: E402
+
+
+class CountingSource:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, symbol: str, start: datetime, end: datetime) -> pd.DataFrame:
+        self.calls += 1
+        return make_candles(np.arange(80) + 100.0, end=end)
+
+
+class WebSocketClient:
+    """Minimal in-process ASGI WebSocket client so thousands of connections share one event loop."""
+
+    def __init__(self, app, path: str = "/api/signals/stream"):
+        self.incoming: asyncio.Queue = asyncio.Queue()
+        self.outgoing: asyncio.Queue = asyncio.Queue()
+        scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0"},
+            "scheme": "ws",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [],
+            "client": ("127.0.0.1", 0),
+            "server": ("testserver", 80),
+            "subprotocols": [],
+        }
+        self.incoming.put_nowait({"type": "websocket.connect"})
+        self.task = asyncio.ensure_future(app(scope, self.incoming.get, self.outgoing.put))
+
+    async def accepted(self) -> None:
+        assert (await self.outgoing.get())["type"] == "websocket.accept"
+
+    def send(self, payload: dict) -> None:
+        self.incoming.put_nowait({"type": "websocket.receive", "text": json.dumps(payload)})
+
+    async def receive(self) -> dict:
+        message = await asyncio.wait_for(self.outgoing.get(), timeout=5)
+        return json.loads(message["text"])
+
+    async def close(self) -> None:
+        self.incoming.put_nowait({"type": "websocket.disconnect", "code": 1000})
+        await asyncio.wait_for(self.task, timeout=5)
+
+
+def _signal(symbol: str, strategy_id: int, price: float) -> PrecomputedSignal:
+    now = datetime(2024, 1, 1, 12)
+    result = StrategyResult(signal="BUY", price=price, indicators={"sma_fast": 1.0, "sma_slow": 2.0, "rsi": 50.0})
+    return PrecomputedSignal(symbol=symbol, strategy_id=strategy_id, result=result, bar_timestamp=now, computed_at=now)
+
+
+@pytest.fixture
+def push_app():
+    hub = SignalHub(max_queue=4)
+    set_signal_hub(hub)
+    source = CountingSource()
+    scheduler = SignalScheduler(
+        fetcher=source, interval="1h", publish=hub.publish, clock=FakeClock(datetime(2024, 1, 1, 12))
+    )
+    for symbol in ("XAUUSD", "EURUSD"):
+        scheduler.track(symbol, 1, StrategyParams(sma_fast=5, sma_slow=20))
+    set_scheduler(scheduler)
+    app = FastAPI()
+    app.include_router(signals.router)
+    yield app, hub, scheduler, source
+    set_scheduler(None)
+    set_signal_hub(None)
+
+
+def test_many_clients_receive_one_computation_per_bar(push_app) -> None:
+    app, hub, scheduler, source = push_app
+    clients_per_symbol = 1000
+
+    async def scenario():
+        clients = [WebSocketClient(app) for _ in range(2 * clients_per_symbol)]
+        await asyncio.gather(*(client.accepted() for client in clients))
+        for index, client in enumerate(clients):
+            client.send({"action": "subscribe", "symbol": ("XAUUSD", "EURUSD")[index % 2], "strategy_id": 1})
+        acks = await asyncio.gather(*(client.receive() for client in clients))
+        assert {ack["type"] for ack in acks} == {"subscribed"}
+        assert len(hub.subscribers) == 2 * clients_per_symbol
+
+        await scheduler.run_cycle()
+        pushed = await asyncio.gather(*(client.receive() for client in clients))
+
+        await asyncio.gather(*(client.close() for client in clients))
+        return acks, pushed
+
+    acks, pushed = asyncio.run(scenario())
+
+    assert source.calls == 2
+    assert all(message["type"] == "signal" for message in pushed)
+    assert [message["data"]["symbol"] for message in pushed[:4]] == ["XAUUSD", "EURUSD", "XAUUSD", "EURUSD"]
+    assert hub.subscribers == set() and hub.channels == {}
+
+
+def test_subscribe_sends_latest_and_unsubscribe_stops_pushes(push_app) -> None:
+    app, hub, scheduler, _ = push_app
+
+    async def scenario():
+        await scheduler.run_cycle()
+        client = WebSocketClient(app)
+        await client.accepted()
+        client.send({"action": "subscribe", "symbol": "XAUUSD", "strategy_id": 1})
+        assert (await client.receive())["type"] == "subscribed"
+        latest = await client.receive()
+        client.send({"action": "unsubscribe", "symbol": "XAUUSD", "strategy_id": 1})
+        assert (await client.receive())["type"] == "unsubscribed"
+        assert hub.publish([_signal("XAUUSD", 1, 2000.0)]) == 0
+        client.send({"action": "dance"})
+        error = await client.receive()
+        await client.close()
+        return latest, error
+
+    latest, error = asyncio.run(scenario())
+    assert latest["type"] == "signal" and latest["data"]["strategy_id"] == 1
+    assert error["type"] == "error"
+
+
+def test_stream_rejects_unlisted_symbols_and_untracks_pairs_it_added(push_app, monkeypatch) -> None:
+    app, hub, scheduler, _ = push_app
+    monkeypatch.setattr(get_settings(), "stream_symbols", ["GBPUSD"])
+    monkeypatch.setattr(signals, "new_session", lambda: nullcontext(None))
+    monkeypatch.setattr(
+        signals, "_get_strategy", lambda db, strategy_id: SimpleNamespace(id=strategy_id, params=StrategyParams())
+    )
+
+    async def scenario():
+        first, second = WebSocketClient(app), WebSocketClient(app)
+        await asyncio.gather(first.accepted(), second.accepted())
+        first.send({"action": "subscribe", "symbol": "../../etc/passwd", "strategy_id": 1})
+        rejected = await first.receive()
+
+        for client in (first, second):
+            client.send({"action": "subscribe", "symbol": "GBPUSD", "strategy_id": 1})
+            assert (await client.receive())["type"] == "subscribed"
+        tracked = ("GBPUSD", 1) in scheduler.pairs
+        first.send({"action": "unsubscribe", "symbol": "GBPUSD", "strategy_id": 1})
+        await first.receive()
+        still_tracked = ("GBPUSD", 1) in scheduler.pairs
+        await second.close()
+        await first.close()
+        return rejected, tracked, still_tracked
+
+    rejected, tracked, still_tracked = asyncio.run(scenario())
+    assert rejected["type"] == "error" and "not available" in rejected["detail"]
+    assert tracked and still_tracked
+    assert set(scheduler.pairs) == {("XAUUSD", 1), ("EURUSD", 1)}
+    assert signals._stream_tracked == set()
+
+
+def test_slow_subscriber_keeps_only_the_newest_messages() -> None:
+    async def scenario():
+        hub = SignalHub(max_queue=3)
+        subscriber = hub.connect()
+        hub.subscribe(subscriber, ("XAUUSD", 1))
+        for price in range(10):
+            hub.publish([_signal("XAUUSD", 1, float(price))])
+        received = [json.loads(await subscriber.next_message()) for _ in range(3)]
+        return subscriber, received
+
+    subscriber, received = asyncio.run(scenario())
+    assert isinstance(subscriber, Subscriber)
+    assert subscriber.dropped == 7
+    assert [message["data"]["price"] for message in received] == [7.0, 8.0, 9.0]
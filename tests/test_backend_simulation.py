@@ -0,0 +1,37 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pydantic")
+
+from app.schemas import SimulationRunRequest, StrategyParams  # noqa: E402
+from app.services.simulation import SimulationEngine, analytics_from_stored  # noqa: E402
+from conftest import make_candles  # noqa: E402
+
+
+def _candles(rows: int = 300) -> pd.DataFrame:
+    return make_candles(100 * np.exp(np.random.default_rng(3).normal(0, 0.01, rows).cumsum()))
+
+
+def test_simulation_reports_vectorized_analytics() -> None:
+    params = StrategyParams(sma_fast=5, sma_slow=20, rsi_period=5, rsi_buy_lower=0, rsi_buy_upper=100)
+    request = SimulationRunRequest(
+        strategy_id=1, symbol="XAUUSD", start_date=datetime(2024, 1, 1), end_date=datetime(2024, 2, 1)
+    )
+    results = SimulationEngine(params).run(_candles(), request)
+
+    equity = pd.Series([point["equity"] for point in results["equity_curve"]])
+    drawdown = 1 - equity / equity.cummax()
+    np.testing.assert_allclose([point["drawdown"] for point in results["equity_curve"]], drawdown, atol=1e-12)
+    assert results["max_drawdown"] == pytest.approx(drawdown.max())
+
+    analytics = results["analytics"]
+    assert analytics["trades"] == results["total_trades"] > 0
+    assert analytics["win_rate"] == pytest.approx(results["profitable_trades"] / results["total_trades"])
+    assert 0 < analytics["exposure"] <= 1
+
+    stored = analytics_from_stored(results["equity_curve"], results["trades"])
+    assert stored["sharpe"] == pytest.approx(analytics["sharpe"])
+    assert stored["max_drawdown"] == pytest.approx(analytics["max_drawdown"])
@@ -0,0 +1,65 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic")
+
+from app.config import Settings  # noqa: E402
+from app.database import SerializedWriter, create_db_engine, storage_profile  # noqa: E402
+from app.storage_bench import benchmark  # noqa: E402
+
+
+def test_production_profile_applies_pragmas_and_pool(tmp_path: Path) -> None:
+    profile = storage_profile(Settings(database_profile="production", sqlite_busy_timeout_ms=1234))
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'prod.db'}", profile)
+    with engine.connect() as connection:
+        pragma = lambda name: connection.exec_driver_sql(f"PRAGMA {name}").scalar()  # noqa: E731
+        assert pragma("journal_mode") == "wal"
+        assert pragma("auto_vacuum") == 2
+        assert pragma("synchronous") == 1
+        assert pragma("busy_timeout") == 1234
+        assert pragma("cache_size") == -64 * 1024
+        assert pragma("mmap_size") == 256 * 1024 * 1024
+    assert engine.pool.size() == 8
+    assert profile.serialize_writes
+
+
+def test_default_profile_keeps_stock_engine(tmp_path: Path) -> None:
+    profile = storage_profile(Settings(database_profile="default"))
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'stock.db'}", profile)
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "delete"
+    assert not profile.serialize_writes
+    with pytest.raises(ValueError, match="Unknown database profile"):
+        storage_profile(Settings(database_profile="turbo"))
+
+
+def test_serialized_writer_runs_one_transaction_at_a_time() -> None:
+    writer = SerializedWriter()
+    active = []
+    overlaps = []
+
+    def write() -> None:
+        with writer.transaction():
+            active.append(1)
+            overlaps.append(len(active))
+            time.sleep(0.005)
+            active.pop()
+
+    threads = [threading.Thread(target=write) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert overlaps == [1] * 8
+
+
+def test_benchmark_reports_throughput_per_profile() -> None:
+    results = benchmark(readers=2, writers=2, duration=0.3)
+    assert set(results) == {"default", "production"}
+    production = results["production"]
+    assert production["reads_per_second"] > 0 and production["writes_per_second"] > 0
+    assert production["read_errors"] == production["write_errors"] == 0
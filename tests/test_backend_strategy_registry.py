@@ -0,0 +1,103 @@
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("sqlalchemy")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.database import get_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Base, Strategy  # noqa: E402
+from app.routers import signals  # noqa: E402
+from app.services.strategy_registry import StrategyRegistry, get_strategy_registry, set_strategy_registry  # noqa: E402
+from conftest import make_candles  # noqa: E402
+
+
+@pytest.fixture
+def database():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        db.add(Strategy(name="fast", parameters={"sma_fast": 5, "sma_slow": 20, "rsi_period": 14}))
+        db.add(Strategy(name="slow", parameters={"sma_fast": 10, "sma_slow": 40, "rsi_period": 21}))
+        db.commit()
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    yield Session, statements
+    set_strategy_registry(None)
+
+
+def test_registry_serves_cached_entries_without_queries(database) -> None:
+    Session, statements = database
+    registry = StrategyRegistry()
+    with Session() as db:
+        default = registry.get(db)
+        loads = len(statements)
+        assert default.id == 1 and default.warmup == 20
+        assert registry.get(db) is default
+        assert registry.get(db, 2).params.sma_slow == 40
+        assert registry.get(db, 99) is None
+        assert [entry.id for entry in registry.all(db)] == [1, 2]
+        assert len(statements) == loads
+
+
+def test_invalidate_rebuilds_only_changed_strategies(database) -> None:
+    Session, _ = database
+    registry = StrategyRegistry()
+    with Session() as db:
+        first, second = registry.get(db, 1), registry.get(db, 2)
+        strategy = db.query(Strategy).get(1)
+        strategy.parameters = {"sma_fast": 8, "sma_slow": 30, "rsi_period": 14}
+        strategy.updated_at = datetime(2030, 1, 1)
+        db.commit()
+        assert registry.get(db, 1) is first
+
+        registry.invalidate()
+        updated = registry.get(db, 1)
+        assert updated is not first and updated.params.sma_fast == 8 and updated.warmup == 30
+        assert registry.get(db, 2) is second
+
+
+def test_registry_reloads_for_a_different_database(database) -> None:
+    Session, _ = database
+    registry = StrategyRegistry()
+    with Session() as db:
+        assert registry.get(db).name == "fast"
+    other = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(other)
+    with sessionmaker(bind=other)() as db:
+        assert registry.get(db) is None
+
+
+def test_saving_a_strategy_invalidates_the_registry(database, monkeypatch) -> None:
+    Session, _ = database
+    set_strategy_registry(StrategyRegistry())
+
+    def override_db():
+        with Session() as db:
+            yield db
+
+    monkeypatch.setattr(signals, "fetch_candles", lambda symbol, start, end: make_candles(end=end))
+    app.dependency_overrides[get_db] = override_db
+    try:
+        client = TestClient(app)
+        params = {"symbol": "XAUUSD", "strategy_id": 1, "to": "2024-03-01T00:00:00", "from": "2024-02-27T00:00:00"}
+        before = client.get("/api/signals/history", params=params).json()["history"]
+        response = client.post(
+            "/api/strategies",
+            json={"name": "fast", "parameters": {"sma_fast": 5, "sma_slow": 60, "rsi_period": 14}},
+        )
+        assert response.status_code == 200
+        after = client.get("/api/signals/history", params=params).json()["history"]
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+    with Session() as db:
+        assert get_strategy_registry().get(db, 1).params.sma_slow == 60
+    assert len(after) == len(before) - 40
@@ -0,0 +1,93 @@
+import csv
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import main
+from trading_bot.batch import BatchJob, expand_jobs, load_manifest, run_batch, run_job
+
+
+def _write_prices(path: Path, rows: int = 200, seed: int = 0) -> Path:
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 1, rows).cumsum()
+    frame = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2023-01-01", periods=rows, freq="h").strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "open": close,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": 10,
+        }
+    )
+    frame.to_csv(path, index=False)
+    return path
+
+
+def test_expand_jobs_crosses_files_with_param_sets(tmp_path: Path) -> None:
+    for seed in range(3):
+        _write_prices(tmp_path / f"sym{seed}.csv", seed=seed)
+    jobs = expand_jobs(
+        [str(tmp_path / "*.csv")],
+        BatchJob(path=""),
+        [{"short_window": 5, "long_window": 20}, {"short_window": 8, "long_window": 40}],
+    )
+    assert len(jobs) == 6
+    assert {(job.short_window, job.long_window) for job in jobs} == {(5, 20), (8, 40)}
+
+
+def test_manifest_resolves_relative_paths_and_coerces_types(tmp_path: Path) -> None:
+    _write_prices(tmp_path / "a.csv")
+    manifest = tmp_path / "runs.csv"
+    manifest.write_text("path,short_window,long_window,starting_cash\na.csv,4,12,500\na.csv,,,\n")
+    jobs = load_manifest(manifest, BatchJob(path=""))
+    assert jobs[0] == BatchJob(path=str(tmp_path / "a.csv"), short_window=4, long_window=12, starting_cash=500.0)
+    assert jobs[1] == BatchJob(path=str(tmp_path / "a.csv"))
+    assert type(jobs[0].short_window) is int and type(jobs[0].starting_cash) is float
+
+
+@pytest.mark.parametrize(
+    "name, content",
+    [("runs.csv", "path,short_window\na.csv,4\n,5\n"), ("runs.jsonl", '{"path": "a.csv"}\n{"short_window": 5}\n')],
+)
+def test_manifest_row_without_path_names_file_and_row(tmp_path: Path, name: str, content: str) -> None:
+    manifest = tmp_path / name
+    manifest.write_text(content)
+    with pytest.raises(ValueError, match=rf"{name}: row 2 has no 'path'"):
+        load_manifest(manifest, BatchJob(path=""))
+
+
+def test_failed_run_is_isolated(tmp_path: Path) -> None:
+    good = _write_prices(tmp_path / "good.csv")
+    jobs = [BatchJob(path=str(good), short_window=5, long_window=20), BatchJob(path=str(tmp_path / "missing.csv"))]
+    records = {record["path"]: record for record in run_batch(jobs, workers=2)}
+
+    assert records[str(good)]["status"] == "ok"
+    assert records[str(good)] == {**run_job(jobs[0]), "elapsed_seconds": records[str(good)]["elapsed_seconds"]}
+    assert records[str(tmp_path / "missing.csv")]["status"] == "error"
+    assert "FileNotFoundError" in records[str(tmp_path / "missing.csv")]["error"]
+
+
+def test_cli_batch_writes_jsonl_and_csv(tmp_path: Path, capsys) -> None:
+    for seed in range(2):
+        _write_prices(tmp_path / f"sym{seed}.csv", seed=seed)
+    params = tmp_path / "params.json"
+    params.write_text(json.dumps([{"short_window": 5, "long_window": 20}]))
+
+    output = tmp_path / "results.jsonl"
+    summary = main.main(
+        ["--batch", str(tmp_path / "sym*.csv"), "--param-sets", str(params), "--workers", "1", "--output", str(output)]
+    )
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert len(lines) == len(summary["runs"]) == 2
+    assert all(line["status"] == "ok" and line["short_window"] == 5 for line in lines)
+    assert "2 runs, 2 ok, 0 failed" in capsys.readouterr().out
+
+    table = tmp_path / "results.csv"
+    main.main(["--batch", str(tmp_path / "sym*.csv"), "--workers", "2", "--output", str(table)])
+    with table.open() as fh:
+        rows = list(csv.DictReader(fh))
+    assert sorted(Path(row["path"]).name for row in rows) == ["sym0.csv", "sym1.csv"]
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import main
+from trading_bot.bot import TradingBot
+from trading_bot.checkpoint import Checkpoint
+from trading_bot.data import PriceData
+from trading_bot.portfolio import Portfolio
+from trading_bot.strategy import MovingAverageCrossStrategy
+
+
+def _price_data(rows: int = 400) -> PriceData:
+    rng = np.random.default_rng(11)
+    close = 100 + rng.normal(0, 1, rows).cumsum()
+    index = pd.date_range("2023-01-01", periods=rows, freq="h", tz="UTC", name="timestamp")
+    frame = pd.DataFrame(
+        {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1.0}, index=index
+    )
+    return PriceData(frame=frame)
+
+
+def _bot() -> TradingBot:
+    return TradingBot(
+        strategy=MovingAverageCrossStrategy(short_window=5, long_window=20),
+        portfolio=Portfolio(starting_cash=10_000, unit_size=1),
+    )
+
+
+@pytest.mark.parametrize("splits", [[150], [3, 200], [50, 51, 390]])
+def test_resumed_runs_match_full_rerun(tmp_path, splits) -> None:
+    data = _price_data()
+    expected = _bot().run(data)
+
+    checkpoint = None
+    path = tmp_path / "bot.ckpt"
+    for cut in [*splits, len(data.frame)]:
+        partial = PriceData(frame=data.frame.iloc[:cut])
+        bot = _bot()
+        bot.run(partial, resume_from=checkpoint)
+        bot.checkpoint().save(path)
+        checkpoint = Checkpoint.load(path)
+
+    assert len(checkpoint.strategy_state["long_mean"]["values"]) == 20
+    final = _bot()
+    summary = final.run(data, resume_from=checkpoint)
+    assert summary["new_bars"] == 0
+    for key in ("ending_cash", "position", "market_value", "total_return", "trades"):
+        assert summary[key] == expected[key]
+
+
+def test_resume_processes_only_new_bars() -> None:
+    data = _price_data(100)
+    bot = _bot()
+    bot.run(PriceData(frame=data.frame.iloc[:90]))
+    summary = _bot().run(data, resume_from=bot.checkpoint())
+    assert summary["new_bars"] == 10
+
+
+def test_checkpoint_missing_file_returns_none(tmp_path) -> None:
+    assert Checkpoint.load(tmp_path / "absent.ckpt") is None
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        MovingAverageCrossStrategy(short_window=6, long_window=20),
+        MovingAverageCrossStrategy(short_window=5, long_window=25),
+        MovingAverageCrossStrategy(short_window=5, long_window=20, dtype="float32"),
+    ],
+)
+def test_resume_rejects_checkpoint_from_other_parameters(strategy) -> None:
+    data = _price_data(100)
+    bot = _bot()
+    bot.run(PriceData(frame=data.frame.iloc[:90]))
+    checkpoint = Checkpoint.from_dict(bot.checkpoint().to_dict())
+    assert checkpoint.strategy_state["params"] == {"short_window": 5, "long_window": 20, "dtype": "float64"}
+
+    resumed = TradingBot(strategy=strategy, portfolio=Portfolio(starting_cash=10_000, unit_size=1))
+    with pytest.raises(ValueError, match="strategy parameters"):
+        resumed.run(data, resume_from=checkpoint)
+
+
+def test_cli_resume_with_missing_checkpoint_exits(tmp_path) -> None:
+    data = _price_data(50)
+    csv = tmp_path / "prices.csv"
+    data.frame.to_csv(csv)
+    with pytest.raises(SystemExit, match="does not exist"):
+        main.main([str(csv), "--checkpoint", str(tmp_path / "absent.ckpt"), "--resume"])
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -77,3 +79,103 @@ def test_validate_config_rejects_invalid_risk_value() -> None:
                 },
             }
         )
+
+
+def _paper_config(symbol: str = "GBPUSD") -> dict:
+    return {
+        "data_provider": {"vendor": "twelve_data", "api_key": "demo", "symbol": symbol, "interval": "1h"},
+        "trade_settings": {"mode": "paper", "base_currency": "USD", "risk_per_trade": 0.02},
+    }
+
+
+def test_save_config_replaces_file_atomically(config_file: Path) -> None:
+    config_module.save_config(_paper_config(), config_file)
+    inode = config_file.stat().st_ino
+    config_module.save_config(_paper_config("EURUSD"), config_file)
+
+    assert config_file.stat().st_ino != inode
+    assert [path.name for path in config_file.parent.iterdir()] == ["config.json"]
+    assert config_module.load_config(config_file)["data_provider"]["symbol"] == "EURUSD"
+
+
+def test_validate_config_is_cached_and_returns_copies() -> None:
+    config_module._validate_canonical.cache_clear()
+    first = config_module.validate_config(_paper_config())
+    first["data_provider"]["symbol"] = "mutated"
+    second = config_module.validate_config(_paper_config())
+
+    assert second["data_provider"]["symbol"] == "GBPUSD"
+    assert config_module._validate_canonical.cache_info().hits == 1
+
+
+def test_config_service_caches_snapshot_until_file_changes(config_file: Path) -> None:
+    service = config_module.ConfigService(config_file)
+    missing = service.snapshot()
+    assert missing.version is None
+    assert missing.validated is None and "api_key" in missing.error
+
+    service.save(_paper_config())
+    snapshot = service.snapshot()
+    assert snapshot is service.snapshot()
+    assert snapshot.validated["data_provider"]["symbol"] == "GBPUSD"
+
+    config_module.save_config(_paper_config("USDJPY"), config_file)
+    assert service.snapshot().validated["data_provider"]["symbol"] == "USDJPY"
+
+
+def test_config_service_notifies_subscribers_of_external_edits(config_file: Path) -> None:
+    config_module.save_config(_paper_config(), config_file)
+    service = config_module.ConfigService(config_file)
+    seen = []
+    unsubscribe = service.subscribe(lambda snapshot: seen.append(snapshot.validated["data_provider"]["symbol"]))
+
+    assert service.poll() is False
+    config_module.save_config(_paper_config("EURUSD"), config_file)
+    assert service.poll() is True
+    assert service.poll() is False
+
+    service.save(_paper_config("USDJPY"))
+    unsubscribe()
+    config_module.save_config(_paper_config("AUDUSD"), config_file)
+    service.poll()
+
+    assert seen == ["EURUSD", "USDJPY"]
+
+
+def test_config_service_polling_thread_picks_up_changes(config_file: Path) -> None:
+    config_module.save_config(_paper_config(), config_file)
+    service = config_module.ConfigService(config_file)
+    changed = threading.Event()
+    service.subscribe(lambda snapshot: changed.set())
+    service.start(interval=0.01)
+    try:
+        config_module.save_config(_paper_config("EURUSD"), config_file)
+        assert changed.wait(timeout=2.0)
+    finally:
+        service.stop()
+
+
+def test_config_service_failing_subscriber_does_not_stop_the_watcher(config_file: Path, caplog) -> None:
+    config_module.save_config(_paper_config(), config_file)
+    service = config_module.ConfigService(config_file)
+    seen = []
+
+    def broken(snapshot) -> None:
+        raise RuntimeError("subscriber bug")
+
+    service.subscribe(broken)
+    service.subscribe(lambda snapshot: seen.append(snapshot.validated["data_provider"]["symbol"]))
+    service.start(interval=0.01)
+    try:
+        for symbol in ("EURUSD", "USDJPY"):
+            config_module.save_config(_paper_config(symbol), config_file)
+            for _ in range(200):
+                if seen and seen[-1] == symbol:
+                    break
+                time.sleep(0.01)
+        assert service._thread.is_alive()
+    finally:
+        service.stop()
+
+    assert seen == ["EURUSD", "USDJPY"]
+    assert "subscriber bug" in caplog.text
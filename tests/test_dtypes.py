@@ -0,0 +1,90 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.bot import TradingBot
+from trading_bot.data import load_price_data, resample_prices
+from trading_bot.dtypes import _synthetic_csv, benchmark, get_dtype_policy
+from trading_bot.portfolio import Portfolio
+from trading_bot.strategy import MovingAverageCrossStrategy
+
+
+@pytest.fixture(scope="module")
+def prices_csv(tmp_path_factory) -> Path:
+    path = tmp_path_factory.mktemp("dtypes") / "prices.csv"
+    _synthetic_csv(path, rows=50_000, seed=3)
+    return path
+
+
+def test_float32_policy_halves_frame_memory(prices_csv: Path) -> None:
+    wide = load_price_data(prices_csv)
+    compact = load_price_data(prices_csv, dtype="float32")
+
+    assert wide.frame["volume"].dtype == np.int64
+    assert (compact.frame.dtypes == np.float32).all()
+    columns_wide = wide.frame.memory_usage(index=False).sum()
+    columns_compact = compact.frame.memory_usage(index=False).sum()
+    assert columns_compact == columns_wide / 2
+    # float32 keeps ~7 significant digits of each price.
+    np.testing.assert_allclose(compact.frame["close"], wide.frame["close"], rtol=6e-8)
+
+
+def test_resample_keeps_policy_and_sums_volume_in_float64(prices_csv: Path) -> None:
+    wide = resample_prices(load_price_data(prices_csv), "1h")
+    compact = resample_prices(load_price_data(prices_csv, dtype="float32"), "1h")
+
+    assert (compact.frame.dtypes == np.float32).all()
+    np.testing.assert_allclose(compact.frame["volume"], wide.frame["volume"], rtol=6e-8)
+    np.testing.assert_allclose(compact.frame["high"], wide.frame["high"], rtol=6e-8)
+    assert resample_prices(load_price_data(prices_csv), "1h", dtype="float32").frame["close"].dtype == np.float32
+
+
+def test_moving_average_signals_only_drift_on_near_ties(prices_csv: Path) -> None:
+    wide = load_price_data(prices_csv).frame["close"]
+    compact = load_price_data(prices_csv, dtype="float32").frame["close"]
+    strategy64 = MovingAverageCrossStrategy(short_window=10, long_window=30)
+    strategy32 = MovingAverageCrossStrategy(short_window=10, long_window=30, dtype="float32")
+
+    signals64 = strategy64.generate_signals(wide)
+    signals32 = strategy32.generate_signals(compact)
+    assert signals32.dtype == np.int8
+
+    mismatched = signals64.to_numpy() != signals32.to_numpy()
+    assert mismatched.mean() < 1e-3
+    # Any flipped signal comes from moving averages that agree to float32 precision.
+    short_ma = wide.rolling(10, min_periods=1).mean()
+    long_ma = wide.rolling(30, min_periods=1).mean()
+    gap = ((short_ma - long_ma).abs() / long_ma).to_numpy()
+    assert (gap[mismatched] < 1e-6).all()
+
+
+def test_portfolio_cash_stays_float64_under_compact_policy(prices_csv: Path) -> None:
+    summaries = {}
+    for name in ("float64", "float32"):
+        data = load_price_data(prices_csv, dtype=name)
+        bot = TradingBot(
+            strategy=MovingAverageCrossStrategy(short_window=10, long_window=30, dtype=name),
+            portfolio=Portfolio(starting_cash=1_000_000),
+        )
+        summaries[name] = bot.run(data)
+        assert isinstance(bot.portfolio.cash, float)
+    assert summaries["float32"]["total_return"] == pytest.approx(summaries["float64"]["total_return"], abs=1e-4)
+
+
+def test_unknown_policy_and_benchmark() -> None:
+    with pytest.raises(ValueError):
+        get_dtype_policy("float16")
+    with pytest.raises(ValueError):
+        MovingAverageCrossStrategy(dtype="float16")
+
+    results = benchmark(rows=5_000)
+    assert results["float32"]["frame_bytes"] < 0.7 * results["float64"]["frame_bytes"]
+    assert results["float32"]["actions_bytes"] < results["float64"]["actions_bytes"]
+
+
+def test_compact_index_is_unchanged(prices_csv: Path) -> None:
+    wide = load_price_data(prices_csv)
+    compact = load_price_data(prices_csv, dtype="float32")
+    pd.testing.assert_index_equal(wide.frame.index, compact.frame.index)
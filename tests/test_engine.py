@@ -0,0 +1,123 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.bot import TradingBot
+from trading_bot.checkpoint import Checkpoint
+from trading_bot.data import PriceData, load_price_data
+from trading_bot.engine import EventEngine, iter_bars
+from trading_bot.portfolio import Portfolio
+from trading_bot.strategy import MovingAverageCrossStrategy
+
+
+def _trades(summary: dict) -> list:
+    return [(t["timestamp"], t["action"], t["price"]) for t in summary["trades"]]
+
+
+def test_incremental_strategy_matches_vectorized_actions() -> None:
+    prices = pd.Series(
+        [1, 2, 3, 2, 1, 2, 4, 3, 5, 1, 1, 2],
+        index=pd.date_range("2023-01-01", periods=12, freq="D"),
+        dtype=float,
+    )
+    strategy = MovingAverageCrossStrategy(short_window=2, long_window=4)
+    expected = strategy.generate_trading_actions(prices).tolist()
+    incremental = strategy.incremental()
+    assert [incremental.update(price) for price in prices] == expected
+
+
+def _random_prices(seed: int, dtype: str = "float64") -> tuple:
+    rng = np.random.default_rng(seed)
+    short_window, long_window = (3, 7) if seed % 2 else tuple(sorted(rng.choice(np.arange(2, 40), 2, replace=False)))
+    if seed % 3:
+        # Few distinct decimal prices with a flat run: the case where rounding decides ties.
+        prices = rng.choice([0.1, 0.2, 0.3, 1.1, 1.7], size=150)
+        flat = rng.integers(0, 150)
+        prices = np.insert(prices, flat, np.full(rng.integers(5, 25), 0.1))
+    else:
+        prices = 1800 * np.exp(rng.normal(0, 0.002, 300).cumsum())
+    series = pd.Series(prices, index=pd.date_range("2023-01-01", periods=len(prices), freq="h"), dtype=dtype)
+    strategy = MovingAverageCrossStrategy(short_window=int(short_window), long_window=int(long_window), dtype=dtype)
+    return strategy, series
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_incremental_strategy_matches_vectorized_actions_on_random_prices(seed: int) -> None:
+    strategy, series = _random_prices(seed)
+    incremental = strategy.incremental()
+    assert [incremental.update(price) for price in series] == strategy.generate_trading_actions(series).tolist()
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_incremental_strategy_matches_vectorized_actions_under_float32(seed: int) -> None:
+    strategy, series = _random_prices(seed, dtype="float32")
+    incremental = strategy.incremental()
+    assert incremental.dtype == "float32"
+    assert [incremental.update(price) for price in series] == strategy.generate_trading_actions(series).tolist()
+
+
+@pytest.mark.parametrize("seed", range(150))
+def test_resumed_checkpoint_matches_full_run_on_random_prices(seed: int) -> None:
+    strategy, series = _random_prices(seed)
+    frame = pd.DataFrame({"open": series, "high": series, "low": series, "close": series, "volume": 1.0})
+    frame.index.name = "timestamp"
+    data = PriceData(frame=frame)
+    cut = int(np.random.default_rng(seed).integers(1, len(frame)))
+
+    def bot() -> TradingBot:
+        return TradingBot(strategy=strategy, portfolio=Portfolio(starting_cash=1_000_000))
+
+    expected = bot().run(data)
+    first = bot()
+    first.run(PriceData(frame=frame.iloc[:cut]))
+    checkpoint = Checkpoint.from_dict(first.checkpoint().to_dict())
+    resumed = bot().run(data, resume_from=checkpoint)
+
+    assert _trades(resumed) == _trades(expected)
+    assert resumed["ending_cash"] == expected["ending_cash"]
+
+
+def test_event_engine_matches_batch_run() -> None:
+    data = load_price_data("data/sample_data.csv")
+    strategy = MovingAverageCrossStrategy(short_window=2, long_window=5)
+    batch = TradingBot(strategy=strategy, portfolio=Portfolio(starting_cash=1000)).run(data)
+
+    fast_path = EventEngine(strategy=strategy, portfolio=Portfolio(starting_cash=1000)).run(data)
+    per_bar = EventEngine(strategy=strategy.incremental(), portfolio=Portfolio(starting_cash=1000)).run(
+        iter_bars(data)
+    )
+
+    assert _trades(fast_path) == _trades(batch)
+    assert _trades(per_bar) == _trades(batch)
+    assert per_bar["bars_processed"] == len(data.frame)
+
+
+def test_event_engine_consumes_async_feed() -> None:
+    data = load_price_data("data/sample_data.csv")
+    strategy = MovingAverageCrossStrategy(short_window=2, long_window=5)
+
+    async def feed():
+        for bar in iter_bars(data):
+            yield bar
+
+    fills = []
+    engine = EventEngine(strategy=strategy, portfolio=Portfolio(starting_cash=1000), on_fill=fills.append)
+    summary = asyncio.run(engine.run_async(feed()))
+    expected = TradingBot(strategy=strategy, portfolio=Portfolio(starting_cash=1000)).run(data)
+    assert _trades(summary) == _trades(expected)
+    assert len(fills) == len(expected["trades"])
+    assert len(engine.equity_curve()) == len(data.frame)
+
+
+def test_event_engine_keeps_a_bounded_equity_history() -> None:
+    data = load_price_data("data/sample_data.csv")
+    strategy = MovingAverageCrossStrategy(short_window=2, long_window=5)
+    engine = EventEngine(strategy=strategy.incremental(), portfolio=Portfolio(starting_cash=1000), equity_history=3)
+    engine.run(iter_bars(data))
+
+    full = EventEngine(strategy=strategy.incremental(), portfolio=Portfolio(starting_cash=1000), equity_history=None)
+    full.run(iter_bars(data))
+    assert engine.bars_processed == len(full.equity_curve()) == len(data.frame) > 3
+    assert engine.equity_curve() == full.equity_curve()[-3:]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from trading_bot import importtime
+
+ROOT = Path(__file__).resolve().parents[1]
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        900 | encodings
+import time:       250 |        250 |     pandas.core
+import time:       400 |       1650 |   pandas
+import time:      1000 |       2650 | trading_bot.data
+"""
+
+
+def test_parse_importtime_sums_top_level_imports() -> None:
+    profile = importtime.parse_importtime(SAMPLE)
+
+    assert profile.roots == ["encodings", "trading_bot.data"]
+    assert profile.total_ms == pytest.approx(3.55)
+    assert profile.modules["pandas"] == pytest.approx(1.65)
+    assert profile.slowest(1) == [("trading_bot.data", 2.65)]
+
+
+def test_check_reports_forbidden_modules_and_blown_budget() -> None:
+    profile = importtime.parse_importtime(SAMPLE)
+    scenario = importtime.Scenario("sample", (), budget_ms=1.0, forbidden=("pandas", "numpy"))
+
+    assert importtime.check(scenario, profile) == [
+        "sample imports pandas",
+        "sample took 3.5 ms, budget 1 ms",
+    ]
+
+
+@pytest.mark.parametrize("name", ["cli_help", "config", "batch_worker"])
+def test_startup_scenarios_skip_heavy_imports(name: str) -> None:
+    scenario = importtime.SCENARIOS[name]
+    profile = importtime.profile_imports(scenario.args)
+
+    assert profile.roots
+    assert [module for module in scenario.forbidden if module in profile.modules] == []
+
+
+def test_importing_package_defers_submodules() -> None:
+    code = (
+        "import sys, trading_bot; "
+        "assert 'pandas' not in sys.modules; "
+        "trading_bot.Portfolio; "
+        "assert 'trading_bot.portfolio' in sys.modules and 'trading_bot.engine' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+
+
+def test_importing_backend_app_does_not_open_database_or_load_yfinance() -> None:
+    pytest.importorskip("fastapi")
+    pytest.importorskip("sqlalchemy")
+    code = (
+        "import sys, app.main; "
+        "from app import database; "
+        "assert database._database is None; "
+        "assert 'yfinance' not in sys.modules"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT / "backend", env={**os.environ, "PYTHONPATH": str(ROOT)}, check=True
+    )
@@ -0,0 +1,96 @@
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.portfolio import MultiAssetPortfolio, Portfolio
+from trading_bot.strategy import MovingAverageCrossStrategy
+
+
+def _book(rows: int, symbols: int, seed: int = 3):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2023-01-01", periods=rows, freq="h")
+    prices = pd.DataFrame(
+        100 * np.exp(rng.normal(0, 0.01, (rows, symbols)).cumsum(axis=0)),
+        index=index,
+        columns=[f"S{i}" for i in range(symbols)],
+    )
+    strategy = MovingAverageCrossStrategy(short_window=5, long_window=20)
+    actions = prices.apply(strategy.generate_trading_actions)
+    return prices, actions
+
+
+def test_matches_independent_portfolios_when_cash_is_ample() -> None:
+    prices, actions = _book(300, 6)
+    result = MultiAssetPortfolio(starting_cash=1e9).run(prices, actions)
+    per_symbol = result.symbol_equity()
+
+    for symbol in prices.columns:
+        single = Portfolio(starting_cash=1e9)
+        single.apply_signals(prices[symbol], actions[symbol])
+        assert result.positions[symbol] == single.position
+        expected = single.equity_curve(prices[symbol]).iloc[-1] - 1e9
+        assert per_symbol[symbol].iloc[-1] == pytest.approx(expected)
+        assert (result.trades()["symbol"] == symbol).sum() == len(single.trades)
+
+    equity = result.equity()
+    np.testing.assert_allclose(equity.to_numpy(), per_symbol.sum(axis=1).to_numpy() + 1e9)
+    assert result.summary()["market_value"] == pytest.approx(equity.iloc[-1])
+
+
+def test_shared_cash_fills_buys_in_column_order() -> None:
+    index = pd.date_range("2023-01-01", periods=3, freq="D")
+    prices = pd.DataFrame({"A": [60.0, 60, 70], "B": [50.0, 50, 50], "C": [30.0, 30, 30]}, index=index)
+    actions = pd.DataFrame({"A": [1, -1, 0], "B": [1, 1, 0], "C": [0, 1, 0]}, index=index)
+
+    result = MultiAssetPortfolio(starting_cash=100).run(prices, actions)
+
+    # t0: A fills (40 left), B does not fit. t1: A sells (+60), B and C both fit.
+    assert result.rejected_buys == 1
+    assert result.positions.to_dict() == {"A": 0.0, "B": 1.0, "C": 1.0}
+    assert result.cash == pytest.approx(20.0)
+    assert result.equity().tolist() == pytest.approx([100.0, 100.0, 100.0])
+
+
+def test_missing_quotes_are_skipped_and_marked_at_last_price() -> None:
+    prices = np.array([[10.0, np.nan], [np.nan, 5.0], [12.0, 6.0]])
+    actions = np.array([[1, 1], [0, 1], [0, 0]])
+    result = MultiAssetPortfolio(starting_cash=100).run(prices, actions, symbols=["X", "Y"])
+    assert result.positions.to_dict() == {"X": 1.0, "Y": 1.0}
+    assert result.equity().tolist() == pytest.approx([100.0, 100.0, 103.0])
+
+
+def test_rejects_misaligned_inputs() -> None:
+    prices, actions = _book(10, 2)
+    with pytest.raises(ValueError):
+        MultiAssetPortfolio(starting_cash=100).run(prices, actions.iloc[:5])
+
+
+def test_memory_stays_proportional_to_inputs() -> None:
+    prices, actions = _book(100_000, 50)
+    price_matrix = prices.to_numpy(dtype=np.float32)
+    action_matrix = actions.to_numpy(dtype=np.int8)
+    input_bytes = price_matrix.nbytes
+
+    tracemalloc.start()
+    result = MultiAssetPortfolio(starting_cash=1e7).run(price_matrix, action_matrix)
+    result.equity()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # No time x symbols copy of the inputs is made: beyond the trade log, the
+    # working set is a fixed-size row chunk.
+    assert peak < input_bytes
+    assert result.symbol_equity(dtype=np.float32).to_numpy().dtype == np.float32
+
+
+def test_block_fills_match_row_by_row_fills_under_cash_pressure() -> None:
+    prices, actions = _book(3_000, 40)
+    blocked = MultiAssetPortfolio(starting_cash=1_500).run(prices, actions)
+    row_wise = MultiAssetPortfolio(starting_cash=1_500, chunk_cells=1).run(prices, actions)
+
+    assert blocked.rejected_buys == row_wise.rejected_buys > 0
+    np.testing.assert_array_equal(blocked.trade_rows, row_wise.trade_rows)
+    np.testing.assert_array_equal(blocked.trade_symbols, row_wise.trade_symbols)
+    assert blocked.cash == pytest.approx(row_wise.cash)
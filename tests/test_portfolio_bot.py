@@ -1,4 +1,5 @@
 import pandas as pd
+import pytest
 
 from trading_bot.bot import TradingBot
 from trading_bot.data import load_price_data
@@ -24,3 +25,44 @@ def test_trading_bot_summary() -> None:
     summary = bot.run(data)
     assert "total_return" in summary
     assert isinstance(summary["trades"], list)
+
+
+def test_trading_bot_profile_reports_stages(tmp_path) -> None:
+    data = load_price_data("data/sample_data.csv")
+    bot = TradingBot(
+        strategy=MovingAverageCrossStrategy(short_window=2, long_window=5),
+        portfolio=Portfolio(starting_cash=1000, unit_size=1),
+    )
+    bot.enable_profiling(tmp_path / "run.pstats")
+    summary = bot.run(data)
+    profile = summary["profile"]
+    assert set(profile["stages"]) == {"generate_actions", "apply_signals"}
+    for stage in profile["stages"].values():
+        assert stage["wall_seconds"] >= 0
+        assert stage["rows"] == len(data.frame)
+    assert (tmp_path / "run.pstats").exists()
+
+
+def test_trading_bot_without_profiler_omits_profile() -> None:
+    data = load_price_data("data/sample_data.csv")
+    bot = TradingBot(
+        strategy=MovingAverageCrossStrategy(short_window=2, long_window=5),
+        portfolio=Portfolio(starting_cash=1000, unit_size=1),
+    )
+    assert "profile" not in bot.run(data)
+
+
+def test_profiler_combines_repeated_stages_across_runs() -> None:
+    data = load_price_data("data/sample_data.csv")
+    bot = TradingBot(
+        strategy=MovingAverageCrossStrategy(short_window=2, long_window=5),
+        portfolio=Portfolio(starting_cash=1000, unit_size=1),
+    )
+    bot.enable_profiling()
+    bot.run(data)
+    profile = bot.run(data)["profile"]
+
+    stages = profile["stages"].values()
+    assert all(stage["calls"] == 2 and stage["rows"] == 2 * len(data.frame) for stage in stages)
+    assert profile["total_wall_seconds"] == pytest.approx(sum(stage["wall_seconds"] for stage in stages))
+    assert profile["total_cpu_seconds"] == pytest.approx(sum(stage["cpu_seconds"] for stage in stages))
@@ -0,0 +1,208 @@
+import asyncio
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+
+from trading_bot.data import PriceData
+from trading_bot.providers import (
+    ConnectionPools,
+    ProviderClient,
+    ProviderError,
+    TokenBucket,
+    TwelveDataClient,
+    _retry_after,
+    client_from_config,
+    interval_minutes,
+)
+
+
+class StubVendor(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    throttle_first = 0
+    retry_after = "0"
+    requests = []
+    peers = set()
+    lock = threading.Lock()
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _send(self, status: int, payload: dict, headers: dict = None) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        query = parse_qs(urlparse(self.path).query)
+        with self.lock:
+            type(self).requests.append(query)
+            type(self).peers.add(self.client_address)
+            throttled = len(type(self).requests) <= type(self).throttle_first
+        if throttled:
+            self._send(429, {"status": "error", "message": "rate limited"}, {"Retry-After": type(self).retry_after})
+            return
+        symbol = query["symbol"][0]
+        if symbol == "BAD/PAIR":
+            self._send(200, {"status": "error", "message": "symbol not found"})
+            return
+        start = query["start_date"][0][:10]
+        values = [
+            {"datetime": f"{start} {hour:02d}:00:00", "open": "1", "high": "2", "low": "0.5", "close": str(1 + hour)}
+            for hour in range(3)
+        ]
+        self._send(200, {"status": "ok", "values": values})
+
+
+@pytest.fixture()
+def stub_server():
+    StubVendor.requests = []
+    StubVendor.peers = set()
+    StubVendor.throttle_first = 0
+    StubVendor.retry_after = "0"
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubVendor)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _client(base_url: str, **kwargs) -> TwelveDataClient:
+    return TwelveDataClient(
+        credentials={"api_key": "demo"},
+        interval="1h",
+        base_url=base_url,
+        bucket=TokenBucket(rate=1000, capacity=1000),
+        backoff=0.0,
+        **kwargs,
+    )
+
+
+def test_interval_minutes() -> None:
+    assert interval_minutes("60min") == 60
+    assert interval_minutes("1h") == 60
+    assert interval_minutes("1d") == 1440
+
+
+def test_token_bucket_waits_when_empty() -> None:
+    now = [0.0]
+    slept = []
+
+    async def fake_sleep(seconds: float) -> None:
+        slept.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=2.0, capacity=2.0, clock=lambda: now[0], sleep=fake_sleep)
+
+    async def drain() -> None:
+        for _ in range(4):
+            await bucket.acquire()
+
+    asyncio.run(drain())
+    assert slept == [0.5, 0.5]
+
+
+def test_client_retries_throttled_requests(stub_server: str) -> None:
+    StubVendor.throttle_first = 2
+    client = _client(stub_server)
+
+    async def fetch():
+        try:
+            return await client.fetch("EURUSD", datetime(2024, 1, 1), datetime(2024, 1, 2))
+        finally:
+            await client.pools.aclose()
+
+    data = asyncio.run(fetch())
+    assert isinstance(data, PriceData)
+    assert list(data.frame["close"]) == [1.0, 2.0, 3.0]
+    assert str(data.frame.index.tz) == "UTC"
+    assert len(StubVendor.requests) == 3
+    assert StubVendor.requests[-1]["symbol"] == ["EUR/USD"]
+
+
+@pytest.mark.parametrize("retry_after", ["soon", "Mon, 99 Foo 2024 00:00:00 GMT"])
+def test_unparseable_retry_after_falls_back_to_backoff(stub_server: str, retry_after: str) -> None:
+    StubVendor.throttle_first = 2
+    StubVendor.retry_after = retry_after
+    slept = []
+
+    async def fake_sleep(seconds: float) -> None:
+        slept.append(seconds)
+
+    client = _client(stub_server, sleep=fake_sleep)
+    client.backoff = 0.5
+
+    async def fetch():
+        try:
+            return await client.fetch("EURUSD", datetime(2024, 1, 1), datetime(2024, 1, 2))
+        finally:
+            await client.pools.aclose()
+
+    assert len(asyncio.run(fetch()).frame) == 3
+    assert slept == [0.5, 1.0]
+
+
+def test_retry_after_accepts_seconds_and_http_dates() -> None:
+    def header(value: str) -> httpx.Response:
+        return httpx.Response(429, headers={"Retry-After": value})
+
+    assert _retry_after(header("7")) == 7.0
+    assert _retry_after(header("Mon, 01 Jan 2001 00:00:00 -0000")) == 0.0
+    assert _retry_after(header("Mon, 01 Jan 2001 00:00:00 GMT")) == 0.0
+    assert _retry_after(header("tomorrow")) is None
+    assert _retry_after(httpx.Response(429)) is None
+
+
+def test_fetch_many_reuses_pool_and_reports_failures(stub_server: str) -> None:
+    pools = ConnectionPools(max_connections=2)
+    client = _client(stub_server, pools=pools)
+
+    async def fetch():
+        try:
+            return await client.fetch_many(["EURUSD", "GBPUSD", "USDJPY", "BAD/PAIR"], datetime(2024, 1, 1), datetime(2024, 1, 2))
+        finally:
+            await pools.aclose()
+
+    results = asyncio.run(fetch())
+    assert all(isinstance(results[symbol], PriceData) for symbol in ("EURUSD", "GBPUSD", "USDJPY"))
+    assert isinstance(results["BAD/PAIR"], ProviderError)
+    assert len(StubVendor.peers) <= 2
+
+
+def test_client_gives_up_after_max_retries(stub_server: str) -> None:
+    StubVendor.throttle_first = 100
+    client = _client(stub_server, max_retries=2)
+
+    async def fetch():
+        try:
+            await client.fetch("EURUSD", datetime(2024, 1, 1), datetime(2024, 1, 2))
+        finally:
+            await client.pools.aclose()
+
+    with pytest.raises(ProviderError):
+        asyncio.run(fetch())
+    assert len(StubVendor.requests) == 3
+
+
+def test_client_from_config_selects_vendor() -> None:
+    client = client_from_config(
+        {"data_provider": {"vendor": "oanda", "api_key": "k", "account_id": "a", "interval": "1h", "base_url": ""}}
+    )
+    assert client.vendor == "oanda"
+    assert client.base_url == "https://api-fxtrade.oanda.com"
+    assert client._granularity() == "H1"
+
+
+def test_provider_client_requires_fetch() -> None:
+    with pytest.raises(TypeError, match="fetch"):
+        ProviderClient(credentials={}, interval="1h")
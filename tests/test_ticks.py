@@ -0,0 +1,99 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.data import load_price_data
+from trading_bot.ticks import (
+    BarAggregator,
+    aggregate_ticks,
+    benchmark,
+    synthetic_ticks,
+    ticks_to_price_data,
+    write_bars,
+)
+
+
+def _chunks(ticks: pd.DataFrame, size: int):
+    return [ticks.iloc[start : start + size] for start in range(0, len(ticks), size)]
+
+
+def _bars(ticks: pd.DataFrame, size: int, **kwargs) -> pd.DataFrame:
+    return pd.concat(list(aggregate_ticks(_chunks(ticks, size), BarAggregator(**kwargs))))
+
+
+@pytest.fixture(scope="module")
+def ticks() -> pd.DataFrame:
+    return synthetic_ticks(20_000, seed=4)
+
+
+def test_time_bars_match_pandas_resample(ticks: pd.DataFrame) -> None:
+    bars = _bars(ticks, 1_000, rule="1min")
+    indexed = ticks.set_index("timestamp")
+    expected = indexed["price"].resample("1min").ohlc().dropna()
+    expected["volume"] = indexed["size"].resample("1min").sum()
+    expected["ticks"] = indexed["size"].resample("1min").count()
+
+    pd.testing.assert_frame_equal(
+        bars, expected.loc[expected["ticks"] > 0], check_freq=False, check_names=False, check_dtype=False
+    )
+
+
+@pytest.mark.parametrize(
+    "mode, kwargs", [("time", {"rule": "30s"}), ("volume", {"threshold": 500}), ("ticks", {"threshold": 97})]
+)
+def test_chunk_boundaries_do_not_change_bars(ticks: pd.DataFrame, mode: str, kwargs: dict) -> None:
+    sample = ticks.iloc[:3_000]
+    reference = _bars(sample, len(sample), mode=mode, **kwargs)
+    for size in (1, 7, 333, 1_024):
+        pd.testing.assert_frame_equal(_bars(sample, size, mode=mode, **kwargs), reference)
+
+
+def test_volume_and_tick_bar_thresholds(ticks: pd.DataFrame) -> None:
+    volume_bars = _bars(ticks, 777, mode="volume", threshold=500)
+    # Every completed bar carries cumulative volume across a new multiple of the threshold.
+    assert (np.diff(np.floor(volume_bars["volume"].cumsum().to_numpy() / 500))[:-1] >= 1).all()
+    assert volume_bars["volume"].sum() == ticks["size"].sum()
+
+    tick_bars = _bars(ticks, 777, mode="ticks", threshold=97)
+    assert (tick_bars["ticks"].iloc[:-1] == 97).all()
+    assert tick_bars["ticks"].sum() == len(ticks)
+
+
+def test_unsorted_ticks_are_rejected(ticks: pd.DataFrame) -> None:
+    aggregator = BarAggregator(rule="1min")
+    aggregator.update(ticks.iloc[100:200])
+    with pytest.raises(ValueError):
+        aggregator.update(ticks.iloc[:100])
+    with pytest.raises(ValueError):
+        BarAggregator(mode="volume")
+
+
+def test_tick_file_to_price_data_and_csv(tmp_path: Path, ticks: pd.DataFrame) -> None:
+    ticks_path = tmp_path / "ticks.csv"
+    ticks.to_csv(ticks_path, index=False, date_format="%Y-%m-%dT%H:%M:%S.%fZ")
+
+    data = ticks_to_price_data(ticks_path, BarAggregator(rule="1min", dtype="float32"), chunksize=2_500)
+    assert data.frame["close"].dtype == np.float32
+    assert data.frame["ticks"].sum() == len(ticks)
+
+    epochs_path = tmp_path / "ticks_epoch.csv"
+    ticks.assign(timestamp=ticks["timestamp"].astype("int64")).to_csv(epochs_path, index=False)
+    pd.testing.assert_frame_equal(
+        ticks_to_price_data(epochs_path, BarAggregator(rule="1min", dtype="float32"), chunksize=2_500).frame,
+        data.frame,
+    )
+
+    bars_path = tmp_path / "bars.csv"
+    written = write_bars(ticks_path, bars_path, BarAggregator(rule="1min"), chunksize=2_500)
+    loaded = load_price_data(bars_path)
+    assert written == len(loaded.frame) == len(data.frame)
+    np.testing.assert_allclose(loaded.frame["close"], data.frame["close"], rtol=1e-6)
+
+
+def test_benchmark_reports_throughput() -> None:
+    stats = benchmark(rows=20_000, chunksize=5_000)
+    assert stats["bars"] > 0
+    for key in ("aggregate_ticks_per_second", "epoch_file_ticks_per_second", "iso_file_ticks_per_second"):
+        assert np.isfinite(stats[key]) and stats[key] > 0
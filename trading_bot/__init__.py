@@ -1,14 +1,54 @@
-"""Trading bot package exports."""
-from .bot import TradingBot
-from .data import PriceData, load_price_data, resample_prices
-from .portfolio import Portfolio
-from .strategy import MovingAverageCrossStrategy
-
-__all__ = [
-    "TradingBot",
-    "PriceData",
-    "load_price_data",
-    "resample_prices",
-    "Portfolio",
-    "MovingAverageCrossStrategy",
-]
+"""Trading bot package exports.
+
+Exports are resolved on first access, so ``import trading_bot`` and light
+submodules such as ``trading_bot.config`` do not import pandas.
+"""
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+_EXPORTS = {
+    "PerformanceReport": ".analytics",
+    "compute_performance": ".analytics",
+    "TradingBot": ".bot",
+    "Checkpoint": ".checkpoint",
+    "Bar": ".engine",
+    "EventEngine": ".engine",
+    "PriceData": ".data",
+    "load_price_data": ".data",
+    "resample_prices": ".data",
+    "Portfolio": ".portfolio",
+    "MultiAssetPortfolio": ".portfolio",
+    "BarAggregator": ".ticks",
+    "RunProfiler": ".profiling",
+    "MovingAverageCrossStrategy": ".strategy",
+    "IncrementalMovingAverageCross": ".strategy",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
+
+if TYPE_CHECKING:
+    from .analytics import PerformanceReport, compute_performance
+    from .bot import TradingBot
+    from .checkpoint import Checkpoint
+    from .data import PriceData, load_price_data, resample_prices
+    from .engine import Bar, EventEngine
+    from .portfolio import MultiAssetPortfolio, Portfolio
+    from .profiling import RunProfiler
+    from .strategy import IncrementalMovingAverageCross, MovingAverageCrossStrategy
+    from .ticks import BarAggregator
@@ -0,0 +1,207 @@
+"""Vectorized performance analytics shared by the bot and the signal service.
+
+Everything here works on plain NumPy arrays (an equity curve plus a per-trade
+PnL ledger) so the same code scores a :class:`~trading_bot.portfolio.Portfolio`
+run, a multi-asset book and a backend simulation.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+SECONDS_PER_YEAR = 365.25 * 24 * 3600
+DEFAULT_PERIODS_PER_YEAR = 252.0
+
+
+def periods_per_year(timestamps: Sequence[Any]) -> float:
+    """Infer the annualisation factor from the median spacing of ``timestamps``."""
+
+    index = pd.DatetimeIndex(timestamps)
+    if len(index) < 2:
+        return DEFAULT_PERIODS_PER_YEAR
+    spacing = np.median(np.diff(index.asi8)) / 1e9
+    return SECONDS_PER_YEAR / spacing if spacing > 0 else DEFAULT_PERIODS_PER_YEAR
+
+
+def drawdown_series(equity: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return drawdown depth (fraction below the running peak) and duration in bars."""
+
+    equity = np.asarray(equity, dtype=np.float64)
+    if equity.size == 0:
+        return np.zeros(0), np.zeros(0, dtype=np.int64)
+    peak = np.maximum.accumulate(equity)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        depth = np.where(peak > 0, (peak - equity) / peak, 0.0)
+    bars = np.arange(equity.size)
+    last_peak = np.maximum.accumulate(np.where(equity >= peak, bars, 0))
+    return depth, bars - last_peak
+
+
+def streaks(pnl: np.ndarray) -> Tuple[int, int]:
+    """Return the longest runs of winning and losing trades."""
+
+    signs = np.sign(np.asarray(pnl, dtype=np.float64)).astype(np.int8)
+    if signs.size == 0:
+        return 0, 0
+    starts = np.flatnonzero(np.r_[True, signs[1:] != signs[:-1]])
+    lengths = np.diff(np.r_[starts, signs.size])
+    kinds = signs[starts]
+    longest_win = int(lengths[kinds > 0].max(initial=0))
+    longest_loss = int(lengths[kinds < 0].max(initial=0))
+    return longest_win, longest_loss
+
+
+def _finite(value: float) -> Optional[float]:
+    return float(value) if math.isfinite(value) else None
+
+
+@dataclass(frozen=True)
+class PerformanceReport:
+    """Scalar performance statistics plus the drawdown series they came from.
+
+    Ratios that are undefined for the run (no losing trades, zero volatility,
+    no exposure information) are ``None`` so the report serialises to JSON.
+    """
+
+    total_return: float
+    annual_return: float
+    volatility: float
+    sharpe: Optional[float]
+    sortino: Optional[float]
+    calmar: Optional[float]
+    max_drawdown: float
+    max_drawdown_duration: int
+    exposure: Optional[float]
+    turnover: Optional[float]
+    trades: int
+    win_rate: float
+    profit_factor: Optional[float]
+    max_win_streak: int
+    max_loss_streak: int
+    drawdown: np.ndarray = field(repr=False, compare=False)
+    drawdown_duration: np.ndarray = field(repr=False, compare=False)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the scalar statistics (without the drawdown series)."""
+
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in ("drawdown", "drawdown_duration")
+        }
+
+
+def compute_performance(
+    equity: Sequence[float],
+    trade_pnl: Sequence[float] = (),
+    position: Optional[Sequence[float]] = None,
+    traded_notional: Optional[float] = None,
+    periods: float = DEFAULT_PERIODS_PER_YEAR,
+) -> PerformanceReport:
+    """Score an equity curve and its trade ledger in one vectorized pass.
+
+    ``trade_pnl`` holds one realised PnL per closed trade, ``position`` the
+    position held at each bar (for exposure) and ``traded_notional`` the total
+    value traded (for turnover, relative to average equity). ``periods`` is the
+    number of bars per year used to annualise returns and ratios.
+    """
+
+    equity = np.asarray(equity, dtype=np.float64)
+    pnl = np.asarray(trade_pnl, dtype=np.float64)
+    depth, duration = drawdown_series(equity)
+
+    if equity.size >= 2 and equity[0] > 0:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.diff(equity) / equity[:-1]
+        returns = returns[np.isfinite(returns)]
+        total_return = float(equity[-1] / equity[0] - 1)
+    else:
+        returns = np.zeros(0)
+        total_return = 0.0
+
+    scale = math.sqrt(periods)
+    mean = float(returns.mean()) if returns.size else 0.0
+    std = float(returns.std(ddof=1)) if returns.size > 1 else 0.0
+    downside = float(np.sqrt(np.mean(np.minimum(returns, 0.0) ** 2))) if returns.size else 0.0
+    growth = 1 + total_return
+    annual_return = growth ** (periods / returns.size) - 1 if returns.size and growth > 0 else total_return
+    max_drawdown = float(depth.max(initial=0.0))
+
+    wins = pnl[pnl > 0].sum()
+    losses = -pnl[pnl < 0].sum()
+    longest_win, longest_loss = streaks(pnl)
+    average_equity = float(equity.mean()) if equity.size else 0.0
+
+    return PerformanceReport(
+        total_return=total_return,
+        annual_return=float(annual_return),
+        volatility=std * scale,
+        sharpe=_finite(mean / std * scale) if std > 0 else None,
+        sortino=_finite(mean / downside * scale) if downside > 0 else None,
+        calmar=_finite(annual_return / max_drawdown) if max_drawdown > 0 else None,
+        max_drawdown=max_drawdown,
+        max_drawdown_duration=int(duration.max(initial=0)),
+        exposure=float(np.mean(np.asarray(position, dtype=np.float64) != 0)) if position is not None else None,
+        turnover=(
+            float(traded_notional) / average_equity
+            if traded_notional is not None and average_equity > 0
+            else None
+        ),
+        trades=int(pnl.size),
+        win_rate=float((pnl > 0).mean()) if pnl.size else 0.0,
+        profit_factor=_finite(wins / losses) if losses > 0 else None,
+        max_win_streak=longest_win,
+        max_loss_streak=longest_loss,
+        drawdown=depth,
+        drawdown_duration=duration,
+    )
+
+
+def portfolio_performance(portfolio, prices: pd.Series) -> PerformanceReport:
+    """Score a single-instrument :class:`~trading_bot.portfolio.Portfolio` over ``prices``.
+
+    Cash and position are rebuilt bar by bar from the trade ledger, and each
+    SELL is paired with the BUY before it to form one closed trade.
+    """
+
+    trades = portfolio.trades
+    cash = np.full(len(prices), float(portfolio.starting_cash))
+    position = np.zeros(len(prices))
+    if trades:
+        ledger = pd.DataFrame([trade.__dict__ for trade in trades])
+        # Trades from before ``prices`` (e.g. a resumed run) map to -1 and apply from the first bar.
+        trade_bars = prices.index.get_indexer(ledger["timestamp"])
+        applied = np.searchsorted(trade_bars, np.arange(len(prices)), side="right") - 1
+        seen = applied >= 0
+        cash[seen] = ledger["cash_after"].to_numpy()[applied[seen]]
+        position[seen] = ledger["position_after"].to_numpy()[applied[seen]]
+
+        is_buy = (ledger["action"] == "BUY").to_numpy()
+        fills = (ledger["price"] * ledger["quantity"]).to_numpy()
+        sells = np.flatnonzero(~is_buy)
+        sells = sells[sells > 0]
+        pnl = fills[sells] - fills[sells - 1]
+        notional = float(fills.sum())
+    else:
+        pnl = np.zeros(0)
+        notional = 0.0
+
+    equity = cash + position * prices.to_numpy(dtype=np.float64)
+    periods = DEFAULT_PERIODS_PER_YEAR
+    if isinstance(prices.index, pd.DatetimeIndex):
+        periods = periods_per_year(prices.index)
+    return compute_performance(equity, pnl, position=position, traded_notional=notional, periods=periods)
+
+
+__all__ = [
+    "PerformanceReport",
+    "compute_performance",
+    "drawdown_series",
+    "periods_per_year",
+    "portfolio_performance",
+    "streaks",
+]
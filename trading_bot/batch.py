@@ -0,0 +1,227 @@
+"""Run many backtests in parallel and stream compact results."""
+from __future__ import annotations
+
+import csv
+import glob
+import json
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field, fields, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, TextIO, get_type_hints
+
+from .bot import TradingBot
+from .data import load_price_data, resample_prices
+from .portfolio import Portfolio
+from .strategy import MovingAverageCrossStrategy
+
+RESULT_FIELDS = [
+    "label",
+    "path",
+    "status",
+    "error",
+    "short_window",
+    "long_window",
+    "resample",
+    "starting_cash",
+    "unit_size",
+    "dtype",
+    "bars",
+    "trades",
+    "ending_cash",
+    "position",
+    "market_value",
+    "total_return",
+    "elapsed_seconds",
+]
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """One backtest: a data file plus the parameters to run it with."""
+
+    path: str
+    short_window: int = 10
+    long_window: int = 30
+    resample: Optional[str] = None
+    starting_cash: float = 10_000.0
+    unit_size: float = 1.0
+    dtype: str = "float64"
+    label: str = ""
+
+    def with_params(self, params: Mapping[str, Any]) -> "BatchJob":
+        known = {item.name for item in fields(self)}
+        unknown = set(params) - known
+        if unknown:
+            raise ValueError(f"Unknown batch parameters: {', '.join(sorted(unknown))}")
+        return replace(self, **params)
+
+    @property
+    def name(self) -> str:
+        return self.label or f"{Path(self.path).name}[{self.short_window}/{self.long_window}]"
+
+
+def expand_jobs(
+    patterns: Sequence[str], base: BatchJob, param_sets: Sequence[Mapping[str, Any]] = ()
+) -> List[BatchJob]:
+    """Return one job per matched file and parameter set."""
+
+    paths: List[str] = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) or ([pattern] if Path(pattern).exists() else [])
+        paths.extend(match for match in matches if match not in paths)
+    return [replace(base, path=path).with_params(params) for path in paths for params in (param_sets or [{}])]
+
+
+_FIELD_TYPES = get_type_hints(BatchJob)
+
+
+def _coerce(row: Mapping[str, Any]) -> Dict[str, Any]:
+    coerced: Dict[str, Any] = {}
+    for key, value in row.items():
+        if value in ("", None):
+            continue
+        field_type = _FIELD_TYPES.get(key)
+        if field_type in (int, float):
+            value = field_type(value)
+        coerced[key] = value
+    return coerced
+
+
+def load_manifest(path: Path | str, base: BatchJob) -> List[BatchJob]:
+    """Read jobs from a CSV, JSON list or JSON Lines manifest.
+
+    Each entry needs a ``path`` (relative paths resolve against the manifest's
+    directory) and may override any :class:`BatchJob` parameter. A missing
+    ``path`` raises ``ValueError`` naming the manifest and the row.
+    """
+
+    manifest = Path(path).expanduser()
+    with manifest.open("r", encoding="utf-8") as fh:
+        if manifest.suffix == ".csv":
+            rows = list(csv.DictReader(fh))
+        elif manifest.suffix == ".json":
+            rows = json.load(fh)
+        else:
+            rows = [json.loads(line) for line in fh if line.strip()]
+
+    jobs = []
+    for number, row in enumerate(rows, start=1):
+        params = _coerce(row)
+        if "path" not in params:
+            raise ValueError(f"{manifest}: row {number} has no 'path'")
+        data_path = Path(params.pop("path"))
+        if not data_path.is_absolute():
+            data_path = manifest.parent / data_path
+        jobs.append(replace(base, path=str(data_path)).with_params(params))
+    return jobs
+
+
+def run_job(job: BatchJob) -> Dict[str, Any]:
+    """Run a single backtest, converting any failure into an error record."""
+
+    started = time.perf_counter()
+    record: Dict[str, Any] = {**asdict(job), "label": job.name, "status": "ok", "error": None}
+    try:
+        price_data = load_price_data(job.path, dtype=job.dtype)
+        if job.resample:
+            price_data = resample_prices(price_data, job.resample)
+        bot = TradingBot(
+            strategy=MovingAverageCrossStrategy(
+                short_window=job.short_window, long_window=job.long_window, dtype=job.dtype
+            ),
+            portfolio=Portfolio(starting_cash=job.starting_cash, unit_size=job.unit_size),
+        )
+        summary = bot.run(price_data)
+        record.update(
+            bars=len(price_data.frame),
+            trades=len(summary["trades"]),
+            ending_cash=summary["ending_cash"],
+            position=summary["position"],
+            market_value=summary["market_value"],
+            total_return=summary["total_return"],
+        )
+    except Exception as exc:  # noqa: BLE001 - one bad run must not abort the batch
+        record.update(status="error", error=f"{type(exc).__name__}: {exc}")
+    record["elapsed_seconds"] = time.perf_counter() - started
+    return record
+
+
+def run_batch(jobs: Sequence[BatchJob], workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Yield result records in completion order, running jobs across a process pool."""
+
+    if workers == 1:
+        for job in jobs:
+            yield run_job(job)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures: Dict[Future, BatchJob] = {pool.submit(run_job, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                yield future.result()
+            except Exception as exc:  # noqa: BLE001 - e.g. a worker process died
+                yield {**asdict(job), "label": job.name, "status": "error", "error": f"{type(exc).__name__}: {exc}"}
+
+
+@dataclass
+class ResultWriter:
+    """Write result records as JSON Lines or CSV depending on the file suffix."""
+
+    stream: TextIO
+    fmt: str = "jsonl"
+    _csv: Optional[csv.DictWriter] = field(default=None, init=False, repr=False)
+
+    def write(self, record: Mapping[str, Any]) -> None:
+        if self.fmt == "csv":
+            if self._csv is None:
+                self._csv = csv.DictWriter(self.stream, fieldnames=RESULT_FIELDS, extrasaction="ignore")
+                self._csv.writeheader()
+            self._csv.writerow(record)
+        else:
+            self.stream.write(json.dumps(record, default=str) + "\n")
+        self.stream.flush()
+
+
+TABLE_HEADER = f"{'run':<40} {'status':<6} {'bars':>7} {'trades':>7} {'return':>9} {'secs':>7}"
+
+
+def format_row(record: Mapping[str, Any]) -> str:
+    if record["status"] != "ok":
+        return f"{record['label'][:40]:<40} {'error':<6} {record['error']}"
+    return (
+        f"{record['label'][:40]:<40} {'ok':<6} {record['bars']:>7} {record['trades']:>7} "
+        f"{record['total_return']:>9.4f} {record.get('elapsed_seconds', 0.0):>7.3f}"
+    )
+
+
+def stream_batch(
+    jobs: Sequence[BatchJob],
+    workers: Optional[int] = None,
+    writer: Optional[ResultWriter] = None,
+    echo: Callable[[str], None] = print,
+) -> List[Dict[str, Any]]:
+    """Run ``jobs`` and stream a summary row per completed run."""
+
+    echo(TABLE_HEADER)
+    records = []
+    for record in run_batch(jobs, workers=workers):
+        records.append(record)
+        if writer is not None:
+            writer.write(record)
+        echo(format_row(record))
+    failed = sum(record["status"] != "ok" for record in records)
+    echo(f"{len(records)} runs, {len(records) - failed} ok, {failed} failed")
+    return records
+
+
+__all__ = [
+    "BatchJob",
+    "ResultWriter",
+    "expand_jobs",
+    "load_manifest",
+    "run_batch",
+    "run_job",
+    "stream_batch",
+]
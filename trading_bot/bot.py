@@ -1,13 +1,18 @@
 """High-level trading bot orchestration."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Protocol
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Protocol
 
 import pandas as pd
 
+from .analytics import PerformanceReport, portfolio_performance
+from .checkpoint import Checkpoint
 from .data import PriceData
 from .portfolio import Portfolio
+from .profiling import RunProfiler
 
 
 class Strategy(Protocol):
@@ -21,11 +26,85 @@ class TradingBot:
 
     strategy: Strategy
     portfolio: Portfolio
+    profiler: Optional[RunProfiler] = field(default=None, repr=False)
+    _last_prices: Optional[pd.Series] = field(default=None, init=False, repr=False)
+    _resumed_from: Optional[Checkpoint] = field(default=None, init=False, repr=False)
+    _performance: Optional[PerformanceReport] = field(default=None, init=False, repr=False)
 
-    def run(self, price_data: PriceData) -> dict:
-        """Execute the trading strategy against historical prices."""
+    def enable_profiling(self, pstats_path: Path | str | None = None) -> RunProfiler:
+        """Record per-stage timings and peak memory on subsequent runs."""
 
-        closing_prices = price_data.frame["close"]
-        actions = self.strategy.generate_trading_actions(closing_prices)
-        self.portfolio.apply_signals(closing_prices, actions)
-        return self.portfolio.summary()
+        self.profiler = RunProfiler(pstats_path=Path(pstats_path) if pstats_path else None)
+        return self.profiler
+
+    def _stage(self, name: str, rows: int = 0):
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.stage(name, rows=rows)
+
+    def run(self, price_data: PriceData, resume_from: Optional[Checkpoint] = None) -> dict:
+        """Execute the trading strategy against historical prices.
+
+        When ``resume_from`` is given, the portfolio is restored from the
+        checkpoint and only bars after its timestamp are processed; the result
+        matches a full rerun over the whole history.
+        """
+
+        frame = price_data.frame
+        if resume_from is not None:
+            self.portfolio = resume_from.restore_portfolio()
+            frame = frame[frame.index > resume_from.last_timestamp]
+
+        rows = len(frame)
+        closing_prices = frame["close"]
+        with self._stage("generate_actions", rows):
+            if resume_from is not None:
+                actions = self._strategy_hook("resume_trading_actions")(closing_prices, resume_from.strategy_state)
+            else:
+                actions = self.strategy.generate_trading_actions(closing_prices)
+        with self._stage("apply_signals", rows):
+            self.portfolio.apply_signals(closing_prices, actions)
+        self._last_prices = closing_prices
+        self._resumed_from = resume_from
+        self._performance = None
+        summary = self.portfolio.summary()
+        if resume_from is not None:
+            summary["resumed_from"] = resume_from.last_timestamp.isoformat()
+            summary["new_bars"] = rows
+
+        if self.profiler is not None:
+            self.profiler.dump_stats()
+            summary["profile"] = self.profiler.report()
+        return summary
+
+    def performance(self) -> PerformanceReport:
+        """Return analytics for the most recent run, computed once and cached."""
+
+        if self._last_prices is None:
+            raise ValueError("Run the bot before requesting performance analytics")
+        if self._performance is None:
+            self._performance = portfolio_performance(self.portfolio, self._last_prices)
+        return self._performance
+
+    def _strategy_hook(self, name: str):
+        hook = getattr(self.strategy, name, None)
+        if hook is None:
+            raise TypeError(f"{type(self.strategy).__name__} does not support checkpointing ({name} missing)")
+        return hook
+
+    def checkpoint(self) -> Checkpoint:
+        """Capture portfolio and strategy state after the most recent run."""
+
+        if self._last_prices is None:
+            raise ValueError("Run the bot before taking a checkpoint")
+        previous = self._resumed_from
+        state = self._strategy_hook("checkpoint_state")(
+            self._last_prices, previous.strategy_state if previous is not None else None
+        )
+        if len(self._last_prices):
+            last_timestamp = self._last_prices.index[-1]
+        elif previous is not None:
+            last_timestamp = previous.last_timestamp
+        else:
+            raise ValueError("Cannot checkpoint a run that processed no bars")
+        return Checkpoint.capture(self.portfolio, state, last_timestamp)
@@ -0,0 +1,98 @@
+"""Checkpoints that let a backtest continue from where a previous run stopped."""
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from .portfolio import Portfolio, Trade
+
+CHECKPOINT_VERSION = 2
+
+
+@dataclass
+class Checkpoint:
+    """Serialisable portfolio and strategy state after the last processed bar."""
+
+    last_timestamp: pd.Timestamp
+    starting_cash: float
+    unit_size: float
+    cash: float
+    position: float
+    trades: List[Dict[str, Any]] = field(default_factory=list)
+    strategy_state: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def capture(cls, portfolio: Portfolio, strategy_state: Dict[str, Any], last_timestamp: pd.Timestamp) -> "Checkpoint":
+        return cls(
+            last_timestamp=pd.Timestamp(last_timestamp),
+            starting_cash=portfolio.starting_cash,
+            unit_size=portfolio.unit_size,
+            cash=portfolio.cash,
+            position=portfolio.position,
+            trades=[dict(trade.__dict__) for trade in portfolio.trades],
+            strategy_state=dict(strategy_state),
+        )
+
+    def restore_portfolio(self) -> Portfolio:
+        """Return a portfolio in the exact state captured by this checkpoint."""
+
+        portfolio = Portfolio(starting_cash=self.starting_cash, unit_size=self.unit_size)
+        portfolio.cash = self.cash
+        portfolio.position = self.position
+        portfolio.trades = [Trade(**trade) for trade in self.trades]
+        return portfolio
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": CHECKPOINT_VERSION,
+            "last_timestamp": self.last_timestamp.isoformat(),
+            "starting_cash": self.starting_cash,
+            "unit_size": self.unit_size,
+            "cash": self.cash,
+            "position": self.position,
+            "trades": [{**trade, "timestamp": pd.Timestamp(trade["timestamp"]).isoformat()} for trade in self.trades],
+            "strategy_state": self.strategy_state,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Checkpoint":
+        if data.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {data.get('version')}")
+        return cls(
+            last_timestamp=pd.Timestamp(data["last_timestamp"]),
+            starting_cash=float(data["starting_cash"]),
+            unit_size=float(data["unit_size"]),
+            cash=float(data["cash"]),
+            position=float(data["position"]),
+            trades=[{**trade, "timestamp": pd.Timestamp(trade["timestamp"])} for trade in data["trades"]],
+            strategy_state=data.get("strategy_state", {}),
+        )
+
+    def save(self, path: Path | str) -> Path:
+        """Write the checkpoint atomically as JSON."""
+
+        target = Path(path).expanduser()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as fh:
+            json.dump(self.to_dict(), fh)
+        os.replace(tmp, target)
+        return target
+
+    @classmethod
+    def load(cls, path: Path | str) -> Optional["Checkpoint"]:
+        """Load a checkpoint, returning ``None`` when the file does not exist."""
+
+        source = Path(path).expanduser()
+        if not source.exists():
+            return None
+        with source.open("r", encoding="utf-8") as fh:
+            return cls.from_dict(json.load(fh))
+
+
+__all__ = ["Checkpoint"]
@@ -2,13 +2,19 @@
 from __future__ import annotations
 
 import json
+import logging
+import os
+import tempfile
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Mapping
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 
+logger = logging.getLogger(__name__)
+
 CONFIG_DIR = Path("config")
-CONFIG_DIR.mkdir(exist_ok=True)
 DEFAULT_CONFIG_PATH = CONFIG_DIR / "config.json"
 
 
@@ -24,6 +30,8 @@ class ProviderMeta:
     description: str
     required_credentials: tuple[str, ...]
     default_base_url: str
+    requests_per_minute: float = 60.0
+    max_bars_per_request: int = 5000
 
 
 PROVIDERS: Mapping[str, ProviderMeta] = {
@@ -32,18 +40,21 @@ PROVIDERS: Mapping[str, ProviderMeta] = {
         description="Free forex data with throttled request limits.",
         required_credentials=("api_key",),
         default_base_url="https://www.alphavantage.co",
+        requests_per_minute=5.0,
     ),
     "twelve_data": ProviderMeta(
         label="Twelve Data",
         description="Low-latency forex and crypto data with generous limits.",
         required_credentials=("api_key",),
         default_base_url="https://api.twelvedata.com",
+        requests_per_minute=8.0,
     ),
     "oanda": ProviderMeta(
         label="OANDA",
         description="Broker-grade forex pricing and trade execution APIs.",
         required_credentials=("api_key", "account_id"),
         default_base_url="https://api-fxtrade.oanda.com",
+        requests_per_minute=6000.0,
     ),
 }
 
@@ -88,15 +99,45 @@ def load_config(path: Path | None = None) -> Dict[str, Any]:
 
 
 def save_config(config: Mapping[str, Any], path: Path | None = None) -> None:
-    """Persist configuration to disk."""
+    """Persist configuration to disk.
+
+    The file is written to a temporary sibling and renamed over the target, so
+    readers see either the previous or the new configuration, never a partial one.
+    """
 
     config_path = _ensure_config_path(path)
-    with config_path.open("w", encoding="utf-8") as fh:
-        json.dump(config, fh, indent=2, sort_keys=True)
+    fd, temp_name = tempfile.mkstemp(prefix=f".{config_path.name}.", suffix=".tmp", dir=config_path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(config, fh, indent=2, sort_keys=True)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(temp_name, config_path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
 
 
 def validate_config(config: Mapping[str, Any]) -> Dict[str, Any]:
-    """Validate configuration fields and normalise missing defaults."""
+    """Validate configuration fields and normalise missing defaults.
+
+    Results are cached by the canonical JSON form of ``config``; every call
+    returns a fresh copy, so callers may mutate what they get back.
+    """
+
+    try:
+        canonical = json.dumps(config, sort_keys=True)
+    except (TypeError, ValueError):
+        return _validate_config(config)
+    return json.loads(_validate_canonical(canonical))
+
+
+@lru_cache(maxsize=128)
+def _validate_canonical(canonical: str) -> str:
+    return json.dumps(_validate_config(json.loads(canonical)), sort_keys=True)
+
+
+def _validate_config(config: Mapping[str, Any]) -> Dict[str, Any]:
 
     if "data_provider" not in config:
         raise ConfigError("Configuration must include 'data_provider'.")
@@ -161,8 +202,155 @@ def validate_config(config: Mapping[str, Any]) -> Dict[str, Any]:
     return validated
 
 
+FileVersion = Optional[Tuple[int, int, int]]
+
+
+def _file_version(path: Path) -> FileVersion:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_ino, stat.st_size
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """One parsed version of the configuration file.
+
+    ``config`` is the file content (defaults when the file is absent) and
+    ``validated`` its normalised form, or ``None`` with ``error`` set when the
+    file does not validate. Treat both dictionaries as read-only.
+    """
+
+    config: Dict[str, Any]
+    validated: Optional[Dict[str, Any]]
+    error: Optional[str]
+    version: FileVersion
+
+
+Subscriber = Callable[[ConfigSnapshot], None]
+
+
+class ConfigService:
+    """Cached, hot-reloading view of a configuration file.
+
+    The parsed and validated snapshot is kept in memory and only re-read when
+    the file's mtime, inode or size changes, so a request handler can call
+    :meth:`snapshot` on every request for the price of one ``stat``. Writes go
+    through :func:`save_config` and are atomic. Subscribers are called with the
+    new snapshot whenever the content changes, whether through :meth:`save` in
+    this process or an edit by another process picked up by :meth:`poll`
+    (run it periodically with :meth:`start`). A subscriber that raises is
+    logged and does not stop the others or the polling thread.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = Path(path or DEFAULT_CONFIG_PATH).expanduser()
+        self._snapshot: Optional[ConfigSnapshot] = None
+        self._subscribers: List[Subscriber] = []
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _read(self, version: FileVersion) -> ConfigSnapshot:
+        try:
+            config = load_config(self.path) if version is not None else json.loads(json.dumps(DEFAULT_CONFIG))
+        except (OSError, ValueError) as exc:
+            config, error = {}, f"Could not read {self.path}: {exc}"
+            return ConfigSnapshot(config=config, validated=None, error=error, version=version)
+        try:
+            validated, error = validate_config(config), None
+        except ConfigError as exc:
+            validated, error = None, str(exc)
+        return ConfigSnapshot(config=config, validated=validated, error=error, version=version)
+
+    def _refresh(self) -> Tuple[ConfigSnapshot, bool]:
+        version = _file_version(self.path)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot, False
+        with self._lock:
+            previous = self._snapshot
+            if previous is not None and previous.version == version:
+                return previous, False
+            snapshot = self._read(version)
+            self._snapshot = snapshot
+        return snapshot, previous is not None and previous.config != snapshot.config
+
+    def _notify(self, snapshot: ConfigSnapshot) -> None:
+        for callback in list(self._subscribers):
+            try:
+                callback(snapshot)
+            except Exception:
+                logger.exception("Config subscriber %r failed", callback)
+
+    def snapshot(self) -> ConfigSnapshot:
+        """Current configuration, re-read only when the file has changed."""
+
+        snapshot, changed = self._refresh()
+        if changed:
+            self._notify(snapshot)
+        return snapshot
+
+    def save(self, config: Mapping[str, Any]) -> Dict[str, Any]:
+        """Validate, atomically write and publish ``config``; returns the validated form."""
+
+        validated = validate_config(config)
+        with self._lock:
+            save_config(validated, self.path)
+        self.snapshot()
+        return validated
+
+    def subscribe(self, callback: Subscriber) -> Callable[[], None]:
+        """Call ``callback(snapshot)`` on every change; returns an unsubscribe function."""
+
+        with self._lock:
+            self._subscribers.append(callback)
+            if self._snapshot is None:
+                self._refresh()
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def poll(self) -> bool:
+        """Check the file once and notify subscribers; returns whether it changed."""
+
+        snapshot, changed = self._refresh()
+        if changed:
+            self._notify(snapshot)
+        return changed
+
+    def start(self, interval: float = 1.0) -> threading.Thread:
+        """Poll the file every ``interval`` seconds on a daemon thread."""
+
+        if self._thread is not None and self._thread.is_alive():
+            return self._thread
+        self._stop.clear()
+        self._refresh()
+
+        def run() -> None:
+            while not self._stop.wait(interval):
+                self.poll()
+
+        self._thread = threading.Thread(target=run, name="config-watcher", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
 __all__ = [
     "ConfigError",
+    "ConfigService",
+    "ConfigSnapshot",
     "DEFAULT_CONFIG",
     "DEFAULT_CONFIG_PATH",
     "PROVIDERS",
@@ -7,6 +7,7 @@ from typing import Iterable, List
 
 import pandas as pd
 
+from .dtypes import ACCUMULATOR_DTYPE, PolicyLike, get_dtype_policy, infer_dtype_policy
 
 REQUIRED_COLUMNS: List[str] = [
     "open",
@@ -48,19 +49,23 @@ def _normalise_path(path: Path | str) -> Path:
     return resolved
 
 
-def load_price_data(path: Path | str) -> PriceData:
+def load_price_data(path: Path | str, dtype: PolicyLike = "float64") -> PriceData:
     """Load OHLCV data from a CSV file.
 
     The timestamp column is parsed into a timezone-aware datetime index.
-    A :class:`PriceData` instance containing the validated frame is returned.
+    OHLCV columns are parsed directly into the dtypes of the ``dtype`` policy
+    (see :mod:`trading_bot.dtypes`). A :class:`PriceData` instance containing
+    the validated frame is returned.
     """
 
     csv_path = _normalise_path(path)
-    frame = pd.read_csv(csv_path)
+    policy = get_dtype_policy(dtype)
+    header = pd.read_csv(csv_path, nrows=0).columns
     required_with_timestamp = ["timestamp", *REQUIRED_COLUMNS]
-    missing = [column for column in required_with_timestamp if column not in frame.columns]
+    missing = [column for column in required_with_timestamp if column not in header]
     if missing:
         raise DataValidationError(f"CSV file must contain columns: {', '.join(missing)}")
+    frame = pd.read_csv(csv_path, dtype=policy.read_csv_dtypes())
 
     frame["timestamp"] = pd.to_datetime(frame["timestamp"], utc=True)
     frame = frame.set_index("timestamp").sort_index()
@@ -68,11 +73,20 @@ def load_price_data(path: Path | str) -> PriceData:
     return PriceData(frame=frame)
 
 
-def resample_prices(price_data: PriceData, rule: str) -> PriceData:
-    """Resample the OHLCV data using the provided pandas frequency rule."""
+def resample_prices(price_data: PriceData, rule: str, dtype: PolicyLike | None = None) -> PriceData:
+    """Resample the OHLCV data using the provided pandas frequency rule.
 
+    The result is stored in the ``dtype`` policy, defaulting to the policy the
+    input frame already uses. Volume is summed in float64 under compact
+    policies and only cast back afterwards.
+    """
+
+    frame = price_data.frame
+    policy = get_dtype_policy(dtype) if dtype is not None else infer_dtype_policy(frame)
+    if policy.volume is not None:
+        frame = frame.astype({"volume": ACCUMULATOR_DTYPE}, copy=False)
     ohlc_dict = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
-    resampled = price_data.frame.resample(rule).apply(ohlc_dict).dropna()
+    resampled = policy.cast_frame(frame.resample(rule).apply(ohlc_dict).dropna())
     resampled.index.name = "timestamp"
     return PriceData(frame=resampled)
 
@@ -0,0 +1,151 @@
+"""Dtype policies controlling how prices, volumes and indicators are stored.
+
+The default ``float64`` policy keeps pandas' native dtypes. The ``float32``
+policy halves the memory of OHLCV frames and indicator series, which matters
+for wide or long backtests where float32's ~7 significant digits are plenty.
+Accumulators (rolling sums inside pandas, volume sums when resampling,
+portfolio cash) always stay float64 so rounding error does not compound.
+
+Drift bounds checked by ``tests/test_dtypes.py``: stored prices and volumes
+differ from float64 by at most one float32 rounding (relative 2**-24, about
+6e-8), and a moving-average signal only flips where the two averages agree
+to within about 1e-6 relative.
+
+Run ``make bench-dtypes`` to compare memory and speed of both policies.
+numpy and pandas are only imported by the benchmark, so the CLI can offer the
+policy names without loading them.
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+ACCUMULATOR_DTYPE = "float64"
+PRICE_COLUMNS: List[str] = ["open", "high", "low", "close"]
+
+
+@dataclass(frozen=True)
+class DtypePolicy:
+    """Storage dtypes for price columns, volume and position signals.
+
+    ``volume=None`` keeps whatever dtype the CSV parser produced (int64 for
+    whole-number volumes). float32 volumes are exact up to 2**24.
+    """
+
+    name: str
+    price: str
+    volume: Optional[str]
+    signal: str
+
+    def read_csv_dtypes(self) -> Dict[str, str]:
+        dtypes = {column: self.price for column in PRICE_COLUMNS}
+        if self.volume is not None:
+            dtypes["volume"] = self.volume
+        return dtypes
+
+    def cast_frame(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Return ``frame`` with OHLCV columns stored in this policy's dtypes."""
+
+        dtypes = {column: dtype for column, dtype in self.read_csv_dtypes().items() if column in frame.columns}
+        if all(frame[column].dtype == dtype for column, dtype in dtypes.items()):
+            return frame
+        return frame.astype(dtypes, copy=False)
+
+    def cast(self, series: pd.Series) -> pd.Series:
+        """Store an indicator series in the policy's price dtype."""
+
+        return series.astype(self.price, copy=False)
+
+
+FLOAT64 = DtypePolicy(name="float64", price="float64", volume=None, signal="int64")
+FLOAT32 = DtypePolicy(name="float32", price="float32", volume="float32", signal="int8")
+DTYPE_POLICIES: Dict[str, DtypePolicy] = {policy.name: policy for policy in (FLOAT64, FLOAT32)}
+
+PolicyLike = Union[str, DtypePolicy]
+
+
+def get_dtype_policy(policy: PolicyLike) -> DtypePolicy:
+    if isinstance(policy, DtypePolicy):
+        return policy
+    try:
+        return DTYPE_POLICIES[policy]
+    except KeyError:
+        known = ", ".join(sorted(DTYPE_POLICIES))
+        raise ValueError(f"Unknown dtype policy '{policy}'. Known policies: {known}") from None
+
+
+def infer_dtype_policy(frame: pd.DataFrame) -> DtypePolicy:
+    """Return the policy matching the dtype of ``frame['close']``."""
+
+    return FLOAT32 if frame["close"].dtype == "float32" else FLOAT64
+
+
+def _synthetic_csv(path: Path, rows: int, seed: int = 0) -> None:
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    close = 1800 * np.exp(rng.normal(0, 0.001, rows).cumsum())
+    frame = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2015-01-01", periods=rows, freq="min", tz="UTC"),
+            "open": close,
+            "high": close * 1.0005,
+            "low": close * 0.9995,
+            "close": close,
+            "volume": rng.integers(1, 10_000, rows),
+        }
+    )
+    frame.to_csv(path, index=False, date_format="%Y-%m-%dT%H:%M:%SZ")
+
+
+def benchmark(rows: int = 200_000, short_window: int = 10, long_window: int = 30) -> Dict[str, Dict[str, float]]:
+    """Time and size the load -> resample -> signal pipeline under each policy."""
+
+    from .data import load_price_data, resample_prices
+    from .strategy import MovingAverageCrossStrategy
+
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory(prefix="dtype-bench-") as workdir:
+        path = Path(workdir) / "prices.csv"
+        _synthetic_csv(path, rows)
+        for name in DTYPE_POLICIES:
+            started = time.perf_counter()
+            data = load_price_data(path, dtype=name)
+            loaded = time.perf_counter()
+            resampled = resample_prices(data, "5min")
+            resampled_at = time.perf_counter()
+            strategy = MovingAverageCrossStrategy(short_window=short_window, long_window=long_window, dtype=name)
+            actions = strategy.generate_trading_actions(data.frame["close"])
+            finished = time.perf_counter()
+            results[name] = {
+                "frame_bytes": float(data.frame.memory_usage(index=True, deep=True).sum()),
+                "resampled_bytes": float(resampled.frame.memory_usage(index=True, deep=True).sum()),
+                "actions_bytes": float(actions.memory_usage(index=False)),
+                "load_seconds": loaded - started,
+                "resample_seconds": resampled_at - loaded,
+                "signal_seconds": finished - resampled_at,
+            }
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Dict[str, float]]:
+    parser = argparse.ArgumentParser(description="Compare memory and speed of the dtype policies")
+    parser.add_argument("--rows", type=int, default=200_000, help="Number of synthetic one-minute bars")
+    args = parser.parse_args(argv)
+
+    results = benchmark(rows=args.rows)
+    print(f"{'policy':<9}{'frame MB':>10}{'actions MB':>12}{'load s':>9}{'resample s':>12}{'signal s':>10}")
+    for name, stats in results.items():
+        print(
+            f"{name:<9}{stats['frame_bytes'] / 1e6:>10.2f}{stats['actions_bytes'] / 1e6:>12.2f}"
+            f"{stats['load_seconds']:>9.3f}{stats['resample_seconds']:>12.3f}{stats['signal_seconds']:>10.3f}"
+        )
+    return results
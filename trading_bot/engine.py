@@ -0,0 +1,153 @@
+"""Event-driven, bar-by-bar execution engine shared by backtests and paper runs."""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import AsyncIterable, Callable, Deque, Iterable, Iterator, List, Optional, Protocol, Union, runtime_checkable
+
+import pandas as pd
+
+from .data import PriceData
+from .portfolio import Portfolio, Trade
+
+
+@dataclass(frozen=True)
+class Bar:
+    """A single OHLCV bar delivered to the engine."""
+
+    timestamp: pd.Timestamp
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float = 0.0
+
+
+@runtime_checkable
+class BarStrategy(Protocol):
+    """Strategies that update their state incrementally on every bar."""
+
+    def on_bar(self, bar: Bar) -> int:
+        ...
+
+
+class VectorizedStrategy(Protocol):
+    def generate_trading_actions(self, prices: pd.Series) -> pd.Series:
+        ...
+
+
+def iter_bars(price_data: PriceData) -> Iterator[Bar]:
+    """Yield :class:`Bar` events from a validated price frame."""
+
+    frame = price_data.frame
+    columns = [frame[column].to_numpy() for column in ("open", "high", "low", "close", "volume")]
+    for timestamp, open_, high, low, close, volume in zip(frame.index, *columns):
+        yield Bar(
+            timestamp=timestamp,
+            open=float(open_),
+            high=float(high),
+            low=float(low),
+            close=float(close),
+            volume=float(volume),
+        )
+
+
+@dataclass
+class PrecomputedActions:
+    """Fast-path adapter replaying actions from a vectorized strategy.
+
+    The strategy runs once over the full closing-price series and ``on_bar``
+    becomes a lookup, so strategies without per-bar logic keep their
+    vectorized speed while sharing the event engine's execution path.
+    """
+
+    actions: pd.Series
+    _lookup: dict = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._lookup = dict(zip(self.actions.index, self.actions.to_numpy()))
+
+    @classmethod
+    def from_strategy(cls, strategy: VectorizedStrategy, price_data: PriceData) -> "PrecomputedActions":
+        return cls(actions=strategy.generate_trading_actions(price_data.frame["close"]))
+
+    def on_bar(self, bar: Bar) -> int:
+        return int(self._lookup.get(bar.timestamp, 0))
+
+
+BarSource = Union[Iterable[Bar], AsyncIterable[Bar], PriceData]
+
+
+@dataclass
+class EventEngine:
+    """Feed bars one at a time through a strategy and execute fills per event.
+
+    The same :meth:`process_bar` path serves historical replays (any iterable
+    of bars or a :class:`PriceData`) and paper feeds (async iterables), so a
+    backtest and a paper session of the same strategy produce identical fills.
+    Only the last ``equity_history`` equity points are kept, so a long-running
+    feed does not grow without bound; pass ``None`` to keep the whole curve.
+    """
+
+    strategy: Union[BarStrategy, VectorizedStrategy]
+    portfolio: Portfolio
+    on_fill: Optional[Callable[[Trade], None]] = None
+    equity_history: Optional[int] = 10_000
+    bars_processed: int = field(default=0, init=False)
+    last_price: Optional[float] = field(default=None, init=False)
+    _equity: Deque[float] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._equity = deque(maxlen=self.equity_history)
+
+    def _resolve_strategy(self, source: BarSource) -> BarStrategy:
+        if isinstance(self.strategy, BarStrategy):
+            return self.strategy
+        if isinstance(source, PriceData):
+            return PrecomputedActions.from_strategy(self.strategy, source)
+        incremental = getattr(self.strategy, "incremental", None)
+        if incremental is not None:
+            return incremental()
+        raise TypeError("Streaming sources require a strategy that implements on_bar()")
+
+    def process_bar(self, strategy: BarStrategy, bar: Bar) -> Optional[Trade]:
+        """Advance the strategy by one bar and execute any resulting fill."""
+
+        action = strategy.on_bar(bar)
+        trade = self.portfolio.apply_action(bar.timestamp, action, bar.close)
+        self.bars_processed += 1
+        self.last_price = bar.close
+        self._equity.append(self.portfolio.cash + self.portfolio.position * bar.close)
+        if trade is not None and self.on_fill is not None:
+            self.on_fill(trade)
+        return trade
+
+    def run(self, source: Union[Iterable[Bar], PriceData]) -> dict:
+        """Consume a synchronous bar source and return the portfolio summary."""
+
+        strategy = self._resolve_strategy(source)
+        bars = iter_bars(source) if isinstance(source, PriceData) else source
+        for bar in bars:
+            self.process_bar(strategy, bar)
+        return self.summary()
+
+    async def run_async(self, source: AsyncIterable[Bar]) -> dict:
+        """Consume an asynchronous bar feed (e.g. a paper-trading stream)."""
+
+        strategy = self._resolve_strategy(source)
+        async for bar in source:
+            self.process_bar(strategy, bar)
+        return self.summary()
+
+    def equity_curve(self) -> List[float]:
+        """Return marked-to-market equity after each of the last ``equity_history`` bars."""
+
+        return list(self._equity)
+
+    def summary(self) -> dict:
+        summary = self.portfolio.summary()
+        summary["bars_processed"] = self.bars_processed
+        return summary
+
+
+__all__ = ["Bar", "BarStrategy", "EventEngine", "PrecomputedActions", "iter_bars"]
@@ -12,9 +12,7 @@ from trading_bot.config import (
     DEFAULT_CONFIG_PATH,
     PROVIDERS,
     ConfigError,
-    load_config,
-    save_config,
-    validate_config,
+    ConfigService,
 )
 
 
@@ -29,10 +27,12 @@ def create_app(config_path: Path | None = None) -> Flask:
     resolved_path = Path(
         config_path or os.environ.get("TRADING_BOT_CONFIG", DEFAULT_CONFIG_PATH)
     ).expanduser()
+    service = ConfigService(resolved_path)
+    app.extensions["trading_bot_config"] = service
 
     @app.route("/", methods=["GET", "POST"])
     def config_screen() -> str:
-        current_config: Dict[str, Any] = load_config(resolved_path)
+        current_config: Dict[str, Any] = service.snapshot().config
 
         if request.method == "POST":
             risk_raw = request.form.get("risk_per_trade", "").strip()
@@ -57,7 +57,7 @@ def create_app(config_path: Path | None = None) -> Flask:
                 submitted["trade_settings"]["risk_per_trade"] = float(
                     submitted["trade_settings"].get("risk_per_trade", 0)
                 )
-                validated = validate_config(submitted)
+                validated = service.save(submitted)
             except ValueError:
                 flash("Risk per trade must be a numeric value between 0 and 1.", "error")
                 current_config = submitted
@@ -65,7 +65,6 @@ def create_app(config_path: Path | None = None) -> Flask:
                 flash(str(exc), "error")
                 current_config = submitted
             else:
-                save_config(validated, resolved_path)
                 flash("Configuration saved successfully.", "success")
                 current_config = validated
 
@@ -0,0 +1,142 @@
+"""Import-time budget for CLI startup and worker processes.
+
+Each scenario runs a fresh interpreter under ``python -X importtime`` and sums
+the cumulative time of its top-level imports. A scenario fails when that total
+exceeds its budget or when it imports a module it should leave to the
+commands that need it (pandas for ``main.py --help``).
+
+Run ``make bench-imports``; the command exits non-zero when a budget is blown.
+"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    args: Tuple[str, ...]
+    budget_ms: float
+    forbidden: Tuple[str, ...] = ()
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("cli_help", ("main.py", "--help"), budget_ms=150.0, forbidden=("pandas", "numpy")),
+        Scenario("config", ("-c", "import trading_bot.config"), budget_ms=150.0, forbidden=("pandas", "numpy")),
+        # What a spawned ProcessPoolExecutor worker imports before its first batch job.
+        Scenario(
+            "batch_worker",
+            ("-c", "import concurrent.futures.process, trading_bot.batch"),
+            budget_ms=1000.0,
+            forbidden=("trading_bot.engine", "trading_bot.ticks", "trading_bot.providers"),
+        ),
+    )
+}
+
+
+@dataclass
+class ImportProfile:
+    """Cumulative import time per module, in milliseconds."""
+
+    modules: Dict[str, float] = field(default_factory=dict)
+    roots: List[str] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(self.modules[name] for name in self.roots)
+
+    def slowest(self, count: int = 5) -> List[Tuple[str, float]]:
+        return sorted(((name, self.modules[name]) for name in self.roots), key=lambda item: -item[1])[:count]
+
+
+def parse_importtime(stderr: str) -> ImportProfile:
+    """Parse ``-X importtime`` output (``import time: self | cumulative | name`` lines)."""
+
+    profile = ImportProfile()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue
+        module = name.strip()
+        profile.modules[module] = int(cumulative) / 1000
+        if not name[1:].startswith(" "):
+            profile.roots.append(module)
+    return profile
+
+
+def profile_imports(args: Sequence[str], cwd: Path = ROOT) -> ImportProfile:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *args], cwd=cwd, capture_output=True, text=True, check=True
+    )
+    return parse_importtime(completed.stderr)
+
+
+def check(scenario: Scenario, profile: ImportProfile) -> List[str]:
+    """Return the budget violations of ``profile``; empty when within budget."""
+
+    problems = [
+        f"{scenario.name} imports {module}"
+        for module in scenario.forbidden
+        if module in profile.modules
+    ]
+    if profile.total_ms > scenario.budget_ms:
+        problems.append(f"{scenario.name} took {profile.total_ms:.1f} ms, budget {scenario.budget_ms:.0f} ms")
+    return problems
+
+
+def benchmark(scenarios: Sequence[Scenario] = tuple(SCENARIOS.values()), repeat: int = 3) -> Dict[str, ImportProfile]:
+    """Fastest of ``repeat`` runs per scenario, to keep disk-cache noise out of the budget."""
+
+    return {
+        scenario.name: min((profile_imports(scenario.args) for _ in range(repeat)), key=lambda p: p.total_ms)
+        for scenario in scenarios
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, ImportProfile]:
+    parser = argparse.ArgumentParser(description="Check import time of CLI startup against a budget")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario (the fastest counts)")
+    parser.add_argument(
+        "--budget",
+        action="append",
+        default=[],
+        metavar="NAME=MS",
+        help=f"Override a scenario budget (scenarios: {', '.join(SCENARIOS)})",
+    )
+    args = parser.parse_args(argv)
+
+    scenarios = dict(SCENARIOS)
+    for override in args.budget:
+        name, _, value = override.partition("=")
+        if name not in scenarios:
+            parser.error(f"unknown scenario '{name}'")
+        scenarios[name] = Scenario(name, scenarios[name].args, float(value), scenarios[name].forbidden)
+
+    results = benchmark(tuple(scenarios.values()), repeat=args.repeat)
+    problems: List[str] = []
+    print(f"{'scenario':<14}{'import ms':>11}{'budget ms':>11}  slowest")
+    for name, profile in results.items():
+        scenario = scenarios[name]
+        slowest = ", ".join(f"{module} {ms:.0f}" for module, ms in profile.slowest(3))
+        print(f"{name:<14}{profile.total_ms:>11.1f}{scenario.budget_ms:>11.0f}  {slowest}")
+        problems.extend(check(scenario, profile))
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    if problems:
+        raise SystemExit(1)
+    return results
+
+
+if __name__ == "__main__":
+    main()
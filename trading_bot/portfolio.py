@@ -2,10 +2,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
+from functools import cached_property
+from typing import List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
+from .analytics import DEFAULT_PERIODS_PER_YEAR, PerformanceReport, compute_performance, periods_per_year
+
 
 @dataclass
 class Trade:
@@ -71,11 +75,18 @@ class Portfolio:
             raise ValueError("Prices and actions must share the same index")
 
         for timestamp, action in actions.items():
-            price = float(prices.loc[timestamp])
-            if action > 0 and self.position <= 0:
-                self._execute_trade(timestamp, "BUY", price)
-            elif action < 0 and self.position >= self.unit_size:
-                self._execute_trade(timestamp, "SELL", price)
+            self.apply_action(timestamp, action, float(prices.loc[timestamp]))
+
+    def apply_action(self, timestamp: pd.Timestamp, action: int, price: float) -> Optional[Trade]:
+        """Execute a single action at ``price``, returning the resulting trade if any."""
+
+        if action > 0 and self.position <= 0:
+            self._execute_trade(timestamp, "BUY", price)
+        elif action < 0 and self.position >= self.unit_size:
+            self._execute_trade(timestamp, "SELL", price)
+        else:
+            return None
+        return self.trades[-1]
 
     @property
     def market_value(self) -> float:
@@ -108,3 +119,326 @@ class Portfolio:
             "total_return": total_return,
             "trades": [trade.__dict__ for trade in self.trades],
         }
+
+
+class _SharedCashBook:
+    """Mutable state of a :class:`MultiAssetPortfolio` run plus its trade log.
+
+    Trades are appended to arrays that grow geometrically rather than per fill.
+    """
+
+    def __init__(self, cash: float, width: int, unit_size: float, capacity: int = 1024) -> None:
+        self.cash = cash
+        self.long = np.zeros(width, dtype=bool)
+        self.unit_size = unit_size
+        self.rejected = 0
+        self.size = 0
+        self.rows = np.empty(capacity, dtype=np.int64)
+        self.symbols = np.empty(capacity, dtype=np.int32)
+        self.sides = np.empty(capacity, dtype=np.int8)
+
+    def record(self, rows, symbols: np.ndarray, sides) -> None:
+        end = self.size + symbols.size
+        if end > self.rows.size:
+            capacity = max(end, 2 * self.rows.size)
+            for name in ("rows", "symbols", "sides"):
+                grown = np.empty(capacity, dtype=getattr(self, name).dtype)
+                grown[: self.size] = getattr(self, name)[: self.size]
+                setattr(self, name, grown)
+        self.rows[self.size : end] = rows
+        self.symbols[self.size : end] = symbols
+        self.sides[self.size : end] = sides
+        self.size = end
+
+    def fill_block(self, start: int, prices: np.ndarray, actions: np.ndarray) -> int:
+        """Fill a block of rows assuming every buy is affordable.
+
+        Each symbol's holding is the forward-filled sign of its last action, so
+        fills are the holding transitions. Rows are committed up to the first
+        one where shared cash would go negative; its offset is returned (the
+        block length when every row was affordable).
+        """
+
+        rows, width = actions.shape
+        last = np.where(actions != 0, np.arange(rows)[:, None], -1)
+        np.maximum.accumulate(last, axis=0, out=last)
+        long = np.where(last >= 0, actions[np.maximum(last, 0), np.arange(width)] > 0, self.long)
+        previous = np.vstack([self.long[None, :], long[:-1]])
+        change = long.view(np.int8) - previous.view(np.int8)
+        cash = self.cash - np.cumsum(np.einsum("ij,ij->i", change, np.nan_to_num(prices))) * self.unit_size
+
+        short_of_cash = np.flatnonzero(cash < 0)
+        end = int(short_of_cash[0]) if short_of_cash.size else rows
+        if end:
+            fill_rows, fill_symbols = np.nonzero(change[:end])
+            sides = change[fill_rows, fill_symbols]
+            order = np.lexsort((fill_symbols, sides, fill_rows))
+            self.record(start + fill_rows[order], fill_symbols[order], sides[order])
+            self.long = long[end - 1].copy()
+            self.cash = float(cash[end - 1])
+        return end
+
+    def fill_row(self, row: int, price: np.ndarray, action: np.ndarray) -> None:
+        """Fill one row exactly: sells settle, then buys in column order while cash lasts."""
+
+        sell = np.flatnonzero((action < 0) & self.long)
+        if sell.size:
+            self.cash += float(price[sell].sum()) * self.unit_size
+            self.long[sell] = False
+
+        buy = np.flatnonzero((action > 0) & ~self.long)
+        if buy.size:
+            affordable = np.cumsum(price[buy] * self.unit_size) <= self.cash
+            self.rejected += int(buy.size - affordable.sum())
+            buy = buy[affordable]
+            self.cash -= float(price[buy].sum()) * self.unit_size
+            self.long[buy] = True
+
+        self.record(row, sell, -1)
+        self.record(row, buy, 1)
+
+
+@dataclass
+class MultiAssetResult:
+    """Outcome of a :class:`MultiAssetPortfolio` run.
+
+    Trades are stored as parallel arrays rather than :class:`Trade` objects and
+    positions are never materialised as a full ``time x symbols`` matrix; the
+    equity curves are rebuilt from the trade arrays in row chunks on demand.
+    """
+
+    index: pd.Index
+    symbols: pd.Index
+    prices: np.ndarray
+    starting_cash: float
+    unit_size: float
+    trade_rows: np.ndarray
+    trade_symbols: np.ndarray
+    trade_sides: np.ndarray
+    rejected_buys: int
+    chunk_cells: int = 1 << 16
+
+    @property
+    def trade_prices(self) -> np.ndarray:
+        return self.prices[self.trade_rows, self.trade_symbols].astype(np.float64)
+
+    @property
+    def cash(self) -> float:
+        return self.starting_cash - float(np.sum(self.trade_sides * self.trade_prices)) * self.unit_size
+
+    @property
+    def positions(self) -> pd.Series:
+        units = np.bincount(self.trade_symbols, weights=self.trade_sides, minlength=len(self.symbols))
+        return pd.Series(units * self.unit_size, index=self.symbols)
+
+    def _cash_flows(self) -> np.ndarray:
+        flows = np.zeros(len(self.index))
+        np.add.at(flows, self.trade_rows, -self.trade_sides * self.trade_prices * self.unit_size)
+        return flows
+
+    def _chunks(self):
+        """Yield ``(start, stop, holdings, last_prices)`` per row chunk.
+
+        ``holdings`` is the position per symbol and ``last_prices`` the
+        forward-filled price, so symbols without a quote keep their last mark.
+        """
+
+        rows, width = self.prices.shape
+        position = np.zeros(width)
+        carry = np.full(width, np.nan)
+        step = max(1, self.chunk_cells // max(width, 1))
+        for start in range(0, rows, step):
+            stop = min(start + step, rows)
+            deltas = np.zeros((stop - start, width))
+            in_chunk = slice(*np.searchsorted(self.trade_rows, [start, stop]))
+            np.add.at(
+                deltas,
+                (self.trade_rows[in_chunk] - start, self.trade_symbols[in_chunk]),
+                self.trade_sides[in_chunk] * self.unit_size,
+            )
+            holdings = np.cumsum(deltas, axis=0, out=deltas)
+            holdings += position
+
+            chunk = np.asarray(self.prices[start:stop], dtype=np.float64)
+            valid = ~np.isnan(chunk)
+            source = np.where(valid, np.arange(stop - start)[:, None], -1)
+            np.maximum.accumulate(source, axis=0, out=source)
+            marks = np.where(source >= 0, chunk[np.maximum(source, 0), np.arange(width)], carry)
+
+            yield start, stop, holdings, marks
+            position = holdings[-1].copy()
+            carry = marks[-1].copy()
+
+    def equity(self) -> pd.Series:
+        """Return the aggregate equity curve (shared cash plus all holdings)."""
+
+        cash = self.starting_cash + np.cumsum(self._cash_flows())
+        holdings_value = np.empty(len(self.index))
+        for start, stop, holdings, marks in self._chunks():
+            holdings_value[start:stop] = np.einsum("ij,ij->i", holdings, np.nan_to_num(marks))
+        return pd.Series(cash + holdings_value, index=self.index, name="equity")
+
+    def symbol_equity(self, dtype=np.float64, out: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """Return per-symbol PnL curves (realised cash flow plus marked holdings).
+
+        Pass ``dtype=np.float32`` or a preallocated ``out`` array (for example a
+        ``np.memmap``) to bound memory on very large books. Each row sums to
+        :meth:`equity` minus the starting cash.
+        """
+
+        shape = self.prices.shape
+        result = np.empty(shape, dtype=dtype) if out is None else out
+        if result.shape != shape:
+            raise ValueError(f"out must have shape {shape}")
+        realised = np.zeros(shape[1])
+        fills = self.trade_prices * self.unit_size
+        for start, stop, holdings, marks in self._chunks():
+            flows = np.zeros((stop - start, shape[1]))
+            in_chunk = slice(*np.searchsorted(self.trade_rows, [start, stop]))
+            np.add.at(
+                flows,
+                (self.trade_rows[in_chunk] - start, self.trade_symbols[in_chunk]),
+                -self.trade_sides[in_chunk] * fills[in_chunk],
+            )
+            np.cumsum(flows, axis=0, out=flows)
+            flows += realised
+            realised = flows[-1].copy()
+            result[start:stop] = flows + holdings * np.nan_to_num(marks)
+        return pd.DataFrame(result, index=self.index, columns=self.symbols, copy=False)
+
+    @cached_property
+    def performance(self) -> PerformanceReport:
+        """Analytics for the whole book, computed on first access and cached.
+
+        Each SELL is paired with the same symbol's preceding BUY to form a
+        closed trade; exposure is the share of bars holding any position.
+        """
+
+        fills = self.trade_prices * self.unit_size
+        by_symbol = np.argsort(self.trade_symbols, kind="stable")
+        sells = np.flatnonzero(self.trade_sides[by_symbol] < 0)
+        sells = sells[sells > 0]
+        pnl = fills[by_symbol[sells]] - fills[by_symbol[sells - 1]]
+
+        open_positions = np.zeros(len(self.index))
+        np.add.at(open_positions, self.trade_rows, self.trade_sides)
+        periods = DEFAULT_PERIODS_PER_YEAR
+        if isinstance(self.index, pd.DatetimeIndex):
+            periods = periods_per_year(self.index)
+        return compute_performance(
+            self.equity().to_numpy(),
+            pnl,
+            position=np.cumsum(open_positions),
+            traded_notional=float(fills.sum()),
+            periods=periods,
+        )
+
+    def trades(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "timestamp": self.index[self.trade_rows],
+                "symbol": self.symbols[self.trade_symbols],
+                "action": np.where(self.trade_sides > 0, "BUY", "SELL"),
+                "price": self.trade_prices,
+                "quantity": self.unit_size,
+            }
+        )
+
+    def summary(self) -> dict:
+        equity = self.equity()
+        market_value = float(equity.iloc[-1]) if len(equity) else self.starting_cash
+        return {
+            "starting_cash": self.starting_cash,
+            "ending_cash": self.cash,
+            "positions": self.positions.to_dict(),
+            "market_value": market_value,
+            "total_return": (market_value - self.starting_cash) / self.starting_cash,
+            "trade_count": int(len(self.trade_rows)),
+            "rejected_buys": self.rejected_buys,
+        }
+
+
+@dataclass
+class MultiAssetPortfolio:
+    """A shared-cash book trading many instruments from aligned 2-D matrices.
+
+    Each symbol follows the same rules as :class:`Portfolio` (buy ``unit_size``
+    when flat, sell it when long). At every timestep sells settle first, then
+    buys are filled in column order while the shared cash covers them; buys
+    that no longer fit are skipped and counted in ``rejected_buys``.
+
+    Rows are processed in blocks of about ``chunk_cells`` prices. A block is
+    filled with whole-matrix operations while cash stays non-negative; from
+    the first row that cannot afford its buys to the end of that block, rows
+    are filled one at a time across all symbols.
+    """
+
+    starting_cash: float
+    unit_size: float = 1.0
+    chunk_cells: int = 1 << 16
+
+    def __post_init__(self) -> None:
+        if self.starting_cash <= 0:
+            raise ValueError("Starting cash must be positive")
+        if self.unit_size <= 0:
+            raise ValueError("Unit size must be positive")
+
+    @staticmethod
+    def _align(
+        prices, actions, index: Optional[Sequence] = None, symbols: Optional[Sequence] = None
+    ) -> Tuple[np.ndarray, np.ndarray, pd.Index, pd.Index]:
+        if isinstance(prices, pd.DataFrame):
+            if isinstance(actions, pd.DataFrame) and not (
+                prices.index.equals(actions.index) and prices.columns.equals(actions.columns)
+            ):
+                raise ValueError("Prices and actions must share the same index and columns")
+            index, symbols = prices.index, prices.columns
+            prices = prices.to_numpy()
+        price_matrix = np.asarray(prices)
+        if not np.issubdtype(price_matrix.dtype, np.floating):
+            price_matrix = price_matrix.astype(np.float64)
+        action_matrix = np.sign(np.asarray(actions)).astype(np.int8, copy=False)
+        if price_matrix.ndim != 2 or price_matrix.shape != action_matrix.shape:
+            raise ValueError("Prices and actions must be 2-D matrices of the same shape")
+        rows, width = price_matrix.shape
+        index = pd.Index(index if index is not None else pd.RangeIndex(rows))
+        symbols = pd.Index(symbols if symbols is not None else pd.RangeIndex(width))
+        if len(index) != rows or len(symbols) != width:
+            raise ValueError("index and symbols must match the matrix shape")
+        return price_matrix, action_matrix, index, symbols
+
+    def run(
+        self, prices, actions, index: Optional[Sequence] = None, symbols: Optional[Sequence] = None
+    ) -> MultiAssetResult:
+        """Execute ``actions`` against ``prices`` (both ``time x symbols``).
+
+        Accepts aligned DataFrames, or arrays plus optional ``index``/``symbols``
+        labels. Float32 price matrices are used as-is; cash is accumulated in
+        float64. A NaN price means no quote, so actions on it are ignored.
+        """
+
+        price_matrix, action_matrix, index, symbols = self._align(prices, actions, index, symbols)
+        rows, width = price_matrix.shape
+        book = _SharedCashBook(float(self.starting_cash), width, self.unit_size)
+
+        step = max(1, self.chunk_cells // max(width, 1))
+        for start in range(0, rows, step):
+            stop = min(start + step, rows)
+            block_prices = price_matrix[start:stop].astype(np.float64)
+            block_actions = np.where(np.isnan(block_prices), 0, action_matrix[start:stop]).astype(np.int8)
+            filled = book.fill_block(start, block_prices, block_actions)
+            for offset in range(filled, stop - start):
+                book.fill_row(start + offset, block_prices[offset], block_actions[offset])
+
+        return MultiAssetResult(
+            index=index,
+            symbols=symbols,
+            prices=price_matrix,
+            starting_cash=float(self.starting_cash),
+            unit_size=self.unit_size,
+            trade_rows=book.rows[: book.size],
+            trade_symbols=book.symbols[: book.size],
+            trade_sides=book.sides[: book.size],
+            rejected_buys=book.rejected,
+            chunk_cells=self.chunk_cells,
+        )
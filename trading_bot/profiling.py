@@ -0,0 +1,139 @@
+"""Opt-in profiling helpers for measuring where a bot run spends its time."""
+from __future__ import annotations
+
+import cProfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+
+@dataclass
+class StageTiming:
+    """Resource usage recorded for a single profiled stage."""
+
+    name: str
+    wall_seconds: float
+    cpu_seconds: float
+    peak_memory_bytes: int
+    rows: int = 0
+    calls: int = 1
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.rows <= 0 or self.wall_seconds <= 0:
+            return 0.0
+        return self.rows / self.wall_seconds
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "wall_seconds": self.wall_seconds,
+            "cpu_seconds": self.cpu_seconds,
+            "peak_memory_bytes": self.peak_memory_bytes,
+            "rows": self.rows,
+            "rows_per_second": self.rows_per_second,
+            "calls": self.calls,
+        }
+
+    def merge(self, other: "StageTiming") -> "StageTiming":
+        """Combine two recordings of the same stage: times and rows add up, peak memory is the larger."""
+
+        return StageTiming(
+            name=self.name,
+            wall_seconds=self.wall_seconds + other.wall_seconds,
+            cpu_seconds=self.cpu_seconds + other.cpu_seconds,
+            peak_memory_bytes=max(self.peak_memory_bytes, other.peak_memory_bytes),
+            rows=self.rows + other.rows,
+            calls=self.calls + other.calls,
+        )
+
+
+@dataclass
+class RunProfiler:
+    """Record wall time, CPU time and peak memory for each stage of a run.
+
+    Stages are measured with :func:`time.perf_counter`, :func:`time.process_time`
+    and :mod:`tracemalloc`. When ``pstats_path`` is set, every stage also runs
+    under :mod:`cProfile` and the combined statistics are written on
+    :meth:`dump_stats`.
+    """
+
+    pstats_path: Optional[Path] = None
+    stages: List[StageTiming] = field(default_factory=list)
+    _profiler: Optional[cProfile.Profile] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.pstats_path is not None:
+            self.pstats_path = Path(self.pstats_path).expanduser()
+            self._profiler = cProfile.Profile()
+
+    @contextmanager
+    def stage(self, name: str, rows: int = 0) -> Iterator[None]:
+        """Profile the enclosed block as a named stage."""
+
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        if self._profiler is not None:
+            self._profiler.enable()
+        try:
+            yield
+        finally:
+            if self._profiler is not None:
+                self._profiler.disable()
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            _, peak = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+            self.stages.append(
+                StageTiming(
+                    name=name,
+                    wall_seconds=wall,
+                    cpu_seconds=cpu,
+                    peak_memory_bytes=max(peak - baseline, 0),
+                    rows=rows,
+                )
+            )
+
+    def dump_stats(self) -> Optional[Path]:
+        """Write collected cProfile statistics, returning the output path."""
+
+        if self._profiler is None or self.pstats_path is None:
+            return None
+        self.pstats_path.parent.mkdir(parents=True, exist_ok=True)
+        self._profiler.dump_stats(str(self.pstats_path))
+        return self.pstats_path
+
+    def report(self) -> dict:
+        """Return a JSON-serialisable summary of all recorded stages.
+
+        Stages recorded more than once under the same name (e.g. several runs
+        on one profiler) are combined with :meth:`StageTiming.merge`, so the
+        totals always equal the sum of the reported stages.
+        """
+
+        merged: Dict[str, StageTiming] = {}
+        for stage in self.stages:
+            merged[stage.name] = merged[stage.name].merge(stage) if stage.name in merged else stage
+        total_wall = sum(stage.wall_seconds for stage in merged.values())
+        total_cpu = sum(stage.cpu_seconds for stage in merged.values())
+        rows = max((stage.rows for stage in merged.values()), default=0)
+        return {
+            "stages": {name: stage.as_dict() for name, stage in merged.items()},
+            "total_wall_seconds": total_wall,
+            "total_cpu_seconds": total_cpu,
+            "peak_memory_bytes": max((stage.peak_memory_bytes for stage in self.stages), default=0),
+            "rows": rows,
+            "rows_per_second": rows / total_wall if rows and total_wall > 0 else 0.0,
+            "pstats_path": str(self.pstats_path) if self.pstats_path is not None else None,
+        }
+
+
+__all__ = ["RunProfiler", "StageTiming"]
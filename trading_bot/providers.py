@@ -0,0 +1,396 @@
+"""Async, rate-limit-aware clients for the configured market data vendors."""
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import httpx
+import pandas as pd
+
+from .config import PROVIDERS, ConfigError, ProviderMeta
+from .data import REQUIRED_COLUMNS, PriceData
+
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+class ProviderError(RuntimeError):
+    """Raised when a vendor request fails after all retries."""
+
+
+class TokenBucket:
+    """Asynchronous token bucket enforcing a vendor's request quota.
+
+    ``rate`` tokens are added per second up to ``capacity``; each request
+    consumes one token and waits when the bucket is empty.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = asyncio.sleep,
+    ) -> None:
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("Token bucket rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float, **kwargs: Any) -> "TokenBucket":
+        return cls(rate=requests_per_minute / 60.0, capacity=max(requests_per_minute / 60.0, 1.0), **kwargs)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await self._sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class ConnectionPools:
+    """One persistent :class:`httpx.AsyncClient` per vendor base URL."""
+
+    def __init__(self, max_connections: int = 10, timeout: float = 30.0) -> None:
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def get(self, base_url: str) -> httpx.AsyncClient:
+        base_url = base_url.rstrip("/")
+        client = self._clients.get(base_url)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+            self._clients[base_url] = client
+        return client
+
+    async def aclose(self) -> None:
+        clients, self._clients = list(self._clients.values()), {}
+        await asyncio.gather(*(client.aclose() for client in clients))
+
+
+_INTERVAL_PATTERN = re.compile(r"^(\d+)\s*(min|m|h|d)$")
+_INTERVAL_MINUTES = {"min": 1, "m": 1, "h": 60, "d": 1440}
+
+
+def interval_minutes(interval: str) -> int:
+    """Convert intervals such as ``'60min'``, ``'1h'`` or ``'1d'`` into minutes."""
+
+    match = _INTERVAL_PATTERN.match(interval.strip().lower())
+    if not match:
+        raise ConfigError(f"Unsupported price interval '{interval}'.")
+    amount, unit = match.groups()
+    return int(amount) * _INTERVAL_MINUTES[unit]
+
+
+def _to_price_data(rows: Iterable[Tuple[Any, float, float, float, float, float]]) -> PriceData:
+    frame = pd.DataFrame.from_records(list(rows), columns=["timestamp", *REQUIRED_COLUMNS])
+    frame["timestamp"] = pd.to_datetime(frame["timestamp"], utc=True)
+    frame = frame.set_index("timestamp").sort_index()
+    frame = frame[~frame.index.duplicated(keep="last")].astype("float64")
+    return PriceData(frame=frame)
+
+
+def _utc(moment: datetime) -> pd.Timestamp:
+    stamp = pd.Timestamp(moment)
+    return stamp.tz_localize("UTC") if stamp.tzinfo is None else stamp.tz_convert("UTC")
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+@dataclass
+class ProviderClient(ABC):
+    """Base class for vendor clients sharing pooling, throttling and retries.
+
+    Retry backoff (and the default token bucket) waits through ``sleep``, so
+    callers and tests can substitute a simulated clock.
+    """
+
+    vendor = ""
+
+    credentials: Mapping[str, str]
+    interval: str
+    base_url: Optional[str] = None
+    pools: ConnectionPools = field(default_factory=ConnectionPools)
+    bucket: Optional[TokenBucket] = None
+    max_retries: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    sleep: Callable[[float], Any] = asyncio.sleep
+
+    def __post_init__(self) -> None:
+        if not self.base_url:
+            self.base_url = self.meta.default_base_url
+        if self.bucket is None:
+            self.bucket = TokenBucket.per_minute(self.meta.requests_per_minute, sleep=self.sleep)
+        self.interval_minutes = interval_minutes(self.interval)
+
+    @property
+    def meta(self) -> ProviderMeta:
+        return PROVIDERS[self.vendor]
+
+    def _headers(self) -> Dict[str, str]:
+        return {}
+
+    async def _get(self, path: str, params: Mapping[str, Any]) -> Any:
+        client = self.pools.get(self.base_url)
+        for attempt in range(self.max_retries + 1):
+            await self.bucket.acquire()
+            delay = min(self.backoff * 2**attempt, self.max_backoff)
+            try:
+                response = await client.get(path, params=params, headers=self._headers())
+            except httpx.TransportError as exc:
+                if attempt == self.max_retries:
+                    raise ProviderError(f"{self.vendor} request failed: {exc}") from exc
+            else:
+                if response.status_code not in RETRYABLE_STATUS:
+                    if response.is_error:
+                        raise ProviderError(f"{self.vendor} returned HTTP {response.status_code}: {response.text}")
+                    return response.json()
+                if attempt == self.max_retries:
+                    raise ProviderError(f"{self.vendor} kept throttling after {self.max_retries} retries")
+                retry_after = _retry_after(response)
+                if retry_after is not None:
+                    delay = min(retry_after, self.max_backoff)
+            await self.sleep(delay)
+        raise ProviderError(f"{self.vendor} request failed")  # pragma: no cover - loop always returns or raises
+
+    @abstractmethod
+    async def fetch(self, symbol: str, start: datetime, end: datetime) -> PriceData:
+        """Fetch one contiguous range of bars for ``symbol``."""
+
+        raise NotImplementedError
+
+    def _chunks(self, start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+        span = timedelta(minutes=self.interval_minutes * self.meta.max_bars_per_request)
+        chunks = []
+        cursor = start
+        while cursor < end:
+            chunk_end = min(cursor + span, end)
+            chunks.append((cursor, chunk_end))
+            cursor = chunk_end
+        return chunks or [(start, end)]
+
+    async def fetch_history(self, symbol: str, start: datetime, end: datetime) -> PriceData:
+        """Fetch a long range as parallel per-request chunks and stitch them together."""
+
+        parts = await asyncio.gather(*(self.fetch(symbol, lo, hi) for lo, hi in self._chunks(start, end)))
+        frame = pd.concat([part.frame for part in parts]).sort_index()
+        frame = frame[~frame.index.duplicated(keep="last")]
+        return PriceData(frame=frame)
+
+    async def fetch_many(
+        self, symbols: Sequence[str], start: datetime, end: datetime
+    ) -> Dict[str, PriceData | ProviderError]:
+        """Fetch several symbols concurrently; failures are returned per symbol."""
+
+        results = await asyncio.gather(
+            *(self.fetch_history(symbol, start, end) for symbol in symbols), return_exceptions=True
+        )
+        output: Dict[str, PriceData | ProviderError] = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, BaseException) and not isinstance(result, ProviderError):
+                result = ProviderError(f"{self.vendor} failed for {symbol}: {result}")
+            output[symbol] = result
+        return output
+
+
+def _pair(symbol: str, separator: str) -> str:
+    cleaned = symbol.replace("/", "").replace("_", "").upper()
+    if len(cleaned) == 6:
+        return f"{cleaned[:3]}{separator}{cleaned[3:]}"
+    return symbol
+
+
+class AlphaVantageClient(ProviderClient):
+    vendor = "alpha_vantage"
+
+    def _chunks(self, start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+        # FX_INTRADAY has no range parameters; one request returns the full series.
+        return [(start, end)]
+
+    async def fetch(self, symbol: str, start: datetime, end: datetime) -> PriceData:
+        pair = _pair(symbol, "")
+        payload = await self._get(
+            "/query",
+            {
+                "function": "FX_INTRADAY",
+                "from_symbol": pair[:3],
+                "to_symbol": pair[3:],
+                "interval": f"{self.interval_minutes}min",
+                "outputsize": "full",
+                "apikey": self.credentials.get("api_key", ""),
+            },
+        )
+        key = next((name for name in payload if name.startswith("Time Series")), None)
+        if key is None:
+            raise ProviderError(payload.get("Note") or payload.get("Error Message") or "Unexpected Alpha Vantage payload")
+        rows = [
+            (
+                timestamp,
+                float(values["1. open"]),
+                float(values["2. high"]),
+                float(values["3. low"]),
+                float(values["4. close"]),
+                float(values.get("5. volume", 0.0)),
+            )
+            for timestamp, values in payload[key].items()
+        ]
+        frame = _to_price_data(rows).frame
+        return PriceData(frame=frame[(frame.index >= _utc(start)) & (frame.index <= _utc(end))])
+
+
+class TwelveDataClient(ProviderClient):
+    vendor = "twelve_data"
+
+    def _interval(self) -> str:
+        minutes = self.interval_minutes
+        if minutes % 1440 == 0:
+            return f"{minutes // 1440}day"
+        if minutes % 60 == 0:
+            return f"{minutes // 60}h"
+        return f"{minutes}min"
+
+    async def fetch(self, symbol: str, start: datetime, end: datetime) -> PriceData:
+        payload = await self._get(
+            "/time_series",
+            {
+                "symbol": _pair(symbol, "/"),
+                "interval": self._interval(),
+                "start_date": start.strftime("%Y-%m-%d %H:%M:%S"),
+                "end_date": end.strftime("%Y-%m-%d %H:%M:%S"),
+                "timezone": "UTC",
+                "outputsize": self.meta.max_bars_per_request,
+                "apikey": self.credentials.get("api_key", ""),
+            },
+        )
+        if payload.get("status") == "error":
+            raise ProviderError(payload.get("message", "Twelve Data request failed"))
+        rows = [
+            (
+                item["datetime"],
+                float(item["open"]),
+                float(item["high"]),
+                float(item["low"]),
+                float(item["close"]),
+                float(item.get("volume", 0.0)),
+            )
+            for item in payload.get("values", [])
+        ]
+        return _to_price_data(rows)
+
+
+class OandaClient(ProviderClient):
+    vendor = "oanda"
+
+    def _headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.credentials.get('api_key', '')}"}
+
+    def _granularity(self) -> str:
+        minutes = self.interval_minutes
+        if minutes % 1440 == 0:
+            return "D"
+        if minutes % 60 == 0:
+            return f"H{minutes // 60}"
+        return f"M{minutes}"
+
+    async def fetch(self, symbol: str, start: datetime, end: datetime) -> PriceData:
+        payload = await self._get(
+            f"/v3/instruments/{_pair(symbol, '_')}/candles",
+            {
+                "granularity": self._granularity(),
+                "price": "M",
+                "from": _utc(start).isoformat(),
+                "to": _utc(end).isoformat(),
+            },
+        )
+        rows = [
+            (
+                candle["time"],
+                float(candle["mid"]["o"]),
+                float(candle["mid"]["h"]),
+                float(candle["mid"]["l"]),
+                float(candle["mid"]["c"]),
+                float(candle.get("volume", 0.0)),
+            )
+            for candle in payload.get("candles", [])
+            if candle.get("complete", True)
+        ]
+        return _to_price_data(rows)
+
+
+CLIENTS: Mapping[str, type] = {
+    "alpha_vantage": AlphaVantageClient,
+    "twelve_data": TwelveDataClient,
+    "oanda": OandaClient,
+}
+
+
+def client_from_config(config: Mapping[str, Any], pools: Optional[ConnectionPools] = None) -> ProviderClient:
+    """Build the vendor client described by a validated configuration."""
+
+    provider = config["data_provider"]
+    vendor = provider["vendor"]
+    if vendor not in CLIENTS:
+        raise ConfigError(f"Unknown data provider '{vendor}'.")
+    credentials = {name: provider.get(name, "") for name in ("api_key", "api_secret", "account_id")}
+    return CLIENTS[vendor](
+        credentials=credentials,
+        interval=provider["interval"],
+        base_url=provider.get("base_url"),
+        pools=pools or ConnectionPools(),
+    )
+
+
+__all__ = [
+    "AlphaVantageClient",
+    "ConnectionPools",
+    "OandaClient",
+    "ProviderClient",
+    "ProviderError",
+    "TokenBucket",
+    "TwelveDataClient",
+    "client_from_config",
+    "interval_minutes",
+]
@@ -1,35 +1,217 @@
 """Trading strategy implementations."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional
 
+import numpy as np
 import pandas as pd
 
+from .dtypes import get_dtype_policy
+
 
 @dataclass(frozen=True)
 class MovingAverageCrossStrategy:
-    """Generate trading signals based on a moving-average crossover."""
+    """Generate trading signals based on a moving-average crossover.
+
+    ``dtype`` names a :mod:`trading_bot.dtypes` policy: under ``float32`` the
+    moving averages are stored as float32 (pandas still accumulates the
+    rolling sums in float64) and signals/actions as int8.
+    """
 
     short_window: int = 10
     long_window: int = 30
+    dtype: str = "float64"
 
     def __post_init__(self) -> None:
         if self.short_window <= 0 or self.long_window <= 0:
             raise ValueError("Windows must be positive integers")
         if self.short_window >= self.long_window:
             raise ValueError("Short window must be smaller than long window")
+        get_dtype_policy(self.dtype)
 
     def generate_signals(self, prices: pd.Series) -> pd.Series:
         """Return a series of position signals (1 for long, 0 for flat)."""
 
-        short_ma = prices.rolling(window=self.short_window, min_periods=1).mean()
-        long_ma = prices.rolling(window=self.long_window, min_periods=1).mean()
-        signal = (short_ma > long_ma).astype(int)
+        policy = get_dtype_policy(self.dtype)
+        short_ma = policy.cast(prices.rolling(window=self.short_window, min_periods=1).mean())
+        long_ma = policy.cast(prices.rolling(window=self.long_window, min_periods=1).mean())
+        signal = (short_ma > long_ma).astype(policy.signal)
         return signal
 
     def generate_trading_actions(self, prices: pd.Series) -> pd.Series:
         """Return trading actions (+1 buy, -1 sell, 0 hold)."""
 
         positions = self.generate_signals(prices)
-        actions = positions.diff().fillna(0).astype(int)
+        actions = positions.diff().fillna(0).astype(get_dtype_policy(self.dtype).signal)
         return actions
+
+    def checkpoint_state(self, prices: pd.Series, previous_state: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Return the rolling state needed to continue after the last price.
+
+        ``prices`` are replayed through :class:`IncrementalMovingAverageCross`
+        and its full state is kept: both rolling windows with their running sums
+        and compensation terms, and the last position signal. pandas' rolling
+        sums depend on every price seen so far, so recomputing from the trailing
+        window alone can round differently and flip a crossover; this state
+        reproduces every later action exactly. The strategy parameters are stored
+        alongside. Pass the state a resumed run started from as ``previous_state``.
+        """
+
+        incremental = self._restore(previous_state) if previous_state is not None else self.incremental()
+        for price in prices.to_numpy(dtype=float):
+            incremental.update(price)
+        return {"params": self.params(), **incremental.state()}
+
+    def params(self) -> Dict[str, Any]:
+        """Parameters that determine the signals, as stored in checkpoints."""
+
+        return {"short_window": self.short_window, "long_window": self.long_window, "dtype": self.dtype}
+
+    def resume_trading_actions(self, prices: pd.Series, state: Dict[str, Any]) -> pd.Series:
+        """Return actions for ``prices`` continuing from a :meth:`checkpoint_state`.
+
+        Raises ``ValueError`` when the state was saved under different parameters.
+        """
+
+        incremental = self._restore(state)
+        actions = [incremental.update(price) for price in prices.to_numpy(dtype=float)]
+        return pd.Series(actions, index=prices.index, dtype=get_dtype_policy(self.dtype).signal)
+
+    def _restore(self, state: Dict[str, Any]) -> "IncrementalMovingAverageCross":
+        saved = state.get("params")
+        if saved != self.params():
+            raise ValueError(f"Checkpoint was saved with strategy parameters {saved}, not {self.params()}")
+        incremental = self.incremental()
+        incremental.restore(state)
+        return incremental
+
+    def incremental(self) -> "IncrementalMovingAverageCross":
+        """Return a stateful, bar-by-bar equivalent of this strategy."""
+
+        return IncrementalMovingAverageCross(
+            short_window=self.short_window, long_window=self.long_window, dtype=self.dtype
+        )
+
+
+class _RollingMean:
+    """Rolling mean over the last ``window`` values, bit-for-bit with pandas.
+
+    Mirrors ``rolling(window, min_periods=1).mean()``: Kahan-compensated running
+    sums (separate compensation for added and removed values), and a window of
+    identical values averages to exactly that value. Plain running sums drift,
+    and an exactly rounded mean still differs from pandas in the last bit, which
+    is enough to flip ``short_ma > long_ma`` on flat or repeating stretches.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values: Deque[float] = deque()
+        self.total = 0.0
+        self.add_compensation = 0.0
+        self.remove_compensation = 0.0
+        self.same_run = 0
+        self.negative = 0
+
+    def state(self) -> Dict[str, Any]:
+        return {
+            "values": list(self.values),
+            "total": self.total,
+            "add_compensation": self.add_compensation,
+            "remove_compensation": self.remove_compensation,
+            "same_run": self.same_run,
+            "negative": self.negative,
+        }
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        self.values = deque(float(value) for value in state["values"])
+        self.total = float(state["total"])
+        self.add_compensation = float(state["add_compensation"])
+        self.remove_compensation = float(state["remove_compensation"])
+        self.same_run = int(state["same_run"])
+        self.negative = int(state["negative"])
+
+    def update(self, value: float) -> float:
+        self.values.append(value)
+        if len(self.values) > self.window:
+            removed = self.values.popleft()
+            y = -removed - self.remove_compensation
+            t = self.total + y
+            self.remove_compensation = t - self.total - y
+            self.total = t
+            self.negative -= removed < 0
+        y = value - self.add_compensation
+        t = self.total + y
+        self.add_compensation = t - self.total - y
+        self.total = t
+        self.negative += value < 0
+        self.same_run = self.same_run + 1 if len(self.values) > 1 and self.values[-2] == value else 1
+
+        count = len(self.values)
+        mean = self.total / count
+        if self.same_run >= count:
+            return value
+        if self.negative == 0 and mean < 0 or self.negative == count and mean > 0:
+            return 0.0
+        return mean
+
+
+@dataclass
+class IncrementalMovingAverageCross:
+    """Bar-by-bar moving-average crossover with O(1) state updates.
+
+    Rolling means over the last ``short_window``/``long_window`` closes, computed
+    the way pandas computes them, reproduce
+    :meth:`MovingAverageCrossStrategy.generate_trading_actions` (including the
+    ``min_periods=1`` warm-up behaviour) one bar at a time. Under the ``float32``
+    policy both averages are rounded to float32 before they are compared, as the
+    vectorized strategy stores them.
+    """
+
+    short_window: int = 10
+    long_window: int = 30
+    dtype: str = "float64"
+    _short_mean: _RollingMean = field(init=False, repr=False)
+    _long_mean: _RollingMean = field(init=False, repr=False)
+    _last_signal: int | None = field(default=None, init=False, repr=False)
+    _cast: Any = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        MovingAverageCrossStrategy(short_window=self.short_window, long_window=self.long_window, dtype=self.dtype)
+        self._short_mean = _RollingMean(self.short_window)
+        self._long_mean = _RollingMean(self.long_window)
+        self._cast = np.dtype(get_dtype_policy(self.dtype).price).type
+
+    def update(self, price: float) -> int:
+        """Consume a closing price and return the trading action (+1, -1 or 0)."""
+
+        price = float(price)
+        short_ma = self._short_mean.update(price)
+        long_ma = self._long_mean.update(price)
+        signal = int(self._cast(short_ma) > self._cast(long_ma))
+        previous = self._last_signal
+        self._last_signal = signal
+        if previous is None:
+            return 0
+        return signal - previous
+
+    def state(self) -> Dict[str, Any]:
+        """JSON-serialisable state; :meth:`restore` continues exactly where this left off."""
+
+        return {
+            "short_mean": self._short_mean.state(),
+            "long_mean": self._long_mean.state(),
+            "last_signal": self._last_signal,
+        }
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        self._short_mean.restore(state["short_mean"])
+        self._long_mean.restore(state["long_mean"])
+        last_signal = state["last_signal"]
+        self._last_signal = None if last_signal is None else int(last_signal)
+
+    def on_bar(self, bar) -> int:
+        """Event-engine hook: consume ``bar.close`` and return the action."""
+
+        return self.update(bar.close)
@@ -0,0 +1,246 @@
+"""Streaming tick-to-bar aggregation for tick files too large to load at once.
+
+Ticks (``timestamp, price, size``) are read in chunks and folded into time,
+volume or tick-count bars with NumPy ``reduceat`` passes. Only the bar that is
+still open at the end of a chunk is carried over, so memory stays bounded by
+the chunk size however long the file is.
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .data import PriceData
+from .dtypes import PolicyLike, get_dtype_policy
+
+TICK_COLUMNS: List[str] = ["timestamp", "price", "size"]
+BAR_COLUMNS: List[str] = ["open", "high", "low", "close", "volume", "ticks"]
+BAR_MODES = ("time", "volume", "ticks")
+
+
+def read_tick_chunks(
+    path: Path | str, chunksize: int = 1_000_000, timestamp_unit: str = "ns"
+) -> Iterator[pd.DataFrame]:
+    """Yield tick chunks with a UTC ``timestamp`` column, ``price`` and ``size``.
+
+    Timestamps may be ISO-8601 strings or integer epochs in ``timestamp_unit``;
+    epochs skip string parsing, which dominates end-to-end throughput.
+    """
+
+    reader = pd.read_csv(
+        Path(path).expanduser(),
+        usecols=TICK_COLUMNS,
+        dtype={"price": "float64", "size": "float64"},
+        chunksize=chunksize,
+    )
+    for chunk in reader:
+        if pd.api.types.is_numeric_dtype(chunk["timestamp"]):
+            chunk["timestamp"] = pd.to_datetime(chunk["timestamp"], utc=True, unit=timestamp_unit)
+        else:
+            chunk["timestamp"] = pd.to_datetime(chunk["timestamp"], utc=True, format="ISO8601")
+        yield chunk
+
+
+@dataclass
+class BarAggregator:
+    """Fold sorted tick chunks into OHLCV bars incrementally.
+
+    ``mode`` selects the bar type: ``"time"`` buckets ticks by the fixed pandas
+    frequency ``rule`` aligned to the Unix epoch (bars are labelled with the
+    bucket start, like :func:`~trading_bot.data.resample_prices`); ``"volume"``
+    closes a bar on the tick that carries cumulative size across the next
+    multiple of ``threshold`` (any overshoot counts towards the next bar);
+    ``"ticks"`` closes a bar every ``threshold`` ticks. Volume and tick bars
+    are labelled with their first tick's timestamp.
+    """
+
+    mode: str = "time"
+    rule: str = "1min"
+    threshold: float = 0.0
+    dtype: PolicyLike = "float64"
+    _carry: Optional[Dict[str, np.ndarray]] = field(default=None, init=False, repr=False)
+    _cumulative: float = field(default=0.0, init=False, repr=False)
+    _ticks_seen: int = field(default=0, init=False, repr=False)
+    _last_timestamp: int = field(default=np.iinfo(np.int64).min, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.mode not in BAR_MODES:
+            raise ValueError(f"Unknown bar mode '{self.mode}'. Known modes: {', '.join(BAR_MODES)}")
+        if self.mode != "time" and self.threshold <= 0:
+            raise ValueError("Volume and tick bars need a positive threshold")
+        if self.mode == "time":
+            self._bucket_ns = pd.Timedelta(pd.tseries.frequencies.to_offset(self.rule)).value
+        self.dtype = get_dtype_policy(self.dtype)
+
+    def _keys(self, timestamps: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+        if self.mode == "time":
+            return timestamps // self._bucket_ns
+        if self.mode == "volume":
+            before = self._cumulative + np.cumsum(sizes) - sizes
+            return np.floor(before / self.threshold).astype(np.int64)
+        return (self._ticks_seen + np.arange(timestamps.size)) // int(self.threshold)
+
+    def update(self, ticks: pd.DataFrame) -> pd.DataFrame:
+        """Consume one chunk of ticks and return the bars it completed."""
+
+        if ticks.empty:
+            return self._frame(None)
+        timestamps = pd.DatetimeIndex(ticks["timestamp"]).asi8
+        prices = ticks["price"].to_numpy(dtype=np.float64)
+        sizes = ticks["size"].to_numpy(dtype=np.float64)
+        if timestamps[0] < self._last_timestamp or np.any(np.diff(timestamps) < 0):
+            raise ValueError("Ticks must be sorted by timestamp")
+
+        keys = self._keys(timestamps, sizes)
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        ends = np.r_[starts[1:], keys.size]
+        bars = {
+            "key": keys[starts],
+            "timestamp": keys[starts] * self._bucket_ns if self.mode == "time" else timestamps[starts],
+            "open": prices[starts],
+            "high": np.maximum.reduceat(prices, starts),
+            "low": np.minimum.reduceat(prices, starts),
+            "close": prices[ends - 1],
+            "volume": np.add.reduceat(sizes, starts),
+            "ticks": ends - starts,
+        }
+        self._cumulative += float(sizes.sum())
+        self._ticks_seen += int(keys.size)
+        self._last_timestamp = int(timestamps[-1])
+
+        carry = self._carry
+        if carry is not None and carry["key"][0] == bars["key"][0]:
+            bars["timestamp"][0] = carry["timestamp"][0]
+            bars["open"][0] = carry["open"][0]
+            bars["high"][0] = max(bars["high"][0], carry["high"][0])
+            bars["low"][0] = min(bars["low"][0], carry["low"][0])
+            bars["volume"][0] += carry["volume"][0]
+            bars["ticks"][0] += carry["ticks"][0]
+            carry = None
+
+        self._carry = {name: values[-1:].copy() for name, values in bars.items()}
+        completed = {name: values[:-1] for name, values in bars.items()}
+        if carry is not None:
+            completed = {name: np.concatenate([carry[name], completed[name]]) for name in completed}
+        return self._frame(completed)
+
+    def flush(self) -> pd.DataFrame:
+        """Return the still-open final bar (if any) and reset the carry."""
+
+        carry, self._carry = self._carry, None
+        return self._frame(carry)
+
+    def _frame(self, bars: Optional[Dict[str, np.ndarray]]) -> pd.DataFrame:
+        if bars is None:
+            bars = {name: np.empty(0) for name in ["timestamp", *BAR_COLUMNS]}
+            bars["timestamp"] = np.empty(0, dtype=np.int64)
+        index = pd.DatetimeIndex(pd.to_datetime(bars["timestamp"], utc=True), name="timestamp")
+        frame = pd.DataFrame({name: bars[name] for name in BAR_COLUMNS}, index=index)
+        frame["ticks"] = frame["ticks"].astype(np.int64)
+        return self.dtype.cast_frame(frame)
+
+
+def aggregate_ticks(chunks: Iterable[pd.DataFrame], aggregator: BarAggregator) -> Iterator[pd.DataFrame]:
+    """Yield completed bars per chunk, then the final partial bar."""
+
+    for chunk in chunks:
+        bars = aggregator.update(chunk)
+        if not bars.empty:
+            yield bars
+    tail = aggregator.flush()
+    if not tail.empty:
+        yield tail
+
+
+def ticks_to_price_data(
+    path: Path | str, aggregator: BarAggregator, chunksize: int = 1_000_000
+) -> PriceData:
+    """Aggregate a tick file into a validated :class:`PriceData` of bars."""
+
+    frames = list(aggregate_ticks(read_tick_chunks(path, chunksize), aggregator))
+    if not frames:
+        raise ValueError(f"No ticks found in {path}")
+    return PriceData(frame=pd.concat(frames))
+
+
+def append_bars(frame: pd.DataFrame, path: Path | str) -> None:
+    """Append bars to an OHLCV CSV in the format :func:`load_price_data` reads."""
+
+    path = Path(path).expanduser()
+    frame.to_csv(
+        path,
+        mode="a",
+        header=not path.exists() or path.stat().st_size == 0,
+        date_format="%Y-%m-%dT%H:%M:%S.%fZ",
+    )
+
+
+def write_bars(
+    ticks_path: Path | str, bars_path: Path | str, aggregator: BarAggregator, chunksize: int = 1_000_000
+) -> int:
+    """Stream a tick file into an OHLCV CSV, returning the number of bars written."""
+
+    written = 0
+    for bars in aggregate_ticks(read_tick_chunks(ticks_path, chunksize), aggregator):
+        append_bars(bars, bars_path)
+        written += len(bars)
+    return written
+
+
+def synthetic_ticks(rows: int, seed: int = 0, start: str = "2024-01-01") -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    gaps = rng.exponential(0.25, rows)
+    return pd.DataFrame(
+        {
+            "timestamp": pd.Timestamp(start, tz="UTC") + pd.to_timedelta(np.cumsum(gaps), unit="s"),
+            "price": 1800 * np.exp(rng.normal(0, 2e-5, rows).cumsum()),
+            "size": rng.integers(1, 50, rows).astype(float),
+        }
+    )
+
+
+def benchmark(rows: int = 2_000_000, chunksize: int = 500_000) -> Dict[str, float]:
+    """Measure ticks/second for file -> 1-minute bars and for aggregation alone."""
+
+    ticks = synthetic_ticks(rows)
+    stats: Dict[str, float] = {"ticks": float(rows)}
+    with tempfile.TemporaryDirectory(prefix="tick-bench-") as workdir:
+        files = {
+            "iso": (Path(workdir) / "ticks_iso.csv", ticks),
+            "epoch": (Path(workdir) / "ticks_epoch.csv", ticks.assign(timestamp=ticks["timestamp"].astype("int64"))),
+        }
+        for name, (path, frame) in files.items():
+            frame.to_csv(path, index=False, date_format="%Y-%m-%dT%H:%M:%S.%fZ")
+            started = time.perf_counter()
+            stats["bars"] = float(write_bars(path, Path(workdir) / f"bars_{name}.csv", BarAggregator(), chunksize))
+            stats[f"{name}_file_ticks_per_second"] = rows / (time.perf_counter() - started)
+
+    chunks = [ticks.iloc[start : start + chunksize] for start in range(0, rows, chunksize)]
+    started = time.perf_counter()
+    for _ in aggregate_ticks(chunks, BarAggregator()):
+        pass
+    stats["aggregate_ticks_per_second"] = rows / (time.perf_counter() - started)
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, float]:
+    parser = argparse.ArgumentParser(description="Benchmark tick-to-bar aggregation throughput")
+    parser.add_argument("--rows", type=int, default=2_000_000, help="Number of synthetic ticks")
+    parser.add_argument("--chunksize", type=int, default=500_000, help="Ticks per chunk")
+    args = parser.parse_args(argv)
+
+    stats = benchmark(rows=args.rows, chunksize=args.chunksize)
+    for key, value in stats.items():
+        print(f"{key:<32}{value:>16,.0f}")
+    # Aggregating in-memory chunks skips CSV parsing, so it must outpace the file path.
+    if stats["aggregate_ticks_per_second"] <= stats["epoch_file_ticks_per_second"]:
+        print("FAIL: aggregation alone is not faster than reading epoch-timestamp files")
+        raise SystemExit(1)
+    return stats